@@ -110,6 +110,7 @@ async def lifespan(app: FastAPI):
         await asyncio.wait_for(engine_task, timeout=5.0)
     except asyncio.TimeoutError:
         logger.warning("Engine task did not complete in time")
+    await tool_registry.close()
     logger.info("Alpha API Server shut down")
 
 
@@ -14,6 +14,27 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Reads a table's header and cell texts in the page, in a single round-trip.
+# Mirrors the per-element queries: headers from thead (else the first row),
+# data rows are rows without <th> cells.
+_TABLE_EXTRACT_JS = """
+table => {
+    const text = el => el.innerText.trim();
+    let headers = Array.from(table.querySelectorAll('thead th, thead td'), text);
+    if (!headers.length) {
+        const firstRow = table.querySelector('tr:first-child');
+        if (firstRow) headers = Array.from(firstRow.querySelectorAll('th, td'), text);
+    }
+    const rows = [];
+    for (const row of table.querySelectorAll('tbody tr, tr')) {
+        if (row.querySelector('th')) continue;
+        const cells = Array.from(row.querySelectorAll('td'), text);
+        if (cells.length) rows.push(cells);
+    }
+    return {headers, rows};
+}
+"""
+
 
 @dataclass
 class ActionResult:
@@ -89,6 +110,8 @@ class ActionExecutor:
         self.default_timeout = self.action_config.get("timeout", 30) * 1000  # Convert to ms
         self.screenshot_on_error = self.action_config.get("screenshot_on_error", True)
         self.validate_before_action = self.action_config.get("validate_before_action", True)
+        # Max selectors queried at once by extract_data
+        self.extract_concurrency = self.action_config.get("extract_concurrency", 16)
 
         logger.info("ActionExecutor initialized")
 
@@ -712,21 +735,27 @@ class ActionExecutor:
             page = self.page_navigator.page
             extracted_data = {}
             missing_fields = []
-
-            # Extract each field
-            for field_name, selector in selectors.items():
-                try:
-                    element = await self._find_element(page, selector, timeout or self.default_timeout)
-                    if element:
-                        text = await element.inner_text()
-                        extracted_data[field_name] = text
-                    else:
-                        missing_fields.append(field_name)
-                        extracted_data[field_name] = None
-                except Exception as e:
-                    logger.warning(f"Failed to extract field '{field_name}': {e}")
+            semaphore = asyncio.Semaphore(self.extract_concurrency)
+
+            async def extract_field(field_name: str, selector: str) -> Optional[str]:
+                async with semaphore:
+                    try:
+                        element = await self._find_element(page, selector, timeout or self.default_timeout)
+                        return await element.inner_text() if element else None
+                    except Exception as e:
+                        logger.warning(f"Failed to extract field '{field_name}': {e}")
+                        return None
+
+            # Query all fields concurrently so the page round-trips overlap
+            texts = await asyncio.gather(*(
+                extract_field(field_name, selector)
+                for field_name, selector in selectors.items()
+            ))
+
+            for field_name, text in zip(selectors, texts):
+                extracted_data[field_name] = text
+                if text is None:
                     missing_fields.append(field_name)
-                    extracted_data[field_name] = None
 
             execution_time = time.time() - start_time
             logger.info(
@@ -801,40 +830,15 @@ class ActionExecutor:
             if not table:
                 raise RuntimeError(f"Table element not found: {selector}")
 
-            # Extract headers
-            headers = []
-            header_elements = await table.query_selector_all("thead th, thead td")
-            for header in header_elements:
-                text = await header.inner_text()
-                headers.append(text.strip())
-
-            # If no headers in thead, try first row
-            if not headers:
-                first_row = await table.query_selector("tr:first-child")
-                if first_row:
-                    cells = await first_row.query_selector_all("th, td")
-                    for cell in cells:
-                        text = await cell.inner_text()
-                        headers.append(text.strip())
-
-            # Extract rows
-            rows = []
-            row_elements = await table.query_selector_all("tbody tr, tr")
-
-            for row_element in row_elements:
-                # Skip header rows
-                if await row_element.query_selector("th"):
-                    continue
-
-                cells = await row_element.query_selector_all("td")
-                if cells:
-                    row_data = {}
-                    for i, cell in enumerate(cells):
-                        text = await cell.inner_text()
-                        # Use header name if available, otherwise use index
-                        key = headers[i] if i < len(headers) else f"column_{i}"
-                        row_data[key] = text.strip()
-                    rows.append(row_data)
+            # Extract headers and cell texts in the page
+            table_data = await table.evaluate(_TABLE_EXTRACT_JS)
+            headers = table_data["headers"]
+
+            # Use header name if available, otherwise use index
+            keys = headers + [f"column_{i}" for i in range(
+                len(headers), max((len(cells) for cells in table_data["rows"]), default=0)
+            )]
+            rows = [dict(zip(keys, cells)) for cells in table_data["rows"]]
 
             execution_time = time.time() - start_time
             logger.info(
@@ -1206,15 +1210,16 @@ class ActionExecutor:
             Element or None if not found
         """
         try:
-            # Wait for element to be visible and ready
-            await page.wait_for_selector(
+            # Wait for element to be visible and ready; this already resolves
+            # to the element handle, saving a second query round-trip
+            element = await page.wait_for_selector(
                 selector,
                 state="visible",
                 timeout=timeout
             )
 
-            # Query the element
-            element = await page.query_selector(selector)
+            if element is None:
+                element = await page.query_selector(selector)
             return element
 
         except Exception as e:
@@ -6,6 +6,7 @@ Manages browser screenshots and image storage.
 
 import logging
 import asyncio
+import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -13,6 +14,9 @@ import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between retention sweeps of the storage directory
+RETENTION_SWEEP_INTERVAL = 3600
+
 
 class ScreenshotManager:
     """
@@ -47,6 +51,11 @@ class ScreenshotManager:
         self.max_storage_mb = self.screenshot_config.get("max_storage_mb", 100)
         self.retention_days = self.screenshot_config.get("retention_days", 7)
 
+        # Running size of the storage directory (scanned once, then updated
+        # incrementally) and the time of the last retention sweep
+        self._storage_bytes: Optional[int] = None
+        self._last_retention_sweep: Optional[float] = None
+
         logger.info(f"ScreenshotManager initialized (storage: {self.storage_path})")
 
     async def capture_screenshot(
@@ -116,7 +125,7 @@ class ScreenshotManager:
             logger.info(f"Screenshot captured: {filepath} ({file_size} bytes)")
 
             # Check storage limits
-            await self._enforce_storage_limits()
+            await self._enforce_storage_limits(file_size)
 
             return {
                 "success": True,
@@ -137,15 +146,23 @@ class ScreenshotManager:
                 "error": str(e)
             }
 
-    async def _enforce_storage_limits(self):
-        """Enforce storage limits and retention policy."""
+    async def _enforce_storage_limits(self, added_bytes: int = 0):
+        """
+        Enforce storage limits and retention policy.
+
+        Args:
+            added_bytes: Size of the screenshot just written
+        """
         try:
-            # Calculate total storage
-            total_size = sum(
-                f.stat().st_size for f in self.storage_path.glob("*")
-                if f.is_file()
-            )
-            total_mb = total_size / (1024 * 1024)
+            # Calculate total storage (full scan only when the total is unknown)
+            if self._storage_bytes is None:
+                self._storage_bytes = sum(
+                    f.stat().st_size for f in self.storage_path.glob("*")
+                    if f.is_file()
+                )
+            else:
+                self._storage_bytes += added_bytes
+            total_mb = self._storage_bytes / (1024 * 1024)
 
             # Check size limit
             if total_mb > self.max_storage_mb:
@@ -154,8 +171,12 @@ class ScreenshotManager:
                 )
                 await self._cleanup_old_screenshots(target_mb=self.max_storage_mb * 0.8)
 
-            # Enforce retention policy
-            await self._cleanup_expired_screenshots()
+            # Enforce retention policy (expiry is in days, so sweep at most hourly)
+            now = time.monotonic()
+            if (self._last_retention_sweep is None
+                    or now - self._last_retention_sweep >= RETENTION_SWEEP_INTERVAL):
+                self._last_retention_sweep = now
+                await self._cleanup_expired_screenshots()
 
         except Exception as e:
             logger.error(f"Error enforcing storage limits: {e}")
@@ -187,6 +208,8 @@ class ScreenshotManager:
                 total_size -= size
                 logger.info(f"Deleted old screenshot: {screenshot.name}")
 
+            self._storage_bytes = total_size
+
         except Exception as e:
             logger.error(f"Error cleaning up old screenshots: {e}")
 
@@ -198,9 +221,11 @@ class ScreenshotManager:
 
             for screenshot in self.storage_path.glob("*"):
                 if screenshot.is_file():
-                    mtime = screenshot.stat().st_mtime
-                    if mtime < cutoff_timestamp:
+                    stat = screenshot.stat()
+                    if stat.st_mtime < cutoff_timestamp:
                         screenshot.unlink()
+                        if self._storage_bytes is not None:
+                            self._storage_bytes -= stat.st_size
                         logger.info(f"Deleted expired screenshot: {screenshot.name}")
 
         except Exception as e:
@@ -260,6 +285,8 @@ class ScreenshotManager:
             filepath = self.storage_path / filename
             if filepath.exists():
                 filepath.unlink()
+                # Recount on the next capture
+                self._storage_bytes = None
                 logger.info(f"Screenshot deleted: {filename}")
                 return True
             return False
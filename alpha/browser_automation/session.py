@@ -7,7 +7,7 @@ Manages browser lifecycle, context, and page creation/cleanup.
 import logging
 import asyncio
 import uuid
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -70,6 +70,7 @@ class SessionManager:
         self.sessions: Dict[str, BrowserSession] = {}
         self._playwright = None
         self._browsers = {}  # Cache browser instances
+        self._cdp_endpoint = self._shared_cdp_endpoint()
         self._lock = asyncio.Lock()
         logger.info("SessionManager initialized")
 
@@ -100,7 +101,9 @@ class SessionManager:
         Returns:
             Browser instance
         """
-        browser_key = f"{browser_type}_{headless}"
+        # A shared CDP browser is already running, so headless does not apply
+        cdp_endpoint = self._cdp_endpoint if browser_type == "chromium" else None
+        browser_key = f"cdp_{cdp_endpoint}" if cdp_endpoint else f"{browser_type}_{headless}"
 
         if browser_key not in self._browsers:
             playwright = await self._get_playwright()
@@ -115,6 +118,16 @@ class SessionManager:
             else:
                 raise ValueError(f"Unsupported browser type: {browser_type}")
 
+            if cdp_endpoint:
+                # Attach to an already running Chromium shared by several agents
+                try:
+                    browser = await launcher.connect_over_cdp(cdp_endpoint)
+                    self._browsers[browser_key] = browser
+                    logger.info(f"Connected to shared browser over CDP: {cdp_endpoint}")
+                except Exception as e:
+                    raise RuntimeError(f"Failed to connect to CDP endpoint {cdp_endpoint}: {e}")
+                return browser
+
             # Launch browser
             try:
                 browser = await launcher.launch(headless=headless)
@@ -125,6 +138,46 @@ class SessionManager:
 
         return self._browsers[browser_key]
 
+    def _shared_cdp_endpoint(self) -> Optional[str]:
+        """
+        Get the shared CDP endpoint Chromium sessions connect to instead of launching.
+
+        Sessions on a shared browser are isolated only by their contexts, so this
+        must be explicitly allowed with ``security.allow_shared_browser``.
+        Closing a session closes only its context; cleanup_all_sessions()
+        disconnects from the shared browser without shutting it down.
+        """
+        endpoint = self.config.get("cdp_endpoint")
+        if not endpoint:
+            return None
+
+        if not self.config.get("security", {}).get("allow_shared_browser", False):
+            logger.warning(
+                "cdp_endpoint ignored: set security.allow_shared_browser to share a browser"
+            )
+            return None
+
+        return endpoint
+
+    async def warm_up(self, browser_types: Optional[List[str]] = None, headless: bool = True):
+        """
+        Launch browsers ahead of time so new sessions only create a context.
+
+        Args:
+            browser_types: Browser types to launch (default: configured default browser)
+            headless: Run in headless mode
+        """
+        if not browser_types:
+            browser_types = [self.config.get("defaults", {}).get("browser", "chromium")]
+
+        async with self._lock:
+            # Start Playwright once before launching browsers concurrently
+            await self._get_playwright()
+            await asyncio.gather(*(
+                self._get_browser(browser_type, headless)
+                for browser_type in dict.fromkeys(browser_types)
+            ))
+
     async def create_session(
         self,
         config: Optional[SessionConfig] = None
@@ -258,7 +311,7 @@ class SessionManager:
         for session_id in list(self.sessions.keys()):
             await self.close_session(session_id)
 
-        # Close browsers
+        # Close browsers (for a shared CDP browser this only disconnects)
         for browser_key, browser in self._browsers.items():
             try:
                 await browser.close()
@@ -17,6 +17,7 @@ from rich.status import Status
 
 from alpha.core.engine import AlphaEngine
 from alpha.utils.config import load_config
+from alpha.utils.event_loop import install_fast_event_loop
 from alpha.llm.service import LLMService, Message
 from alpha.llm.vision_message import VisionMessage, TextContent, ImageContent, ImageSource
 from alpha.tools.registry import create_default_registry
@@ -1429,6 +1430,7 @@ async def run_cli():
         # Shutdown
         await engine.shutdown()
         await engine_task
+        await tool_registry.close()
 
     except Exception as e:
         console.print(f"[bold red]Fatal error:[/bold red] {e}")
@@ -1437,4 +1439,5 @@ async def run_cli():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
     asyncio.run(run_cli())
@@ -317,6 +317,46 @@ class LearningStore:
         self.conn.commit()
         return cursor.lastrowid
 
+    async def store_metrics_batch(self, metrics: List[Dict[str, Any]]) -> int:
+        """
+        Store multiple success metrics in a single transaction.
+
+        Args:
+            metrics: List of dicts with the same keys as store_metric()
+                arguments (metric_type, metric_name, value, period_start,
+                period_end and optional metadata)
+
+        Returns:
+            Number of metrics stored
+        """
+        if not metrics:
+            return 0
+
+        created_at = datetime.now().isoformat()
+        rows = [
+            (
+                m["metric_type"],
+                m["metric_name"],
+                m["value"],
+                m["period_start"].isoformat(),
+                m["period_end"].isoformat(),
+                json.dumps(m.get("metadata") or {}),
+                created_at
+            )
+            for m in metrics
+        ]
+
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            INSERT INTO success_metrics (
+                metric_type, metric_name, value,
+                period_start, period_end, metadata, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+        self.conn.commit()
+        return len(rows)
+
     async def store_correlation(
         self,
         correlation_type: str,
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from alpha.core.engine import AlphaEngine
 from alpha.utils.config import load_config
+from alpha.utils.event_loop import install_fast_event_loop
 from alpha.daemon import PIDManager, SignalHandler, daemonize
 from alpha.api.server import start_server
 
@@ -153,4 +154,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
     asyncio.run(main())
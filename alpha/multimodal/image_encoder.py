@@ -4,7 +4,6 @@ Image Encoding Module
 Handles image encoding for vision AI APIs (base64, URL fetching).
 """
 
-import base64
 import io
 import logging
 from pathlib import Path
@@ -14,6 +13,12 @@ from urllib.parse import urlparse
 import httpx
 from PIL import Image
 
+# pybase64 is a drop-in, SIMD-accelerated replacement when installed
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,7 +77,7 @@ class ImageEncoder:
         buffer = io.BytesIO()
         image.save(buffer, format=format)
         image_bytes = buffer.getvalue()
-        encoded = base64.b64encode(image_bytes).decode("utf-8")
+        encoded = _b64.b64encode(image_bytes).decode("utf-8")
 
         self.logger.debug(
             f"Encoded image to base64: {len(encoded)} chars "
@@ -7,11 +7,12 @@ Handles image loading, validation, optimization, and preparation for vision AI.
 import base64
 import hashlib
 import io
+import math
 import mimetypes
 from pathlib import Path
 from typing import Optional
 
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 
 import logging
 
@@ -46,12 +47,17 @@ class ImageProcessor:
     def __init__(self):
         self.logger = logger
 
-    def load_image(self, file_path: str | Path) -> Image.Image:
+    def load_image(
+        self, file_path: str | Path, max_dimension: Optional[int] = None
+    ) -> Image.Image:
         """
         Load image from file path
 
         Args:
             file_path: Path to image file
+            max_dimension: Optional target for the longer edge. JPEGs larger than
+                this are decoded at a reduced scale (1/2, 1/4 or 1/8) that still
+                covers the target, skipping full-resolution pixel decoding.
 
         Returns:
             PIL Image object
@@ -65,18 +71,73 @@ class ImageProcessor:
         if not file_path.exists():
             raise ImageValidationError(f"Image file not found: {file_path}")
 
-        # Check file size
-        file_size = file_path.stat().st_size
+        return self._decode_image(
+            file_path, file_path.stat().st_size, str(file_path), max_dimension
+        )
+
+    def load_image_bytes(
+        self,
+        data: bytes,
+        name: str = "<bytes>",
+        max_dimension: Optional[int] = None,
+    ) -> Image.Image:
+        """
+        Load image from file contents already in memory
+
+        Args:
+            data: Raw image file bytes
+            name: Name used in messages (usually the file path)
+            max_dimension: Optional target for the longer edge (see load_image)
+
+        Returns:
+            PIL Image object
+
+        Raises:
+            ImageValidationError: If image invalid or unsupported
+        """
+        return self._decode_image(io.BytesIO(data), len(data), name, max_dimension)
+
+    def check_file_size(self, file_size: int) -> None:
+        """
+        Check an image file is within the size limit
+
+        Args:
+            file_size: File size in bytes
+
+        Raises:
+            ImageValidationError: If the file is too large
+        """
         if file_size > self.MAX_FILE_SIZE:
             raise ImageValidationError(
                 f"Image too large: {file_size / 1024 / 1024:.2f}MB "
                 f"(max {self.MAX_FILE_SIZE / 1024 / 1024}MB)"
             )
 
+    def _decode_image(
+        self,
+        source: Path | io.BytesIO,
+        file_size: int,
+        name: str,
+        max_dimension: Optional[int],
+    ) -> Image.Image:
+        """Check size, decode and check format of an image file or buffer."""
+        self.check_file_size(file_size)
+
         # Load image
         try:
-            image = Image.open(file_path)
+            image = Image.open(source)
+            if max_dimension and max(image.size) > max_dimension:
+                # Only JPEG decoders support this; for other formats it is a no-op
+                scale = max_dimension / max(image.size)
+                image.draft(
+                    image.mode,
+                    (math.ceil(image.width * scale), math.ceil(image.height * scale))
+                )
             image.load()  # Force load to detect corrupted images
+        except UnidentifiedImageError:
+            raise ImageValidationError(
+                f"Failed to load image: cannot identify image file '{name}'"
+            )
         except Exception as e:
             raise ImageValidationError(f"Failed to load image: {e}")
 
@@ -88,7 +149,7 @@ class ImageProcessor:
             )
 
         self.logger.debug(
-            f"Loaded image: {file_path.name} "
+            f"Loaded image: {Path(name).name} "
             f"({image.format}, {image.width}x{image.height}, "
             f"{file_size / 1024:.2f}KB)"
         )
@@ -117,7 +178,10 @@ class ImageProcessor:
             raise ImageValidationError(f"Unsupported format: {image.format}")
 
     def optimize_image(
-        self, image: Image.Image, max_size: int = OPTIMIZE_THRESHOLD
+        self,
+        image: Image.Image,
+        max_size: int = OPTIMIZE_THRESHOLD,
+        current_size: Optional[int] = None,
     ) -> Image.Image:
         """
         Optimize image if too large
@@ -125,14 +189,17 @@ class ImageProcessor:
         Args:
             image: PIL Image object
             max_size: Maximum file size in bytes before optimization
+            current_size: Encoded size in bytes, if already known (skips
+                re-encoding the image just to measure it)
 
         Returns:
             Optimized PIL Image (or original if no optimization needed)
         """
-        # Estimate current size
-        buffer = io.BytesIO()
-        image.save(buffer, format=image.format or "PNG")
-        current_size = buffer.tell()
+        if current_size is None:
+            # Estimate current size
+            buffer = io.BytesIO()
+            image.save(buffer, format=image.format or "PNG")
+            current_size = buffer.tell()
 
         if current_size <= max_size:
             self.logger.debug("Image size OK, no optimization needed")
@@ -7,7 +7,12 @@ Discover and download skills from local and remote sources.
 import logging
 import json
 import asyncio
-from typing import Dict, List, Optional
+import mmap
+import re
+import time
+from dataclasses import dataclass, fields
+from itertools import islice
+from typing import Dict, List, Optional, Set, Union
 from pathlib import Path
 from datetime import datetime
 
@@ -16,8 +21,85 @@ import yaml
 
 from alpha.skills.base import SkillMetadata
 
+# Optional fast JSON decoder for large registries
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental JSON parser for very large remote registries
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Local JSON registries above this size are memory-mapped when orjson is available
+_MMAP_THRESHOLD = 256 * 1024
+
+# Remote registries above this size are stream-parsed when ijson is available
+_STREAM_PARSE_THRESHOLD = 512 * 1024
+
+# Per-field limits for registry entries
+_MAX_NAME_LENGTH = 256
+_MAX_DESCRIPTION_LENGTH = 4096
+
+# Chunk size for streaming downloaded skill files to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# https://github.com/<owner>/<repo>[.git][/]
+_GITHUB_REPO_RE = re.compile(r'^https?://(?:www\.)?github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$')
+
+# Registry keys accepted by SkillMetadata; timestamps are never taken from a registry
+_METADATA_FIELDS = frozenset(
+    f.name for f in fields(SkillMetadata)
+) - {"created_at", "updated_at"}
+
+
+@dataclass(slots=True)
+class _SearchRec:
+    """Precomputed search keys for a cached skill, kept off SkillMetadata."""
+    meta: SkillMetadata
+    tag_set: frozenset
+    # Lowercased "name\0description"; NUL keeps a query from matching across fields
+    blob: str
+
+
+def _github_raw_base(repo_url: str) -> str:
+    """
+    Convert a GitHub repository URL to its raw content base URL (main branch).
+
+    Example: https://github.com/user/repo -> https://raw.githubusercontent.com/user/repo/main/
+    """
+    match = _GITHUB_REPO_RE.match(repo_url)
+    if match:
+        return f"https://raw.githubusercontent.com/{match[1]}/{match[2]}/main/"
+
+    # Non-canonical URL (e.g. a subdirectory); fall back to host substitution
+    raw_url = repo_url.replace("github.com", "raw.githubusercontent.com", 1)
+    if not raw_url.endswith("/"):
+        raw_url += "/"
+    return raw_url + "main/"
+
+
+def _metadata_from_dict(skill_data: Dict) -> SkillMetadata:
+    """
+    Build SkillMetadata from a registry entry in a single constructor call.
+
+    Unknown keys are ignored and missing optional keys fall back to the
+    dataclass defaults. Missing required keys raise TypeError.
+    """
+    kwargs = {k: v for k, v in skill_data.items() if k in _METADATA_FIELDS}
+    kwargs.setdefault("category", "general")
+    return SkillMetadata(**kwargs)
+
 
 class SkillMarketplace:
     """
@@ -35,9 +117,27 @@ class SkillMarketplace:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.metadata_cache: Dict[str, SkillMetadata] = {}
+        self._search: Dict[str, _SearchRec] = {}
         self.sources: List[Dict] = []
+        self._source_urls: Set[str] = set()
         self.config = config or {}
 
+        # Cap in-flight HTTP requests so many sources/files don't flood GitHub
+        download_config = self.config.get('download', {})
+        self._http_sem = asyncio.Semaphore(download_config.get('max_concurrency', 8))
+        self._limit_per_host = download_config.get('limit_per_host', 4)
+
+        # Hard limits on untrusted registry payloads
+        self._max_registry_bytes = download_config.get('max_registry_bytes', 8 * 1024 * 1024)
+        self._max_registry_skills = download_config.get('max_registry_skills', 10000)
+
+        # In-flight cache update shared by concurrent callers
+        self._update_task: Optional[asyncio.Task] = None
+
+        # Monotonic time of the last completed update, for TTL checks
+        self._last_updated: float = 0.0
+        self._cache_ttl = self.config.get('cache', {}).get('ttl', 3600)
+
         # Default skill sources
         self._load_default_sources()
 
@@ -57,33 +157,66 @@ class SkillMarketplace:
                 'enabled': True,
                 'priority': 0
             })
+            self._source_urls.add(str(builtin_registry))
 
     def _load_config_sources(self, sources: List[Dict]):
         """Load skill sources from config."""
         for source in sources:
-            if source.get('enabled', True):
+            if source.get('enabled', True) and source['url'] not in self._source_urls:
                 self.sources.append(source)
+                self._source_urls.add(source['url'])
                 logger.info(f"Added skill source: {source['name']} ({source['url']})")
 
         # Sort by priority
         self.sources.sort(key=lambda x: x.get('priority', 999))
 
-    def add_source(self, source: str):
+    @staticmethod
+    def _infer_source_type(url: str) -> str:
+        """Infer the source type from a registry URL or path."""
+        if "github.com" in url:
+            return 'github'
+        if url.startswith(("http://", "https://")):
+            return 'api'
+        return 'local'
+
+    def add_source(self, source: Union[Dict, str]):
         """
         Add a skill source.
 
         Args:
-            source: URL or file path to skill registry
+            source: Source dict (name, url, type, ...) or a bare URL/file path
+                to a skill registry
+        """
+        if isinstance(source, str):
+            source = {
+                'name': source,
+                'url': source,
+                'type': self._infer_source_type(source),
+                'enabled': True
+            }
+
+        url = source['url']
+        if url in self._source_urls:
+            return
+
+        self.sources.append(source)
+        self._source_urls.add(url)
+        logger.info(f"Added skill source: {url}")
+
+    def remove_source(self, source: Union[Dict, str]):
+        """
+        Remove a skill source.
+
+        Args:
+            source: Source dict or URL/file path of the registry to remove
         """
-        if source not in self.sources:
-            self.sources.append(source)
-            logger.info(f"Added skill source: {source}")
+        url = source if isinstance(source, str) else source['url']
+        if url not in self._source_urls:
+            return
 
-    def remove_source(self, source: str):
-        """Remove a skill source."""
-        if source in self.sources:
-            self.sources.remove(source)
-            logger.info(f"Removed skill source: {source}")
+        self._source_urls.discard(url)
+        self.sources = [s for s in self.sources if s.get('url') != url]
+        logger.info(f"Removed skill source: {url}")
 
     async def search(
         self,
@@ -106,30 +239,28 @@ class SkillMarketplace:
         """
         logger.info(f"Searching skills: query='{query}', category={category}, tags={tags}")
 
-        # Update cache if empty
-        if not self.metadata_cache:
-            await self._update_cache()
+        # Update cache if empty or expired
+        await self._ensure_cache()
 
         # Search in cache
-        results = []
         query_lower = query.lower()
+        query_tag_set = frozenset(tags) if tags else None
 
-        for skill_meta in self.metadata_cache.values():
+        def _matches(rec: _SearchRec) -> bool:
             # Filter by category
-            if category and skill_meta.category != category:
-                continue
+            if category and rec.meta.category != category:
+                return False
 
             # Filter by tags
-            if tags and not any(tag in skill_meta.tags for tag in tags):
-                continue
+            if query_tag_set and query_tag_set.isdisjoint(rec.tag_set):
+                return False
 
-            # Match query in name or description
-            if (query_lower in skill_meta.name.lower() or
-                query_lower in skill_meta.description.lower()):
-                results.append(skill_meta)
+            # Match query in name or description (precomputed lowercase blob)
+            return query_lower in rec.blob
 
-            if len(results) >= limit:
-                break
+        # islice stops the scan as soon as `limit` matches have been produced
+        matches = islice(filter(_matches, self._search.values()), max(limit, 0))
+        results = [rec.meta for rec in matches]
 
         logger.info(f"Found {len(results)} skills matching query")
         return results
@@ -149,7 +280,7 @@ class SkillMarketplace:
             return self.metadata_cache[skill_name]
 
         # Update cache and search again
-        await self._update_cache()
+        await self._ensure_cache()
         return self.metadata_cache.get(skill_name)
 
     async def download_skill(
@@ -220,6 +351,28 @@ class SkillMarketplace:
             logger.error(f"Error downloading skill {skill_name}: {e}", exc_info=True)
             return None
 
+    async def _ensure_cache(self):
+        """
+        Update the cache unless it is warm, coalescing concurrent requests.
+
+        Nothing is fetched while the cache is non-empty and younger than the
+        configured TTL. Otherwise the first caller starts _update_cache() and
+        callers arriving while it is running await the same task.
+        """
+        if self.metadata_cache and time.monotonic() - self._last_updated < self._cache_ttl:
+            return
+
+        task = self._update_task
+        if task is None:
+            task = self._update_task = asyncio.create_task(self._update_cache())
+
+        try:
+            # Shield so one cancelled caller doesn't abort the shared update
+            await asyncio.shield(task)
+        finally:
+            if self._update_task is task and task.done():
+                self._update_task = None
+
     async def _update_cache(self):
         """Update skill metadata cache from all sources."""
         logger.info("Updating skill metadata cache...")
@@ -250,18 +403,21 @@ class SkillMarketplace:
             except Exception as e:
                 logger.error(f"Error loading source {source.get('name', 'unknown')}: {e}", exc_info=True)
 
+        self._last_updated = time.monotonic()
         logger.info(f"Cache updated: {len(self.metadata_cache)} skills available")
 
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session with a per-host connection limit."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=self._limit_per_host)
+        )
+
     async def _fetch_github_registry(self, repo_url: str, source_name: str):
         """Fetch skill registry from GitHub repository."""
         try:
             # Convert GitHub repo URL to raw content URL for registry.json
-            # Example: https://github.com/user/repo -> https://raw.githubusercontent.com/user/repo/main/registry.json
             if "github.com" in repo_url:
-                raw_url = repo_url.replace("github.com", "raw.githubusercontent.com")
-                if not raw_url.endswith("/"):
-                    raw_url += "/"
-                raw_url += "main/registry.json"  # Try main branch first
+                raw_url = _github_raw_base(repo_url) + "registry.json"
 
                 logger.info(f"Fetching from GitHub: {raw_url}")
                 await self._fetch_remote_registry(raw_url, source_name)
@@ -283,11 +439,30 @@ class SkillMarketplace:
         """Fetch skill registry from remote URL."""
         try:
             timeout = self.config.get('download', {}).get('timeout', 30)
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            async with self._new_session() as session:
+                async with self._http_sem, session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        self._parse_registry(data, source_name)
+                        if (response.content_length or 0) > self._max_registry_bytes:
+                            logger.warning(
+                                f"Registry from {source_name} too large "
+                                f"({response.content_length} bytes), skipping"
+                            )
+                            return
+
+                        if ijson is not None and (response.content_length or 0) > _STREAM_PARSE_THRESHOLD:
+                            # Large registry: ingest skills as they arrive
+                            await self._stream_registry(response, source_name)
+                        else:
+                            # Decode raw bytes directly; raw.githubusercontent.com
+                            # serves text/plain, which response.json() rejects
+                            body = await self._read_capped(response)
+                            if body is None:
+                                logger.warning(
+                                    f"Registry from {source_name} exceeds "
+                                    f"{self._max_registry_bytes} bytes, skipping"
+                                )
+                                return
+                            self._parse_registry(json.loads(body), source_name)
                         logger.info(f"Successfully loaded skills from {source_name}")
                     elif response.status == 404:
                         logger.warning(f"Registry not found at {url} ({source_name}) - may not exist yet")
@@ -301,60 +476,115 @@ class SkillMarketplace:
         except Exception as e:
             logger.error(f"Error fetching remote registry {source_name}: {e}")
 
+    async def _read_capped(self, response: aiohttp.ClientResponse) -> Optional[bytes]:
+        """Read a response body, or return None once it exceeds the registry size limit."""
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+            body += chunk
+            if len(body) > self._max_registry_bytes:
+                return None
+        return bytes(body)
+
+    async def _stream_registry(self, response: aiohttp.ClientResponse, source_name: str):
+        """Incrementally parse a registry response body with ijson."""
+        skill_count = 0
+        async for skill_data in ijson.items(response.content, 'skills.item'):
+            if skill_count >= self._max_registry_skills:
+                logger.warning(
+                    f"Registry from {source_name} has more than "
+                    f"{self._max_registry_skills} skills, ignoring the rest"
+                )
+                break
+            if self._ingest_skill(skill_data, source_name):
+                skill_count += 1
+
+        logger.info(f"Loaded {skill_count} skills from {source_name}")
+
     async def _load_local_registry(self, path: str):
         """Load skill registry from local file."""
         try:
-            registry_path = Path(path)
-            if not registry_path.exists():
-                return
-
-            with open(registry_path, 'r') as f:
-                if path.endswith('.json'):
-                    data = json.load(f)
-                elif path.endswith('.yaml') or path.endswith('.yml'):
-                    data = yaml.safe_load(f)
-                else:
-                    logger.warning(f"Unsupported registry format: {path}")
-                    return
-
-            self._parse_registry(data)
+            # Run blocking disk I/O and parsing off the event loop
+            data = await asyncio.to_thread(self._load_local_registry_sync, path)
+            if data is not None:
+                self._parse_registry(data)
 
         except Exception as e:
             logger.error(f"Error loading local registry {path}: {e}")
 
+    def _load_local_registry_sync(self, path: str) -> Optional[Dict]:
+        """Read and decode a local registry file (blocking)."""
+        registry_path = Path(path)
+        if not registry_path.exists():
+            return None
+
+        if (orjson is not None and path.endswith('.json')
+                and registry_path.stat().st_size > _MMAP_THRESHOLD):
+            # Decode straight from the mapped pages, skipping a full read() copy
+            with open(registry_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as buf:
+                return orjson.loads(buf)
+
+        # Binary mode lets libyaml consume bytes without a Python-level decode
+        with open(registry_path, 'rb') as f:
+            if path.endswith('.json'):
+                return json.load(f)
+            elif path.endswith('.yaml') or path.endswith('.yml'):
+                return yaml.load(f, Loader=_YamlLoader)
+
+        logger.warning(f"Unsupported registry format: {path}")
+        return None
+
     def _parse_registry(self, data: Dict, source_name: str = "Unknown"):
         """Parse registry data and update cache."""
         if "skills" not in data:
             logger.warning(f"No 'skills' key found in registry from {source_name}")
             return
 
-        skill_count = 0
-        for skill_data in data["skills"]:
-            try:
-                metadata = SkillMetadata(
-                    name=skill_data["name"],
-                    version=skill_data["version"],
-                    description=skill_data["description"],
-                    author=skill_data["author"],
-                    category=skill_data.get("category", "general"),
-                    tags=skill_data.get("tags", []),
-                    dependencies=skill_data.get("dependencies", []),
-                    python_version=skill_data.get("python_version", ">=3.8"),
-                    homepage=skill_data.get("homepage"),
-                    repository=skill_data.get("repository"),
-                    license=skill_data.get("license"),
-                )
+        skills = data["skills"]
+        if len(skills) > self._max_registry_skills:
+            logger.warning(
+                f"Registry from {source_name} has {len(skills)} skills, "
+                f"only the first {self._max_registry_skills} will be loaded"
+            )
+            skills = skills[:self._max_registry_skills]
 
-                self.metadata_cache[metadata.name] = metadata
+        skill_count = 0
+        for skill_data in skills:
+            if self._ingest_skill(skill_data, source_name):
                 skill_count += 1
 
-            except KeyError as e:
-                logger.warning(f"Invalid skill metadata from {source_name}: missing field {e}")
-            except Exception as e:
-                logger.error(f"Error parsing skill metadata from {source_name}: {e}")
-
         logger.info(f"Loaded {skill_count} skills from {source_name}")
 
+    def _ingest_skill(self, skill_data: Dict, source_name: str = "Unknown") -> bool:
+        """
+        Add a single registry entry to the cache.
+
+        Returns:
+            True if the entry was valid and cached
+        """
+        try:
+            metadata = _metadata_from_dict(skill_data)
+            if len(metadata.name) > _MAX_NAME_LENGTH:
+                logger.warning(f"Skill name too long in registry from {source_name}, skipping")
+                return False
+            if len(metadata.description) > _MAX_DESCRIPTION_LENGTH:
+                metadata.description = metadata.description[:_MAX_DESCRIPTION_LENGTH]
+
+            self.metadata_cache[metadata.name] = metadata
+            self._search[metadata.name] = _SearchRec(
+                meta=metadata,
+                tag_set=frozenset(metadata.tags or ()),
+                blob=f"{metadata.name}\0{metadata.description}".lower(),
+            )
+            return True
+
+        except TypeError as e:
+            logger.warning(f"Invalid skill metadata from {source_name}: {e}")
+        except Exception as e:
+            logger.error(f"Error parsing skill metadata from {source_name}: {e}")
+        return False
+
     async def _download_from_repo(self, repo_url: str, target_dir: Path) -> bool:
         """
         Download skill files from repository.
@@ -375,28 +605,26 @@ class SkillMarketplace:
         # In production, you'd want more robust handling
 
         if "github.com" in repo_url:
-            # Convert GitHub URL to raw content URL
-            # Example: https://github.com/user/repo -> https://raw.githubusercontent.com/user/repo/main/
-            raw_url = repo_url.replace("github.com", "raw.githubusercontent.com")
-            if not raw_url.endswith("/"):
-                raw_url += "/"
-            raw_url += "main/"  # Assume main branch
+            # Convert GitHub URL to raw content URL (assume main branch)
+            raw_url = _github_raw_base(repo_url)
 
             # Download essential files
             files_to_download = ["skill.yaml", "skill.py", "README.md", "requirements.txt"]
 
-            async with aiohttp.ClientSession() as session:
+            async with self._new_session() as session:
                 for filename in files_to_download:
                     file_url = raw_url + filename
                     try:
-                        async with session.get(
+                        async with self._http_sem, session.get(
                             file_url,
                             timeout=aiohttp.ClientTimeout(total=30)
                         ) as response:
                             if response.status == 200:
-                                content = await response.read()
+                                # Stream to disk instead of buffering the whole body
                                 file_path = target_dir / filename
-                                file_path.write_bytes(content)
+                                with open(file_path, 'wb') as f:
+                                    async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                                        f.write(chunk)
                                 logger.info(f"Downloaded: {filename}")
                             elif filename in ["skill.yaml", "skill.py"]:
                                 # These are required
@@ -417,4 +645,6 @@ class SkillMarketplace:
     def clear_cache(self):
         """Clear metadata cache."""
         self.metadata_cache.clear()
+        self._search.clear()
+        self._last_updated = 0.0
         logger.info("Skill metadata cache cleared")
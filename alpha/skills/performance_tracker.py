@@ -5,17 +5,43 @@ Tracks skill performance metrics for continuous improvement and evolution.
 Stores data in database for historical analysis and trend detection.
 """
 
+import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 import json
 
+# Optional fast JSON codec for the stats file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Number of executions kept in memory for trend and error analysis
+RECENT_EXECUTIONS_LIMIT = 1000
+
+# Metric writes are buffered and flushed to the learning store once this many
+# are pending, or after FLUSH_INTERVAL seconds, whichever comes first
+FLUSH_BATCH_SIZE = 64
+FLUSH_INTERVAL = 1.0
+
+# Window for error_count_last_24h, in nanoseconds
+ERROR_WINDOW_NS = 24 * 60 * 60 * 1_000_000_000
 
-@dataclass
+# Trend analysis compares the last TREND_WINDOW executions of a skill against
+# its overall success rate, once at least TREND_MIN_SAMPLES are available
+TREND_WINDOW = 10
+TREND_MIN_SAMPLES = 5
+
+
+@dataclass(slots=True)
 class SkillExecutionMetrics:
     """Metrics for a single skill execution."""
     skill_id: str
@@ -29,7 +55,7 @@ class SkillExecutionMetrics:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillPerformanceStats:
     """Aggregated performance statistics for a skill."""
     skill_id: str
@@ -70,7 +96,7 @@ class SkillPerformanceStats:
     error_count_last_24h: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillGap:
     """Represents a detected skill gap (task failed due to missing skill)."""
     gap_id: str
@@ -82,6 +108,73 @@ class SkillGap:
     suggested_skills: List[str] = field(default_factory=list)
 
 
+# Field names of SkillPerformanceStats, resolved once for _stats_to_dict
+_STATS_FIELDS = tuple(f.name for f in fields(SkillPerformanceStats))
+
+
+def _stats_to_dict(stats: SkillPerformanceStats) -> Dict[str, Any]:
+    """
+    Shallow dict of a stats object.
+
+    All stats fields are scalars, so this matches asdict() without its
+    recursive deep copy.
+    """
+    return {name: getattr(stats, name) for name in _STATS_FIELDS}
+
+
+def _stats_from_dict(stats_dict: Dict[str, Any]) -> SkillPerformanceStats:
+    """Build a stats object from a decoded stats file entry."""
+    first_used = stats_dict.pop("first_used", None)
+    last_used = stats_dict.pop("last_used", None)
+    # orjson writes an unset (infinite) minimum as null
+    min_time = stats_dict.pop("min_execution_time", None)
+
+    return SkillPerformanceStats(
+        first_used=datetime.fromisoformat(first_used) if first_used else None,
+        last_used=datetime.fromisoformat(last_used) if last_used else None,
+        min_execution_time=float('inf') if min_time is None else min_time,
+        **stats_dict
+    )
+
+
+def _value_and_roi(
+    success_rate: float,
+    usage_frequency: float,
+    total_cost: float,
+    total_executions: int
+) -> Tuple[float, float]:
+    """
+    Calculate value and ROI scores from plain numbers.
+
+    Value = (usage_frequency * success_rate) normalized to 0-1
+    ROI = value_score / (cost + maintenance), higher is better
+
+    Returns:
+        Tuple of (value_score, roi_score)
+    """
+    # Assume 5 uses/day is very high value
+    frequency_score = usage_frequency / 5.0
+    if frequency_score > 1.0:
+        frequency_score = 1.0
+    value_score = frequency_score * success_rate
+
+    if total_cost == 0:
+        # Free skill, high ROI if valuable
+        return value_score, value_score * 10.0
+
+    # Maintenance cost estimate (very simple): $0.01 per execution
+    total_cost += total_executions * 0.01
+
+    return value_score, (value_score / total_cost if total_cost > 0 else 0.0)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize datetimes for the stdlib json fallback."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class PerformanceTracker:
     """
     Tracks skill performance metrics and stores them in database.
@@ -109,8 +202,43 @@ class PerformanceTracker:
 
         # In-memory cache for fast access
         self.stats_cache: Dict[str, SkillPerformanceStats] = {}
-        self.recent_executions: List[SkillExecutionMetrics] = []
+        # Bounded ring buffer: appending past maxlen evicts the oldest in O(1)
+        self.recent_executions: deque = deque(maxlen=RECENT_EXECUTIONS_LIMIT)
         self.skill_gaps: Dict[str, SkillGap] = {}
+        self._exec_counter = 0
+        # Reverse index for gap deduplication: missing_capability -> gap_id
+        self._gap_by_capability: Dict[str, str] = {}
+        self._gap_counter = 0
+
+        # Bumped on every stats update; get_top_performers results are cached
+        # per (version, limit) until the next update
+        self._stats_version = 0
+        self._top_performers: Optional[Tuple[int, int, List[SkillPerformanceStats]]] = None
+
+        # Running totals across all skills for get_performance_summary
+        self._total_executions = 0
+        self._total_successes = 0
+        self._total_cost = 0.0
+        self._high_roi: Set[str] = set()
+
+        # Skill IDs currently flagged by trend analysis
+        self._degrading: Set[str] = set()
+        self._improving: Set[str] = set()
+
+        # Per-skill failure timestamps (ns) for the last-24h error count
+        self._skill_errors: Dict[str, deque] = {}
+
+        # Per-skill rolling window of recent outcomes for trend analysis
+        self._skill_recent: Dict[str, deque] = {}
+
+        # Write-behind buffer for the learning store
+        self._pending_metrics: List[Dict[str, Any]] = []
+        self._dirty_stats: Set[str] = set()
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Whether stats changed since they were last written to disk
+        self._stats_changed = False
 
         # Load existing stats
         self._load_stats()
@@ -142,13 +270,18 @@ class PerformanceTracker:
         Returns:
             Execution ID
         """
-        execution_id = f"exec_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{id(self)}"
+        # Read the clock once; everything below derives from this timestamp
+        ts_ns = time.time_ns()
+        timestamp = datetime.fromtimestamp(ts_ns / 1e9)
+        # Counter suffix keeps IDs unique even for identical clock readings
+        self._exec_counter += 1
+        execution_id = f"exec_{ts_ns}_{self._exec_counter}"
 
         # Create execution record
         execution = SkillExecutionMetrics(
             skill_id=skill_id,
             execution_id=execution_id,
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             success=success,
             execution_time=execution_time,
             tokens_used=tokens_used,
@@ -157,16 +290,19 @@ class PerformanceTracker:
             metadata=metadata or {}
         )
 
-        # Add to recent executions (keep last 1000)
+        # Add to recent executions (oldest dropped once the buffer is full)
         self.recent_executions.append(execution)
-        if len(self.recent_executions) > 1000:
-            self.recent_executions.pop(0)
+        window = self._skill_recent.get(skill_id)
+        if window is None:
+            window = self._skill_recent[skill_id] = deque(maxlen=TREND_WINDOW)
+        window.append(success)
 
         # Update stats
-        await self._update_stats(execution)
+        await self._update_stats(execution, ts_ns)
 
-        # Store in database
-        await self._store_execution(execution)
+        # Queue for database (written in batches by the background flusher)
+        self._pending_metrics.append(self._execution_metric(execution))
+        self._schedule_flush()
 
         logger.debug(
             f"Recorded execution for {skill_id}: "
@@ -175,113 +311,97 @@ class PerformanceTracker:
 
         return execution_id
 
-    async def _update_stats(self, execution: SkillExecutionMetrics):
-        """Update performance statistics based on execution."""
+    async def _update_stats(self, execution: SkillExecutionMetrics, ts_ns: int):
+        """Update performance statistics based on execution (recorded at ``ts_ns``)."""
         skill_id = execution.skill_id
+        exec_time = execution.execution_time
 
-        # Get or create stats
-        if skill_id not in self.stats_cache:
-            self.stats_cache[skill_id] = SkillPerformanceStats(
+        # Get or create stats (single lookup on the hot path)
+        stats = self.stats_cache.get(skill_id)
+        if stats is None:
+            stats = self.stats_cache[skill_id] = SkillPerformanceStats(
                 skill_id=skill_id,
                 first_used=execution.timestamp
             )
 
-        stats = self.stats_cache[skill_id]
-
-        # Update counters
-        stats.total_executions += 1
+        # Update counters; totals only grow, so keep them in locals for the
+        # derived metrics below instead of re-reading attributes
+        total = stats.total_executions + 1
+        stats.total_executions = total
         if execution.success:
             stats.successful_executions += 1
         else:
             stats.failed_executions += 1
             stats.last_error = execution.error_message
+            errors = self._skill_errors.get(skill_id)
+            if errors is None:
+                errors = self._skill_errors[skill_id] = deque(maxlen=RECENT_EXECUTIONS_LIMIT)
+            errors.append(ts_ns)
 
         # Update success rate
-        stats.success_rate = (
-            stats.successful_executions / stats.total_executions
-            if stats.total_executions > 0 else 0.0
-        )
+        success_rate = stats.success_rate = stats.successful_executions / total
 
         # Update timing metrics
-        stats.total_execution_time += execution.execution_time
-        stats.avg_execution_time = stats.total_execution_time / stats.total_executions
-        stats.min_execution_time = min(stats.min_execution_time, execution.execution_time)
-        stats.max_execution_time = max(stats.max_execution_time, execution.execution_time)
+        total_time = stats.total_execution_time + exec_time
+        stats.total_execution_time = total_time
+        stats.avg_execution_time = total_time / total
+        if exec_time < stats.min_execution_time:
+            stats.min_execution_time = exec_time
+        if exec_time > stats.max_execution_time:
+            stats.max_execution_time = exec_time
 
         # Update cost metrics
-        stats.total_tokens += execution.tokens_used
-        stats.avg_tokens = stats.total_tokens / stats.total_executions
-        stats.total_cost += execution.cost_estimate
-        stats.avg_cost = stats.total_cost / stats.total_executions
+        total_tokens = stats.total_tokens + execution.tokens_used
+        stats.total_tokens = total_tokens
+        stats.avg_tokens = total_tokens / total
+        total_cost = stats.total_cost + execution.cost_estimate
+        stats.total_cost = total_cost
+        stats.avg_cost = total_cost / total
 
         # Update temporal metrics
         stats.last_used = execution.timestamp
         if stats.first_used:
             stats.days_active = (execution.timestamp - stats.first_used).days
-            stats.usage_frequency = (
-                stats.total_executions / max(1, stats.days_active)
-            )
+            stats.usage_frequency = total / max(1, stats.days_active)
 
         # Calculate ROI
-        stats.value_score = self._calculate_value_score(stats)
-        stats.roi_score = self._calculate_roi(stats)
+        stats.value_score, stats.roi_score = _value_and_roi(
+            success_rate, stats.usage_frequency, total_cost, total
+        )
+
+        # Update summary totals
+        self._total_executions += 1
+        self._total_successes += execution.success
+        self._total_cost += execution.cost_estimate
+        self._track_roi(stats)
 
         # Analyze trends
         await self._analyze_trends(stats)
 
         # Count recent errors
-        stats.error_count_last_24h = self._count_recent_errors(skill_id)
-
-        # Persist to database
-        await self._store_stats(stats)
-
-    def _calculate_value_score(self, stats: SkillPerformanceStats) -> float:
-        """
-        Calculate value score based on usage and success.
-
-        Value = (usage_frequency * success_rate) normalized to 0-1
-        """
-        # Assume 5 uses/day is very high value
-        frequency_score = min(1.0, stats.usage_frequency / 5.0)
-        return frequency_score * stats.success_rate
-
-    def _calculate_roi(self, stats: SkillPerformanceStats) -> float:
-        """
-        Calculate ROI score.
-
-        ROI = value_score / (cost + maintenance)
-        Higher is better
-        """
-        if stats.total_cost == 0:
-            # Free skill, high ROI if valuable
-            return stats.value_score * 10.0
-
-        # Maintenance cost estimate (very simple)
-        maintenance_cost = 0.01  # $0.01 per execution
-
-        total_cost = stats.total_cost + (stats.total_executions * maintenance_cost)
+        stats.error_count_last_24h = self._count_recent_errors(skill_id, ts_ns)
 
-        return stats.value_score / total_cost if total_cost > 0 else 0.0
+        # Persist to database on the next flush (coalesced per skill)
+        self._dirty_stats.add(skill_id)
+        self._stats_changed = True
+        self._stats_version += 1
 
     async def _analyze_trends(self, stats: SkillPerformanceStats):
         """Analyze performance trends (improving vs degrading)."""
         skill_id = stats.skill_id
 
-        # Get recent executions (last 10)
-        recent = [
-            e for e in self.recent_executions[-50:]
-            if e.skill_id == skill_id
-        ][-10:]
+        # Last TREND_WINDOW outcomes of this skill, kept by record_execution
+        window = self._skill_recent.get(skill_id, ())
 
-        if len(recent) < 5:
+        if len(window) < TREND_MIN_SAMPLES:
             # Not enough data
             stats.is_improving = False
             stats.is_degrading = False
+            self._track_trend(stats)
             return
 
         # Calculate recent success rate
-        recent_successes = sum(1 for e in recent if e.success)
-        stats.recent_success_rate = recent_successes / len(recent)
+        stats.recent_success_rate = sum(window) / len(window)
 
         # Compare with overall success rate
         improvement_threshold = 0.1  # 10% improvement
@@ -291,21 +411,43 @@ class PerformanceTracker:
 
         stats.is_improving = delta >= improvement_threshold
         stats.is_degrading = delta <= degradation_threshold
+        self._track_trend(stats)
 
         if stats.is_improving:
             logger.info(f"Skill {skill_id} is improving: {delta:+.1%}")
         elif stats.is_degrading:
             logger.warning(f"Skill {skill_id} is degrading: {delta:+.1%}")
 
-    def _count_recent_errors(self, skill_id: str) -> int:
-        """Count errors in last 24 hours."""
-        cutoff = datetime.now() - timedelta(hours=24)
-        return sum(
-            1 for e in self.recent_executions
-            if e.skill_id == skill_id
-            and not e.success
-            and e.timestamp >= cutoff
-        )
+    def _track_roi(self, stats: SkillPerformanceStats):
+        """Keep the set of skills with ROI above 1.0 in sync with the stats."""
+        if stats.roi_score > 1.0:
+            self._high_roi.add(stats.skill_id)
+        else:
+            self._high_roi.discard(stats.skill_id)
+
+    def _track_trend(self, stats: SkillPerformanceStats):
+        """Keep the improving/degrading skill sets in sync with the stats flags."""
+        if stats.is_improving:
+            self._improving.add(stats.skill_id)
+        else:
+            self._improving.discard(stats.skill_id)
+
+        if stats.is_degrading:
+            self._degrading.add(stats.skill_id)
+        else:
+            self._degrading.discard(stats.skill_id)
+
+    def _count_recent_errors(self, skill_id: str, now_ns: Optional[int] = None) -> int:
+        """Count errors in last 24 hours (relative to ``now_ns``, default the current time)."""
+        errors = self._skill_errors.get(skill_id)
+        if not errors:
+            return 0
+
+        # Failure timestamps are in order, so expired ones are all on the left
+        cutoff = (now_ns or time.time_ns()) - ERROR_WINDOW_NS
+        while errors and errors[0] < cutoff:
+            errors.popleft()
+        return len(errors)
 
     async def record_skill_gap(
         self,
@@ -324,15 +466,18 @@ class PerformanceTracker:
         Returns:
             Gap ID
         """
-        gap_id = f"gap_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
         # Check if similar gap exists
-        for existing_gap in self.skill_gaps.values():
-            if existing_gap.missing_capability == missing_capability:
-                existing_gap.failure_count += 1
-                existing_gap.priority_score = self._calculate_gap_priority(existing_gap)
-                logger.info(f"Updated existing skill gap: {existing_gap.gap_id}")
-                return existing_gap.gap_id
+        existing_id = self._gap_by_capability.get(missing_capability)
+        if existing_id is not None:
+            existing_gap = self.skill_gaps[existing_id]
+            existing_gap.failure_count += 1
+            existing_gap.priority_score = self._calculate_gap_priority(existing_gap)
+            logger.info(f"Updated existing skill gap: {existing_gap.gap_id}")
+            return existing_gap.gap_id
+
+        # Counter suffix keeps IDs unique for gaps recorded within the same second
+        self._gap_counter += 1
+        gap_id = f"gap_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self._gap_counter}"
 
         # Create new gap
         gap = SkillGap(
@@ -345,6 +490,7 @@ class PerformanceTracker:
 
         gap.priority_score = self._calculate_gap_priority(gap)
         self.skill_gaps[gap_id] = gap
+        self._gap_by_capability[missing_capability] = gap_id
 
         # Store in database
         await self.learning_store.store_metric(
@@ -376,19 +522,19 @@ class PerformanceTracker:
 
     def get_top_performers(self, limit: int = 10) -> List[SkillPerformanceStats]:
         """Get top performing skills by ROI."""
-        return sorted(
-            self.stats_cache.values(),
-            key=lambda s: s.roi_score,
-            reverse=True
-        )[:limit]
+        cached = self._top_performers
+        if cached is None or cached[0] != self._stats_version or cached[1] != limit:
+            top = heapq.nlargest(limit, self.stats_cache.values(), key=lambda s: s.roi_score)
+            cached = self._top_performers = (self._stats_version, limit, top)
+        return list(cached[2])
 
     def get_degrading_skills(self) -> List[SkillPerformanceStats]:
         """Get list of degrading skills."""
-        return [s for s in self.stats_cache.values() if s.is_degrading]
+        return [self.stats_cache[skill_id] for skill_id in self._degrading]
 
     def get_improving_skills(self) -> List[SkillPerformanceStats]:
         """Get list of improving skills."""
-        return [s for s in self.stats_cache.values() if s.is_improving]
+        return [self.stats_cache[skill_id] for skill_id in self._improving]
 
     def get_skill_gaps(self, min_priority: float = 0.3) -> List[SkillGap]:
         """Get skill gaps above priority threshold."""
@@ -400,9 +546,9 @@ class PerformanceTracker:
 
     async def get_performance_summary(self) -> Dict[str, Any]:
         """Get overall performance summary."""
-        total_executions = sum(s.total_executions for s in self.stats_cache.values())
-        total_successes = sum(s.successful_executions for s in self.stats_cache.values())
-        total_cost = sum(s.total_cost for s in self.stats_cache.values())
+        total_executions = self._total_executions
+        total_successes = self._total_successes
+        total_cost = self._total_cost
 
         return {
             "total_skills_tracked": len(self.stats_cache),
@@ -410,64 +556,115 @@ class PerformanceTracker:
             "overall_success_rate": total_successes / total_executions if total_executions > 0 else 0.0,
             "total_cost": total_cost,
             "avg_cost_per_execution": total_cost / total_executions if total_executions > 0 else 0.0,
-            "top_performers": len([s for s in self.stats_cache.values() if s.roi_score > 1.0]),
+            "top_performers": len(self._high_roi),
             "degrading_skills": len(self.get_degrading_skills()),
             "improving_skills": len(self.get_improving_skills()),
             "skill_gaps": len(self.skill_gaps),
             "high_priority_gaps": len(self.get_skill_gaps(min_priority=0.5))
         }
 
-    async def _store_execution(self, execution: SkillExecutionMetrics):
-        """Store execution in database."""
-        await self.learning_store.store_metric(
-            metric_type="skill_execution",
-            metric_name=execution.skill_id,
-            value=1.0 if execution.success else 0.0,
-            period_start=execution.timestamp,
-            period_end=execution.timestamp,
-            metadata={
+    def _schedule_flush(self):
+        """Start the background flusher if needed and wake it when the batch is full."""
+        if self._flush_task is None:
+            self._flush_event = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+        if len(self._pending_metrics) + len(self._dirty_stats) >= FLUSH_BATCH_SIZE:
+            self._flush_event.set()
+
+    async def _flush_loop(self):
+        """Flush buffered metrics until the buffer stays empty."""
+        try:
+            while self._pending_metrics or self._dirty_stats:
+                try:
+                    await asyncio.wait_for(self._flush_event.wait(), timeout=FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_event.clear()
+                await self._flush()
+        finally:
+            self._flush_task = None
+
+    async def _flush(self):
+        """Write all buffered execution and stats metrics in one batch."""
+        metrics = self._pending_metrics
+        metrics.extend(
+            self._stats_metric(self.stats_cache[skill_id])
+            for skill_id in self._dirty_stats
+            if skill_id in self.stats_cache
+        )
+        self._pending_metrics = []
+        self._dirty_stats = set()
+
+        if not metrics:
+            return
+
+        try:
+            await self.learning_store.store_metrics_batch(metrics)
+        except Exception as e:
+            logger.error(f"Error flushing {len(metrics)} skill metrics: {e}", exc_info=True)
+
+    def _execution_metric(self, execution: SkillExecutionMetrics) -> Dict[str, Any]:
+        """Build the learning store record for an execution."""
+        return {
+            "metric_type": "skill_execution",
+            "metric_name": execution.skill_id,
+            "value": 1.0 if execution.success else 0.0,
+            "period_start": execution.timestamp,
+            "period_end": execution.timestamp,
+            "metadata": {
                 "execution_id": execution.execution_id,
                 "execution_time": execution.execution_time,
                 "tokens_used": execution.tokens_used,
                 "cost_estimate": execution.cost_estimate,
                 "error_message": execution.error_message
             }
-        )
+        }
 
-    async def _store_stats(self, stats: SkillPerformanceStats):
-        """Store aggregated stats in database."""
+    def _stats_metric(self, stats: SkillPerformanceStats) -> Dict[str, Any]:
+        """Build the learning store record for aggregated stats."""
         # Convert stats to dict and handle datetime serialization
-        stats_dict = asdict(stats)
+        stats_dict = _stats_to_dict(stats)
         stats_dict["first_used"] = stats.first_used.isoformat() if stats.first_used else None
         stats_dict["last_used"] = stats.last_used.isoformat() if stats.last_used else None
 
-        await self.learning_store.store_metric(
-            metric_type="skill_performance",
-            metric_name=stats.skill_id,
-            value=stats.roi_score,
-            period_start=stats.first_used or datetime.now(),
-            period_end=stats.last_used or datetime.now(),
-            metadata=stats_dict
-        )
+        return {
+            "metric_type": "skill_performance",
+            "metric_name": stats.skill_id,
+            "value": stats.roi_score,
+            "period_start": stats.first_used or datetime.now(),
+            "period_end": stats.last_used or datetime.now(),
+            "metadata": stats_dict
+        }
 
     def _save_stats(self):
-        """Save stats to JSON file."""
+        """Save stats to JSON file (skipped when nothing changed)."""
+        if not self._stats_changed:
+            return
+
         try:
             stats_file = self.data_dir / "performance_stats.json"
 
-            data = {
-                skill_id: {
-                    **asdict(stats),
-                    "first_used": stats.first_used.isoformat() if stats.first_used else None,
-                    "last_used": stats.last_used.isoformat() if stats.last_used else None
-                }
-                for skill_id, stats in self.stats_cache.items()
-            }
-
-            with open(stats_file, 'w') as f:
-                json.dump(data, f, indent=2)
-
-            logger.debug(f"Saved {len(data)} skill stats")
+            # Compact output: the file is machine-read on every startup
+            if orjson is not None:
+                # orjson serializes dataclasses and datetimes natively
+                payload = orjson.dumps(self.stats_cache)
+            else:
+                payload = json.dumps(
+                    {skill_id: _stats_to_dict(stats) for skill_id, stats in self.stats_cache.items()},
+                    separators=(',', ':'),
+                    default=_json_default
+                ).encode()
+
+            # Write to a temp file and swap it in, so a crash mid-write
+            # never leaves a truncated stats file behind
+            tmp_file = stats_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            tmp_file.replace(stats_file)
+
+            self._stats_changed = False
+            logger.debug(f"Saved {len(self.stats_cache)} skill stats")
 
         except Exception as e:
             logger.error(f"Error saving stats: {e}", exc_info=True)
@@ -480,17 +677,26 @@ class PerformanceTracker:
             if not stats_file.exists():
                 return
 
-            with open(stats_file, 'r') as f:
-                data = json.load(f)
-
+            with open(stats_file, 'rb') as f:
+                raw = f.read()
+            data = None
+            if orjson is not None:
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # Files written by the stdlib encoder may contain Infinity
+                    pass
+            if data is None:
+                data = json.loads(raw)
+
+            # Build stats straight from the decoded entries in one pass
             for skill_id, stats_dict in data.items():
-                # Parse datetimes
-                if stats_dict.get("first_used"):
-                    stats_dict["first_used"] = datetime.fromisoformat(stats_dict["first_used"])
-                if stats_dict.get("last_used"):
-                    stats_dict["last_used"] = datetime.fromisoformat(stats_dict["last_used"])
-
-                self.stats_cache[skill_id] = SkillPerformanceStats(**stats_dict)
+                stats = self.stats_cache[skill_id] = _stats_from_dict(stats_dict)
+                self._total_executions += stats.total_executions
+                self._total_successes += stats.successful_executions
+                self._total_cost += stats.total_cost
+                self._track_roi(stats)
+                self._track_trend(stats)
 
             logger.info(f"Loaded {len(self.stats_cache)} skill stats")
 
@@ -499,5 +705,11 @@ class PerformanceTracker:
 
     async def cleanup(self):
         """Cleanup and persist data."""
+        # Wake the background flusher and let it drain the buffer
+        if self._flush_task is not None:
+            self._flush_event.set()
+            await self._flush_task
+        await self._flush()
+
         self._save_stats()
         logger.info("PerformanceTracker cleaned up")
@@ -7,10 +7,22 @@ Fast, rule-based classification to avoid unnecessary overhead.
 
 import logging
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Literal forms of COMMAND_INDICATORS / SIMPLE_PATTERNS for the ASCII fast path
+_COMMAND_PREFIXES = ('help', 'status', 'clear', 'quit', 'exit', 'skills', 'search skill')
+_SIMPLE_WORDS = frozenset({'hi', 'hello', 'hey', 'thanks', 'ok', 'yes', 'no'})
+_SHORT_WORD_RE = re.compile(r'\w{1,4}')
+
+# Confidence is capped at 1.0 once this many task patterns have matched
+_MAX_TASK_MATCHES = 2
+
+# Number of distinct queries whose classification is memoized
+_CLASSIFY_CACHE_SIZE = 1024
+
 
 class QueryClassifier:
     """
@@ -67,11 +79,30 @@ class QueryClassifier:
     ]
 
     def __init__(self):
-        # Compile regex patterns for performance
+        # Task/question indicators are searched one pattern at a time: each
+        # search gets re's own fast scan, and the loops can stop early.
+        # Anchored command/simple patterns are fused into one alternation each.
         self.task_patterns = [re.compile(p, re.IGNORECASE) for p in self.TASK_INDICATORS]
         self.question_patterns = [re.compile(p, re.IGNORECASE) for p in self.QUESTION_INDICATORS]
-        self.command_patterns = [re.compile(p, re.IGNORECASE) for p in self.COMMAND_INDICATORS]
-        self.simple_patterns = [re.compile(p, re.IGNORECASE) for p in self.SIMPLE_PATTERNS]
+        # ASCII queries can never match the CJK patterns, and the English ones
+        # behave identically with ASCII-only \w/\b and case folding
+        self._ascii_task_patterns = self._compile_ascii(self.TASK_INDICATORS)
+        self._ascii_question_patterns = self._compile_ascii(self.QUESTION_INDICATORS)
+        self.command_re = self._fuse(self.COMMAND_INDICATORS)
+        self.simple_re = self._fuse(self.SIMPLE_PATTERNS)
+
+        # classify() is pure, so repeated queries reuse the previous result
+        self._classify_cached = lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)(self._classify_impl)
+
+    @staticmethod
+    def _compile_ascii(patterns: List[str]) -> List[re.Pattern]:
+        """Compile the ASCII-only patterns with ASCII matching semantics."""
+        return [re.compile(p, re.IGNORECASE | re.ASCII) for p in patterns if p.isascii()]
+
+    @staticmethod
+    def _fuse(patterns: List[str]) -> re.Pattern:
+        """Compile patterns into a single alternation."""
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
 
     def classify(self, query: str) -> Dict[str, any]:
         """
@@ -88,73 +119,78 @@ class QueryClassifier:
                 'confidence': float (0-1)
             }
         """
+        query_type, needs_skill_matching, confidence = self._classify_cached(query)
+        return {
+            'type': query_type,
+            'needs_skill_matching': needs_skill_matching,
+            'confidence': confidence
+        }
+
+    def _classify_impl(self, query: str) -> Tuple[str, bool, float]:
+        """Classify a query, returning (type, needs_skill_matching, confidence)."""
         if not query or not query.strip():
-            return {
-                'type': 'simple',
-                'needs_skill_matching': False,
-                'confidence': 1.0
-            }
+            return 'simple', False, 1.0
 
         query = query.strip()
 
+        is_ascii = query.isascii()
+        if is_ascii:
+            # Plain string checks are enough for ASCII input
+            query_lower = query.lower()
+            is_command = self._is_ascii_command(query_lower)
+            is_simple = not is_command and (
+                query_lower in _SIMPLE_WORDS
+                or (len(query) <= 4 and _SHORT_WORD_RE.fullmatch(query) is not None)
+            )
+        else:
+            # All command/simple patterns are ^-anchored, so match() suffices
+            is_command = self.command_re.match(query) is not None
+            is_simple = not is_command and self.simple_re.match(query) is not None
+
         # Check for system commands first
-        if self._matches_any(query, self.command_patterns):
-            return {
-                'type': 'command',
-                'needs_skill_matching': False,
-                'confidence': 1.0
-            }
+        if is_command:
+            return 'command', False, 1.0
 
         # Check for simple queries
-        if self._matches_any(query, self.simple_patterns):
-            return {
-                'type': 'simple',
-                'needs_skill_matching': False,
-                'confidence': 1.0
-            }
+        if is_simple:
+            return 'simple', False, 1.0
 
         # Check for task indicators
-        task_matches = sum(1 for p in self.task_patterns if p.search(query))
-
-        # Check for question indicators
-        question_matches = sum(1 for p in self.question_patterns if p.search(query))
+        task_matches = 0
+        for pattern in (self._ascii_task_patterns if is_ascii else self.task_patterns):
+            if pattern.search(query):
+                task_matches += 1
+                if task_matches >= _MAX_TASK_MATCHES:
+                    break
 
         # Decision logic
         if task_matches > 0:
             # Strong task signals
             confidence = min(0.6 + (task_matches * 0.2), 1.0)
-            return {
-                'type': 'task',
-                'needs_skill_matching': True,
-                'confidence': confidence
-            }
+            return 'task', True, confidence
 
-        if question_matches > 0:
+        # Question indicators only matter when no task indicator matched
+        question_patterns = self._ascii_question_patterns if is_ascii else self.question_patterns
+        if any(p.search(query) for p in question_patterns):
             # Question pattern detected
-            return {
-                'type': 'question',
-                'needs_skill_matching': False,
-                'confidence': 0.8
-            }
+            return 'question', False, 0.8
 
         # Default: treat as question if short, task if longer
         if len(query) < 30:
-            return {
-                'type': 'question',
-                'needs_skill_matching': False,
-                'confidence': 0.5
-            }
+            return 'question', False, 0.5
         else:
             # Longer queries might be complex tasks
-            return {
-                'type': 'task',
-                'needs_skill_matching': True,
-                'confidence': 0.4
-            }
-
-    def _matches_any(self, text: str, patterns: List[re.Pattern]) -> bool:
-        """Check if text matches any pattern in list."""
-        return any(p.search(text) for p in patterns)
+            return 'task', True, 0.4
+
+    @staticmethod
+    def _is_ascii_command(query_lower: str) -> bool:
+        """Equivalent of COMMAND_INDICATORS for a stripped, lowercased ASCII query."""
+        for prefix in _COMMAND_PREFIXES:
+            if query_lower.startswith(prefix):
+                rest = query_lower[len(prefix):len(prefix) + 1]
+                # Same word boundary as the regex's trailing \b
+                return not rest or not (rest.isalnum() or rest == '_')
+        return False
 
     def is_task_query(self, query: str) -> bool:
         """Quick check if query is task-oriented."""
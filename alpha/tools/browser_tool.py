@@ -8,14 +8,76 @@ Phase: 4.3 - Browser Automation
 Requirements: REQ-4.5, REQ-4.6, REQ-4.7, REQ-4.8
 """
 
+import asyncio
+import importlib.util
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+import time
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 from alpha.tools.registry import Tool, ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Probed once: find_spec locates the package without importing it
+_PLAYWRIGHT_OK = importlib.util.find_spec("playwright") is not None
+
+# Actions whose Playwright call already waits for their selector to be actionable
+_AUTO_WAIT_ACTIONS = frozenset({"click", "fill_input"})
+
+# Seconds that queued extract_text calls wait to share one evaluate() call
+EXTRACT_BATCH_WINDOW = 0.005
+
+# Reads the text of each selector's first match: null when nothing matches, and
+# {error} when querySelector rejects the selector (Playwright-only syntax such as
+# text=, xpath= or >> chains), so one bad selector does not fail the batch
+_BATCH_EXTRACT_JS = (
+    "sels => sels.map(s => { try { const el = document.querySelector(s); "
+    "return el ? el.innerText : null; } catch (e) { return {error: String(e)}; } })"
+)
+
+
+# alpha.browser_automation, imported on first use so the tool can be
+# registered without the browser automation stack
+_browser_automation = None
+
+
+def _load_browser_automation():
+    """Return the alpha.browser_automation package, importing it once."""
+    global _browser_automation
+    if _browser_automation is None:
+        import alpha.browser_automation
+        _browser_automation = alpha.browser_automation
+    return _browser_automation
+
+
+@lru_cache(maxsize=32)
+def _session_config(browser_type: str, headless: bool, timeout_ms: int):
+    """Shared SessionConfig for a (browser, headless, timeout) combination."""
+    SessionConfig = _load_browser_automation().SessionConfig
+    return SessionConfig(browser_type=browser_type, headless=headless, timeout=timeout_ms)
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserRequest:
+    """Parameters of a single BrowserTool call (see BrowserTool.execute)."""
+    action: str
+    url: Optional[str] = None
+    selector: Optional[str] = None
+    selectors: Optional[Dict[str, str]] = None
+    data: Optional[Dict[str, str]] = None
+    value: Optional[str] = None
+    script: Optional[str] = None
+    wait_for: Optional[str] = None
+    timeout: int = 30
+    headless: bool = True
+    browser: str = "chromium"
+    full_page: bool = False
+    require_approval: bool = True
+    session_id: Optional[str] = None
+    new_tab: bool = False
+
 
 class BrowserTool(Tool):
     """
@@ -68,6 +130,40 @@ class BrowserTool(Tool):
     - Script execution validation
     """
 
+    # action -> (handler method, parameters passed after the session,
+    #            required parameters as (name, error when missing, must be a dict))
+    _ACTIONS = {
+        "navigate": ("_execute_navigate", ("url", "timeout", "wait_for"), (
+            ("url", "Missing required parameter: url", False),
+        )),
+        "click": ("_execute_click", ("selector", "timeout"), (
+            ("selector", "Missing required parameter for click: selector", False),
+        )),
+        "fill_form": ("_execute_fill_form", ("data", "timeout"), (
+            ("data", "Missing or invalid required parameter: data (must be dict)", True),
+        )),
+        "fill_input": ("_execute_fill_input", ("selector", "value", "timeout"), (
+            ("selector", "Missing required parameter: selector", False),
+            ("value", "Missing required parameter: value", False),
+        )),
+        "extract_data": ("_execute_extract_data", ("selectors",), (
+            ("selectors", "Missing or invalid required parameter: selectors (must be dict)", True),
+        )),
+        "extract_text": ("_execute_extract_text", ("selector",), (
+            ("selector", "Missing required parameter for extract_text: selector", False),
+        )),
+        "extract_table": ("_execute_extract_table", ("selector",), (
+            ("selector", "Missing required parameter: selector", False),
+        )),
+        "screenshot": ("_execute_screenshot", ("full_page", "selector"), ()),
+        "execute_script": ("_execute_script", ("script",), (
+            ("script", "Missing required parameter: script", False),
+        )),
+        "back": ("_execute_back", (), ()),
+        "forward": ("_execute_forward", (), ()),
+        "reload": ("_execute_reload", (), ()),
+    }
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the Browser Automation Tool.
@@ -94,14 +190,25 @@ class BrowserTool(Tool):
         # Track if Playwright is available
         self._playwright_available: Optional[bool] = None
 
-        # Statistics
-        self._stats = {
-            "total_executions": 0,
-            "successful_actions": 0,
-            "failed_actions": 0,
-            "sessions_created": 0,
-            "screenshots_captured": 0
-        }
+        # Read once: when approval is disabled globally, execute skips the approval step
+        self._approval_required = self.config.get("security", {}).get("require_approval", True)
+
+        # Opt-in coalescing of concurrent extract_text calls per page. Batched
+        # calls read the DOM as it is and do not wait for their selector to
+        # become visible, unlike the unbatched executor.extract_text.
+        self._batch_extracts = self.config.get("batch_extracts", False)
+        # page -> (selectors queued so far, task that reads them all)
+        self._pending_extracts: Dict[Any, Tuple[List[str], asyncio.Task]] = {}
+
+        # Background launch of the pool.prelaunch browsers (see warm_up)
+        self._warm_up_task: Optional[asyncio.Task] = None
+
+        # Statistics (plain attributes; get_statistics() builds the dict)
+        self._total_executions = 0
+        self._successful_actions = 0
+        self._failed_actions = 0
+        self._sessions_created = 0
+        self._screenshots_captured = 0
 
         logger.info("BrowserTool initialized")
 
@@ -110,36 +217,36 @@ class BrowserTool(Tool):
         Lazily initialize browser automation components on first use.
 
         This allows the tool to be registered even if Playwright is not available,
-        providing graceful error messages at execution time.
+        providing graceful error messages at execution time. Also starts the
+        background pre-launch of the ``pool.prelaunch`` browsers.
         """
+        self._init_components()
+        self._start_warm_up()
+
+    def _init_components(self) -> None:
+        """Create the browser automation components, once."""
         if self._session_manager is not None:
             return  # Already initialized
 
         logger.info("Initializing browser automation components")
 
         try:
-            from alpha.browser_automation import (
-                SessionManager,
-                PageNavigator,
-                ActionExecutor,
-                PageValidator,
-                ScreenshotManager
-            )
+            ba = _load_browser_automation()
 
             # Initialize components
-            self._session_manager = SessionManager(self.config)
-            self._validator = PageValidator(self.config)
-            self._screenshot_manager = ScreenshotManager(self.config)
-            self._navigator = PageNavigator(self._validator, self.config)
-            self._executor = ActionExecutor(
-                navigator=self._navigator,
-                validator=self._validator,
+            self._session_manager = ba.SessionManager(self.config)
+            self._validator = ba.PageValidator(self.config)
+            self._screenshot_manager = ba.ScreenshotManager(self.config)
+            self._navigator = ba.PageNavigator(self._validator, self.config)
+            self._executor = ba.ActionExecutor(
+                page_navigator=self._navigator,
+                page_validator=self._validator,
                 screenshot_manager=self._screenshot_manager,
                 config=self.config
             )
 
             # Check Playwright availability
-            self._playwright_available = self._session_manager.is_available()
+            self._playwright_available = _PLAYWRIGHT_OK
 
             if not self._playwright_available:
                 logger.warning("Playwright not available - browser automation will fail at runtime")
@@ -150,6 +257,40 @@ class BrowserTool(Tool):
             logger.error(f"Failed to initialize browser automation components: {e}")
             raise
 
+    def start_warm_up(self) -> None:
+        """
+        Pre-launch the ``pool.prelaunch`` browsers, initializing components first.
+
+        Called at registration so the launch overlaps startup instead of
+        delaying the first action. Without ``pool.prelaunch`` or Playwright
+        this does nothing, leaving the browser stack unimported until first
+        use. Without a running event loop the launch is deferred to the first
+        action.
+        """
+        if not _PLAYWRIGHT_OK or not self.config.get("pool", {}).get("prelaunch"):
+            return
+
+        try:
+            self._ensure_components_initialized()
+        except Exception as e:
+            logger.warning(f"Browser warm-up skipped: {e}")
+
+    def _start_warm_up(self) -> None:
+        """Schedule warm_up() in the background once, if browsers are configured."""
+        if (
+            self._warm_up_task is not None
+            or not self._playwright_available
+            or not self.config.get("pool", {}).get("prelaunch")
+        ):
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Retried on the first action
+
+        self._warm_up_task = loop.create_task(self.warm_up())
+
     async def execute(
         self,
         action: str,
@@ -166,6 +307,7 @@ class BrowserTool(Tool):
         full_page: bool = False,
         require_approval: bool = True,
         session_id: Optional[str] = None,
+        new_tab: bool = False,
         **kwargs
     ) -> ToolResult:
         """
@@ -193,6 +335,7 @@ class BrowserTool(Tool):
             full_page: Capture full page screenshot - default: False
             require_approval: Require user approval - default: True
             session_id: Existing session ID to reuse (optional)
+            new_tab: Open a fresh page in the reused session - default: False
             **kwargs: Additional parameters
 
         Returns:
@@ -225,14 +368,43 @@ class BrowserTool(Tool):
             ...     selectors={"title": "h1", "price": ".price"}
             ... )
         """
-        logger.info(f"Browser tool called with action={action}")
-        self._stats["total_executions"] += 1
+        return await self.execute_request(BrowserRequest(
+            action=action,
+            url=url,
+            selector=selector,
+            selectors=selectors,
+            data=data,
+            value=value,
+            script=script,
+            wait_for=wait_for,
+            timeout=timeout,
+            headless=headless,
+            browser=browser,
+            full_page=full_page,
+            require_approval=require_approval,
+            session_id=session_id,
+            new_tab=new_tab
+        ))
+
+    async def execute_request(self, request: BrowserRequest) -> ToolResult:
+        """
+        Execute a browser action described by a BrowserRequest.
+
+        Args:
+            request: Action and its parameters
+
+        Returns:
+            ToolResult with action output and metadata
+        """
+        action = request.action
+        logger.info("Browser tool called with action=%s", action)
+        self._total_executions += 1
 
         try:
             # Step 1: Validate parameters
-            validation_error = self._validate_parameters(action, url, selector, selectors, data, value, script)
+            validation_error = self._validate_parameters(request)
             if validation_error:
-                self._stats["failed_actions"] += 1
+                self._failed_actions += 1
                 return ToolResult(
                     success=False,
                     output=None,
@@ -244,7 +416,7 @@ class BrowserTool(Tool):
             try:
                 self._ensure_components_initialized()
             except Exception as e:
-                self._stats["failed_actions"] += 1
+                self._failed_actions += 1
                 return ToolResult(
                     success=False,
                     output=None,
@@ -254,7 +426,7 @@ class BrowserTool(Tool):
 
             # Step 3: Check Playwright availability
             if not self._playwright_available:
-                self._stats["failed_actions"] += 1
+                self._failed_actions += 1
                 return ToolResult(
                     success=False,
                     output=None,
@@ -263,15 +435,10 @@ class BrowserTool(Tool):
                 )
 
             # Step 4: User approval (if required)
-            if require_approval:
-                approved = await self._request_approval(action, {
-                    "url": url,
-                    "selector": selector,
-                    "data": data,
-                    "browser": browser
-                })
+            if request.require_approval and self._approval_required:
+                approved = await self._request_approval(request)
                 if not approved:
-                    self._stats["failed_actions"] += 1
+                    self._failed_actions += 1
                     return ToolResult(
                         success=False,
                         output=None,
@@ -280,84 +447,63 @@ class BrowserTool(Tool):
                     )
 
             # Step 5: Get or create session
-            from alpha.browser_automation import SessionConfig
-            session_config = SessionConfig(
-                browser_type=browser,
-                headless=headless,
-                timeout=timeout * 1000  # Convert to milliseconds
+            session_config = _session_config(
+                request.browser,
+                request.headless,
+                request.timeout * 1000  # Convert to milliseconds
             )
 
-            session = await self._get_or_create_session(session_id, session_config)
+            session = await self._get_or_create_session(
+                request.session_id, session_config, new_tab=request.new_tab
+            )
             current_session_id = session.session_id
 
             # Step 6: Execute action
-            action_result = None
-
-            if action == "navigate":
-                action_result = await self._execute_navigate(session, url, timeout)
-
-            elif action == "click":
-                action_result = await self._execute_click(session, selector, timeout)
-
-            elif action == "fill_form":
-                action_result = await self._execute_fill_form(session, data, timeout)
-
-            elif action == "fill_input":
-                action_result = await self._execute_fill_input(session, selector, value, timeout)
-
-            elif action == "extract_data":
-                action_result = await self._execute_extract_data(session, selectors)
-
-            elif action == "extract_text":
-                action_result = await self._execute_extract_text(session, selector)
-
-            elif action == "extract_table":
-                action_result = await self._execute_extract_table(session, selector)
-
-            elif action == "screenshot":
-                action_result = await self._execute_screenshot(session, full_page, selector)
-
-            elif action == "execute_script":
-                action_result = await self._execute_script(session, script)
-
-            elif action == "back":
-                action_result = await self._execute_back(session)
-
-            elif action == "forward":
-                action_result = await self._execute_forward(session)
-
-            elif action == "reload":
-                action_result = await self._execute_reload(session)
-
-            else:
-                self._stats["failed_actions"] += 1
-                return ToolResult(
-                    success=False,
-                    output=None,
-                    error=f"Unknown action: {action}",
-                    metadata={"action": action}
-                )
+            handler_name, param_names, _ = self._ACTIONS[action]
+            action_result = await getattr(self, handler_name)(
+                session, *(getattr(request, name) for name in param_names)
+            )
 
-            # Step 7: Wait for selector if specified
-            if wait_for and action_result.success:
+            # Step 7: Wait for selector if specified, unless the action itself
+            # already waited for that same selector
+            if (
+                request.wait_for
+                and action_result.success
+                and not (request.wait_for == request.selector and action in _AUTO_WAIT_ACTIONS)
+            ):
                 try:
-                    await self._navigator.wait_for_selector(session.page, wait_for, timeout=timeout)
+                    ready = await self._navigator.wait_for_selector(
+                        session.page, request.wait_for,
+                        timeout=request.timeout * 1000  # Convert to milliseconds
+                    )
                 except Exception as e:
-                    logger.warning(f"Wait for selector failed: {e}")
+                    logger.warning("Wait for selector failed: %s", e)
+                    ready = False
+
+                if not ready and action == "navigate":
+                    # navigate stopped at domcontentloaded because wait_for was
+                    # to signal readiness; without it, wait for the full load
+                    action_result = await self._wait_for_load(
+                        session.page, action_result, request.timeout
+                    )
 
             # Step 8: Update statistics and return result
             if action_result.success:
-                self._stats["successful_actions"] += 1
+                self._successful_actions += 1
                 if action == "screenshot":
-                    self._stats["screenshots_captured"] += 1
+                    self._screenshots_captured += 1
             else:
-                self._stats["failed_actions"] += 1
+                self._failed_actions += 1
 
             return self._format_result(action_result, action, current_session_id)
 
         except Exception as e:
-            logger.error(f"Browser tool execution failed: {e}", exc_info=True)
-            self._stats["failed_actions"] += 1
+            # Tracebacks only at debug level; formatting them is costly under error bursts
+            logger.error(
+                "Browser tool execution failed: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            self._failed_actions += 1
             return ToolResult(
                 success=False,
                 output=None,
@@ -365,64 +511,40 @@ class BrowserTool(Tool):
                 metadata={"action": action}
             )
 
-    def _validate_parameters(
-        self,
-        action: str,
-        url: Optional[str],
-        selector: Optional[str],
-        selectors: Optional[Dict],
-        data: Optional[Dict],
-        value: Optional[str],
-        script: Optional[str]
-    ) -> Optional[str]:
+    def _validate_parameters(self, request: BrowserRequest) -> Optional[str]:
         """
-        Validate parameters for the specified action.
+        Validate parameters for the requested action.
 
         Returns:
             Error message if validation fails, None otherwise
         """
-        if action == "navigate":
-            if not url:
-                return "Missing required parameter: url"
-
-        elif action in ["click", "extract_text"]:
-            if not selector:
-                return f"Missing required parameter for {action}: selector"
-
-        elif action == "fill_form":
-            if not data or not isinstance(data, dict):
-                return "Missing or invalid required parameter: data (must be dict)"
-
-        elif action == "fill_input":
-            if not selector:
-                return "Missing required parameter: selector"
-            if not value:
-                return "Missing required parameter: value"
-
-        elif action == "extract_data":
-            if not selectors or not isinstance(selectors, dict):
-                return "Missing or invalid required parameter: selectors (must be dict)"
+        spec = self._ACTIONS.get(request.action)
+        if spec is None:
+            return f"Unknown action: {request.action}"
 
-        elif action == "execute_script":
-            if not script:
-                return "Missing required parameter: script"
-
-        elif action == "extract_table":
-            if not selector:
-                return "Missing required parameter: selector"
-
-        elif action not in ["screenshot", "back", "forward", "reload"]:
-            return f"Unknown action: {action}"
+        for name, error, must_be_dict in spec[2]:
+            param = getattr(request, name)
+            if not param or (must_be_dict and not isinstance(param, dict)):
+                return error
 
         return None
 
-    async def _get_or_create_session(self, session_id: Optional[str], config) -> Any:
+    async def _get_or_create_session(
+        self,
+        session_id: Optional[str],
+        config,
+        new_tab: bool = False
+    ) -> Any:
         """
         Get an existing session or create a new one.
 
+        A reused session keeps its page across actions; a new page is only
+        opened when new_tab is requested or the previous page was closed.
+
         Args:
             session_id: Optional existing session ID
             config: SessionConfig object
+            new_tab: Open a fresh page in a reused session
 
         Returns:
             BrowserSession instance
@@ -431,24 +553,62 @@ class BrowserTool(Tool):
             # Try to get existing session
             session = await self._session_manager.get_session(session_id)
             if session:
-                logger.info(f"Reusing existing session: {session_id}")
+                logger.info("Reusing existing session: %s", session_id)
+                if new_tab or session.page.is_closed():
+                    session.page = await session.context.new_page()
                 return session
             else:
-                logger.warning(f"Session {session_id} not found, creating new session")
+                logger.warning("Session %s not found, creating new session", session_id)
 
         # Create new session
         session = await self._session_manager.create_session(config)
-        self._stats["sessions_created"] += 1
-        logger.info(f"Created new browser session: {session.session_id}")
+        self._sessions_created += 1
+        logger.info("Created new browser session: %s", session.session_id)
         return session
 
-    async def _request_approval(self, action: str, details: Dict) -> bool:
+    async def warm_up(self) -> None:
+        """
+        Pre-launch the browsers listed in the ``pool.prelaunch`` config.
+
+        Browsers are shared by all sessions of the same type, so after warm-up
+        the first action only pays for a new browser context, not a browser launch.
+        """
+        pool_config = self.config.get("pool", {})
+        browser_types = pool_config.get("prelaunch", [])
+        if not browser_types:
+            return
+
+        self._init_components()
+        if not self._playwright_available:
+            return
+
+        try:
+            await self._session_manager.warm_up(
+                browser_types,
+                headless=pool_config.get("headless", True)
+            )
+            logger.info(f"Pre-launched browsers: {', '.join(browser_types)}")
+        except Exception as e:
+            logger.warning(f"Browser warm-up failed: {e}")
+
+    async def cleanup(self) -> None:
+        """Close all sessions and shut down the shared browsers."""
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+            try:
+                await self._warm_up_task
+            except asyncio.CancelledError:
+                pass
+
+        if self._session_manager is not None:
+            await self._session_manager.cleanup_all_sessions()
+
+    async def _request_approval(self, request: BrowserRequest) -> bool:
         """
         Request user approval for the action.
 
         Args:
-            action: Action to approve
-            details: Action details
+            request: Request to approve
 
         Returns:
             True if approved, False otherwise
@@ -456,24 +616,51 @@ class BrowserTool(Tool):
         # For now, auto-approve all actions
         # In production, this would prompt the user
         # Check security config
-        security_config = self.config.get("security", {})
-        if not security_config.get("require_approval", True):
+        if not self._approval_required:
             return True
 
         # Check if action requires approval
-        if not self._validator.should_require_approval(action, details):
+        details = {
+            "url": request.url,
+            "selector": request.selector,
+            "data": request.data,
+            "browser": request.browser
+        }
+        if not self._validator.should_require_approval(request.action, details):
             return True
 
         # TODO: Implement actual user approval prompt
         # For now, auto-approve
-        logger.info(f"User approval requested for action: {action}")
+        logger.info("User approval requested for action: %s", request.action)
         return True
 
     # Action execution methods
 
-    async def _execute_navigate(self, session, url: str, timeout: int):
-        """Execute navigate action."""
-        return await self._navigator.navigate(session.page, url, timeout=timeout)
+    async def _execute_navigate(self, session, url: str, timeout: int, wait_for: Optional[str]):
+        """Execute navigate action (timeout in seconds)."""
+        # With a wait_for selector as the readiness signal, waiting for the full
+        # load event (images, iframes) as well only adds latency
+        wait_until = "domcontentloaded" if wait_for else "load"
+        return await self._navigator.navigate(
+            session.page, url, wait_until=wait_until, timeout=timeout * 1000
+        )
+
+    async def _wait_for_load(self, page, navigation_result, timeout: int):
+        """
+        Wait for the load event after a navigation whose wait_for selector failed.
+
+        Returns:
+            The navigation result, marked failed if the page never finishes loading
+        """
+        try:
+            await page.wait_for_load_state("load", timeout=timeout * 1000)
+        except Exception as e:
+            return replace(
+                navigation_result,
+                success=False,
+                error=f"Page did not finish loading after wait_for selector failed: {e}"
+            )
+        return navigation_result
 
     async def _execute_click(self, session, selector: str, timeout: int):
         """Execute click action."""
@@ -493,8 +680,73 @@ class BrowserTool(Tool):
 
     async def _execute_extract_text(self, session, selector: str):
         """Execute extract_text action."""
+        if self._batch_extracts:
+            return await self._extract_text_batched(session.page, selector)
         return await self._executor.extract_text(session.page, selector)
 
+    async def _extract_text_batched(self, page, selector: str):
+        """
+        Extract text through a per-page batch shared with concurrent calls.
+
+        The first call on a page starts a flush task that waits
+        EXTRACT_BATCH_WINDOW for others to join, then reads every queued
+        selector in one page.evaluate() round-trip. No caller owns the flush:
+        each awaits it through asyncio.shield, so cancelling one caller does
+        not affect the others.
+
+        Unlike executor.extract_text, a batched read does not wait for the
+        element to become visible; an element missing at flush time fails.
+        Selectors that document.querySelector rejects fall back to the
+        unbatched path, which understands Playwright selector syntax.
+        """
+        ActionResult = _load_browser_automation().ActionResult
+
+        start_time = time.time()
+        pending = self._pending_extracts.get(page)
+        if pending is None:
+            selectors = []
+            flush = asyncio.create_task(self._flush_extracts(page, selectors))
+            # Mark a failure as seen even if every caller was cancelled
+            flush.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._pending_extracts[page] = (selectors, flush)
+        else:
+            selectors, flush = pending
+        index = len(selectors)
+        selectors.append(selector)
+
+        try:
+            text = (await asyncio.shield(flush))[index]
+            if isinstance(text, dict):
+                logger.debug("Selector not batchable (%s): %s", text.get("error"), selector)
+                return await self._executor.extract_text(page, selector)
+            if text is None:
+                raise RuntimeError(f"Element not found: {selector}")
+        except Exception as e:
+            return ActionResult(
+                success=False,
+                action="extract_text",
+                error=f"Failed to extract text from '{selector}': {e}",
+                execution_time=time.time() - start_time,
+                metadata={"selector": selector, "exception_type": type(e).__name__}
+            )
+
+        return ActionResult(
+            success=True,
+            action="extract_text",
+            data={"selector": selector, "text": text, "length": len(text)},
+            execution_time=time.time() - start_time,
+            metadata={"selector": selector, "text_length": len(text), "batch_size": len(selectors)}
+        )
+
+    async def _flush_extracts(self, page, selectors: List[str]) -> List[Any]:
+        """Read the texts of a page's queued selectors after the batch window."""
+        try:
+            await asyncio.sleep(EXTRACT_BATCH_WINDOW)
+        finally:
+            # Calls arriving from now on start a new batch
+            self._pending_extracts.pop(page, None)
+        return await page.evaluate(_BATCH_EXTRACT_JS, selectors)
+
     async def _execute_extract_table(self, session, selector: str):
         """Execute extract_table action."""
         return await self._executor.extract_table(session.page, selector)
@@ -538,7 +790,8 @@ class BrowserTool(Tool):
         metadata = {
             "action": action,
             "session_id": session_id,
-            "timestamp": datetime.now().isoformat()
+            # Epoch nanoseconds; cheaper than formatting an ISO string per action
+            "timestamp": time.time_ns()
         }
 
         # Add action-specific metadata
@@ -563,13 +816,14 @@ class BrowserTool(Tool):
         Returns:
             Dictionary of statistics
         """
+        total = self._total_executions
         return {
-            **self._stats,
-            "success_rate": (
-                self._stats["successful_actions"] / self._stats["total_executions"]
-                if self._stats["total_executions"] > 0
-                else 0.0
-            )
+            "total_executions": total,
+            "successful_actions": self._successful_actions,
+            "failed_actions": self._failed_actions,
+            "sessions_created": self._sessions_created,
+            "screenshots_captured": self._screenshots_captured,
+            "success_rate": self._successful_actions / total if total > 0 else 0.0
         }
 
     def is_available(self) -> bool:
@@ -579,8 +833,4 @@ class BrowserTool(Tool):
         Returns:
             True if Playwright is installed
         """
-        try:
-            import playwright
-            return True
-        except ImportError:
-            return False
+        return _PLAYWRIGHT_OK
@@ -4,17 +4,94 @@ Image Analysis Tool
 Provides image understanding capabilities through vision-capable LLMs.
 """
 
+import asyncio
+import hashlib
+import io
+import json
 import logging
-from typing import List, Dict, Any, Union, Optional
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Union, Optional, Tuple
 from pathlib import Path
 
 from alpha.tools.registry import Tool, ToolResult
 from alpha.multimodal.image_processor import ImageProcessor
 from alpha.multimodal.image_encoder import ImageEncoder
-from alpha.llm.vision_provider import ClaudeVisionProvider
+from alpha.llm.vision_provider import ClaudeVisionProvider, VisionResponse
+
+# Optional SIMD-accelerated base64 codec (same API as the standard module)
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# Optional fast JSON codec for cached analyses
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Number of encoded images kept in memory when caching is enabled
+ENCODED_CACHE_SIZE = 128
+
+# Bounds on the on-disk analysis cache: entries older than the age limit are
+# ignored and removed, and the oldest entries are evicted beyond the count limit
+RESPONSE_CACHE_MAX_ENTRIES = 1000
+RESPONSE_CACHE_MAX_AGE = 30 * 24 * 3600
+
+# Keywords looked for in "ui" and "document" analyses (first match wins for documents)
+UI_KEYWORDS = ("button", "menu", "icon", "error", "dialog", "form")
+DOCUMENT_TYPES = ("invoice", "receipt", "contract", "form", "letter")
+
+_DIGIT_RE = re.compile(r"\d")
+
+# Formats sent to the vision API as-is; anything else is encoded as PNG
+API_IMAGE_FORMATS = {"JPEG", "PNG", "GIF", "WEBP"}
+
+# File signatures of the formats in API_IMAGE_FORMATS
+_MAGIC_SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+)
+
+# Re-encoding quality for JPEG sources
+JPEG_QUALITY = 85
+
+# Per-thread encode buffer, reused across images prepared by the same worker;
+# buffers that grew beyond the cap are released instead of kept
+_encode_buffers = threading.local()
+MAX_RETAINED_BUFFER = 8 * 1024 * 1024
+
+# Longer-edge size the vision API scales images down to; JPEGs are decoded
+# at the smallest scale that still covers it
+ANALYSIS_MAX_DIMENSION = 1568
+
+# Analysis types where each image is described on its own; multiple images
+# are analyzed with concurrent single-image requests instead of one batch
+INDEPENDENT_ANALYSIS_TYPES = frozenset({"general", "ocr", "ui", "document"})
+RESPONSE_SEPARATOR = "\n\n---\n\n"
+
+# Images whose every channel varies by less than this are treated as a single
+# solid color (blank pages, empty screenshots) and not sent to the API
+SOLID_COLOR_TOLERANCE = 4
+
+
+def _detect_image_format(data: bytes) -> Optional[str]:
+    """Identify an API image format from the file's leading bytes, if any."""
+    for signature, image_format in _MAGIC_SIGNATURES:
+        if data.startswith(signature):
+            return image_format
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "WEBP"
+    return None
+
 
 class ImageAnalysisTool(Tool):
     """
@@ -37,13 +114,57 @@ class ImageAnalysisTool(Tool):
         "document": "Analyze this document. Extract key information including any text, numbers, dates, and structure. Identify the document type if possible.",
     }
 
-    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022"):
+    _VALID_TYPES = frozenset(ANALYSIS_PROMPTS)
+
+    # Parameter schema, built once and shared by every get_schema() call
+    _SCHEMA = {
+        "type": "object",
+        "properties": {
+            "image_path": {
+                "type": ["string", "array"],
+                "description": "Path to image file or list of image paths",
+                "items": {"type": "string"},
+            },
+            "analysis_type": {
+                "type": "string",
+                "enum": list(ANALYSIS_PROMPTS),
+                "default": "general",
+                "description": "Type of analysis to perform",
+            },
+            "question": {
+                "type": "string",
+                "description": "Optional specific question about the image(s)",
+            },
+            "max_images": {
+                "type": "integer",
+                "default": 5,
+                "minimum": 1,
+                "maximum": 10,
+                "description": "Maximum number of images to process",
+            },
+        },
+        "required": ["image_path"],
+    }
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-3-5-sonnet-20241022",
+        cache_enabled: bool = False,
+        cache_dir: Optional[Path] = None,
+        cache_max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        cache_max_age: float = RESPONSE_CACHE_MAX_AGE,
+    ):
         """
         Initialize ImageAnalysisTool
 
         Args:
             api_key: Anthropic API key
             model: Vision-capable model to use
+            cache_enabled: Reuse encodings and analyses of identical image content
+            cache_dir: Directory for cached analyses (default: ~/.alpha/image_analysis_cache)
+            cache_max_entries: Maximum number of cached analyses kept on disk
+            cache_max_age: Seconds after which a cached analysis expires
         """
         super().__init__(
             name="image_analysis",
@@ -54,6 +175,14 @@ class ImageAnalysisTool(Tool):
         self.vision_provider = ClaudeVisionProvider(api_key=api_key, model=model)
         self.logger = logger
 
+        # Caches keyed by SHA-256 of the image file contents:
+        # encoded images in memory (LRU), analysis results on disk
+        self.cache_enabled = cache_enabled
+        self.cache_dir = cache_dir or Path.home() / ".alpha" / "image_analysis_cache"
+        self.cache_max_entries = cache_max_entries
+        self.cache_max_age = cache_max_age
+        self._encoded_cache: "OrderedDict[str, Tuple[str, str, bool]]" = OrderedDict()
+
     async def execute(
         self,
         image_path: Union[str, List[str]],
@@ -97,30 +226,71 @@ class ImageAnalysisTool(Tool):
                     error="No images provided"
                 )
 
-            # Load and encode images
-            encoded_images = []
-            for path in image_paths:
-                path_obj = Path(path)
-
-                if not path_obj.exists():
+            # Read each file once: the bytes feed both the cache key and decoding
+            files = await asyncio.gather(
+                *(asyncio.to_thread(self._read_image_file, path) for path in image_paths),
+                return_exceptions=True,
+            )
+            for path, result in zip(image_paths, files):
+                if isinstance(result, FileNotFoundError):
                     return ToolResult(
                         success=False,
                         output=None,
                         error=f"Image not found: {path}"
                     )
+                if isinstance(result, BaseException):
+                    raise result
+            contents = [data for data, _ in files]
+            digests = [digest for _, digest in files]
+
+            # Identical content + request was analyzed before: skip decoding,
+            # encoding and the API call
+            response_key = None
+            if self.cache_enabled:
+                response_key = self._response_cache_key(digests, analysis_type, question)
+                cached = await asyncio.to_thread(self._read_cached_response, response_key)
+                if cached is not None:
+                    self.logger.info(f"Image analysis cache hit: {response_key[:12]}")
+                    # The stored spend was paid by the original call, not this one
+                    cached.update(cost_usd=0.0, tokens_used=0, cached=True)
+                    return ToolResult(
+                        success=True,
+                        output=cached,
+                        metadata={
+                            "analysis_type": analysis_type,
+                            "images_count": cached["images_analyzed"],
+                            "cost_usd": 0.0,
+                            "cached": True,
+                        }
+                    )
 
-                # Load, validate, and optimize image
-                image = self.processor.load_image(str(path_obj))
-                self.processor.validate_image(image)
-                optimized = self.processor.optimize_image(image)
-
-                # Encode to base64
-                base64_data = self.encoder.encode_image(optimized)
-                media_type = f"image/{image.format.lower()}"
-
-                encoded_images.append((base64_data, media_type))
-
-                self.logger.info(f"Loaded and encoded image: {path}")
+            # Load and encode images; images missing from the cache are
+            # prepared in worker threads concurrently (PIL releases the GIL)
+            prepared_images: List[Optional[Tuple[str, str, bool]]] = []
+            for digest in digests:
+                encoded = self._encoded_cache.get(digest) if digest else None
+                if encoded is not None:
+                    self._encoded_cache.move_to_end(digest)
+                prepared_images.append(encoded)
+
+            misses = [i for i, encoded in enumerate(prepared_images) if encoded is None]
+            prepared = await asyncio.gather(*(
+                asyncio.to_thread(self._prepare_image, image_paths[i], contents[i])
+                for i in misses
+            ))
+            for i, encoded in zip(misses, prepared):
+                prepared_images[i] = encoded
+                if digests[i]:
+                    self._encoded_cache[digests[i]] = encoded
+                    if len(self._encoded_cache) > ENCODED_CACHE_SIZE:
+                        self._encoded_cache.popitem(last=False)
+
+            # Nothing to see in solid-color images: answer without the API
+            # (a user question is always sent)
+            if not question and all(solid for _, _, solid in prepared_images):
+                return self._solid_color_result(analysis_type, len(prepared_images))
+
+            encoded_images = [(data, media_type) for data, media_type, _ in prepared_images]
 
             # Build analysis prompt
             if question:
@@ -136,6 +306,7 @@ class ImageAnalysisTool(Tool):
                 prompt = self.ANALYSIS_PROMPTS["general"]
 
             # Add context for multiple images
+            base_prompt = prompt
             if len(encoded_images) > 1:
                 prompt = f"[Analyzing {len(encoded_images)} images] {prompt}"
 
@@ -150,6 +321,9 @@ class ImageAnalysisTool(Tool):
                     prompt=prompt,
                     media_type=encoded_images[0][1],
                 )
+            elif analysis_type in INDEPENDENT_ANALYSIS_TYPES and not question:
+                # Images don't need to be seen together: analyze them concurrently
+                response = await self._analyze_each(encoded_images, base_prompt)
             else:
                 response = await self.vision_provider.analyze_images(
                     images=encoded_images, prompt=prompt
@@ -181,6 +355,9 @@ class ImageAnalysisTool(Tool):
                 f"cost: ${response.cost_usd:.4f}"
             )
 
+            if response_key is not None:
+                await asyncio.to_thread(self._write_cached_response, response_key, result_data)
+
             return ToolResult(
                 success=True,
                 output=result_data,
@@ -199,6 +376,207 @@ class ImageAnalysisTool(Tool):
                 error=f"Image analysis failed: {str(e)}"
             )
 
+    async def _analyze_each(
+        self, encoded_images: List[Tuple[str, str]], prompt: str
+    ) -> VisionResponse:
+        """
+        Analyze images with one concurrent request each and combine the results
+
+        Args:
+            encoded_images: List of (base64, media_type) tuples
+            prompt: Analysis prompt applied to every image
+
+        Returns:
+            VisionResponse with per-image analyses joined in input order and
+            token and cost totals summed
+        """
+        responses = await asyncio.gather(*(
+            self.vision_provider.analyze_image(
+                image_base64=image_base64, prompt=prompt, media_type=media_type
+            )
+            for image_base64, media_type in encoded_images
+        ))
+
+        return VisionResponse(
+            content=RESPONSE_SEPARATOR.join(r.content for r in responses),
+            model=responses[0].model,
+            tokens_used=sum(r.tokens_used for r in responses),
+            # Surface any non-normal stop (e.g. max_tokens) from a single image
+            finish_reason=next(
+                (r.finish_reason for r in responses if r.finish_reason != "end_turn"),
+                responses[0].finish_reason,
+            ),
+            input_tokens=sum(r.input_tokens for r in responses),
+            output_tokens=sum(r.output_tokens for r in responses),
+            cost_usd=sum(r.cost_usd for r in responses),
+        )
+
+    def _read_image_file(self, path: str) -> Tuple[bytes, Optional[str]]:
+        """Read an image file, hashing its contents when caching is enabled."""
+        with open(path, "rb") as f:
+            # Reject oversized files before reading them into memory
+            self.processor.check_file_size(os.fstat(f.fileno()).st_size)
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest() if self.cache_enabled else None
+        return data, digest
+
+    def _prepare_image(self, path: str, data: bytes) -> Tuple[str, str, bool]:
+        """
+        Load, validate, optimize and encode one image
+
+        Args:
+            path: Image file path (for messages)
+            data: Image file contents
+
+        Returns:
+            Tuple of (base64 data, media type, whether the image is a solid color)
+        """
+        image = self.processor.load_image_bytes(
+            data, name=str(path), max_dimension=ANALYSIS_MAX_DIMENSION
+        )
+        self.processor.validate_image(image)
+        solid = self._is_solid_color(image)
+
+        # Encode once in the format that is sent; only images that come out
+        # too large are resized and encoded again
+        image_format = _detect_image_format(data) or "PNG"
+        buffer = self._encode_to_buffer(image, image_format)
+        encoded_size = buffer.tell()
+        if encoded_size > self.processor.OPTIMIZE_THRESHOLD:
+            optimized = self.processor.optimize_image(image, current_size=encoded_size)
+            buffer = self._encode_to_buffer(optimized, image_format)
+
+        with buffer.getbuffer() as view:
+            base64_data = _b64.b64encode(view[:buffer.tell()]).decode("ascii")
+        if max(encoded_size, buffer.tell()) > MAX_RETAINED_BUFFER:
+            _encode_buffers.buffer = None
+        media_type = f"image/{image_format.lower()}"
+
+        self.logger.info(f"Loaded and encoded image: {path}")
+        return base64_data, media_type, solid
+
+    @staticmethod
+    def _is_solid_color(image) -> bool:
+        """Check whether every channel of an image stays within SOLID_COLOR_TOLERANCE."""
+        if image.mode == "P":
+            # Extrema of a palette image are palette indices, not colors
+            image = image.convert("RGBA")
+        extrema = image.getextrema()
+        if not isinstance(extrema[0], tuple):
+            # Single-band images return one (min, max) pair
+            extrema = (extrema,)
+        return all(high - low < SOLID_COLOR_TOLERANCE for low, high in extrema)
+
+    def _solid_color_result(self, analysis_type: str, num_images: int) -> ToolResult:
+        """Build the analysis result for images that are all a single solid color."""
+        description = (
+            "Blank or solid-color image" if num_images == 1
+            else f"All {num_images} images are blank or solid-color"
+        )
+        result_data = {
+            "description": description,
+            "analysis_type": analysis_type,
+            "images_analyzed": num_images,
+            "confidence": 1.0,
+            "cost_usd": 0.0,
+            "model_used": "local-fastpath",
+            "tokens_used": 0,
+            # No text or UI elements to report
+            "structured_data": self._parse_response("", analysis_type, num_images),
+        }
+        if analysis_type == "ocr":
+            result_data["extracted_text"] = ""
+
+        self.logger.info(f"Skipped vision API for {num_images} solid-color image(s)")
+        return ToolResult(
+            success=True,
+            output=result_data,
+            metadata={
+                "analysis_type": analysis_type,
+                "images_count": num_images,
+                "cost_usd": 0.0,
+            }
+        )
+
+    @staticmethod
+    def _encode_to_buffer(image, image_format: str) -> io.BytesIO:
+        """Encode an image into this thread's reusable buffer."""
+        buffer = getattr(_encode_buffers, "buffer", None)
+        if buffer is None:
+            buffer = _encode_buffers.buffer = io.BytesIO()
+        buffer.seek(0)
+
+        if image_format == "JPEG":
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            # No optimize=True: a second Huffman pass for a few percent
+            image.save(buffer, format="JPEG", quality=JPEG_QUALITY)
+        else:
+            image.save(buffer, format=image_format)
+        return buffer
+
+    def _response_cache_key(
+        self, digests: List[str], analysis_type: str, question: Optional[str]
+    ) -> str:
+        """Key for an analysis of the given image contents and request."""
+        parts = [self.vision_provider.model, analysis_type, question or "", *digests]
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _read_cached_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a cached analysis result, or None if absent, expired or unreadable (blocking)."""
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_max_age:
+                cache_file.unlink(missing_ok=True)
+                return None
+            with open(cache_file, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            return None
+
+    def _write_cached_response(self, key: str, result_data: Dict[str, Any]) -> None:
+        """Persist an analysis result (blocking); failures only disable caching of this result."""
+        cache_file = self.cache_dir / f"{key}.json"
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(result_data)
+            else:
+                payload = json.dumps(result_data, ensure_ascii=False).encode("utf-8")
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+            tmp_file.replace(cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Failed to cache image analysis: {e}")
+            return
+
+        self._prune_response_cache()
+
+    def _prune_response_cache(self) -> None:
+        """Remove expired cache entries, then the oldest ones beyond the entry limit (blocking)."""
+        entries = []
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((cache_file.stat().st_mtime, cache_file))
+            except OSError:
+                continue  # Removed concurrently
+
+        entries.sort()
+        cutoff = time.time() - self.cache_max_age
+        excess = len(entries) - self.cache_max_entries
+        for i, (mtime, cache_file) in enumerate(entries):
+            if i >= excess and mtime >= cutoff:
+                break
+            try:
+                cache_file.unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.warning(f"Failed to evict cache entry {cache_file}: {e}")
+
     def _parse_response(
         self, content: str, analysis_type: str, num_images: int
     ) -> Dict[str, Any]:
@@ -230,21 +608,23 @@ class ImageAnalysisTool(Tool):
         elif analysis_type == "chart":
             # Try to extract numeric insights
             # (Basic implementation - could use regex for numbers)
-            data["contains_numbers"] = any(char.isdigit() for char in content)
+            data["contains_numbers"] = _DIGIT_RE.search(content) is not None
 
         elif analysis_type == "ui":
             # Check for common UI keywords
-            ui_keywords = ["button", "menu", "icon", "error", "dialog", "form"]
+            content_folded = content.casefold()
             data["ui_elements_mentioned"] = [
-                kw for kw in ui_keywords if kw in content.lower()
+                kw for kw in UI_KEYWORDS if kw in content_folded
             ]
 
         elif analysis_type == "document":
             # Document metadata hints
-            doc_types = ["invoice", "receipt", "contract", "form", "letter"]
-            detected_types = [dt for dt in doc_types if dt in content.lower()]
-            if detected_types:
-                data["document_type"] = detected_types[0]
+            content_folded = content.casefold()
+            document_type = next(
+                (dt for dt in DOCUMENT_TYPES if dt in content_folded), None
+            )
+            if document_type:
+                data["document_type"] = document_type
 
         return data
 
@@ -265,9 +645,7 @@ class ImageAnalysisTool(Tool):
             raise ToolExecutionError("Missing required parameter: image_path")
 
         analysis_type = kwargs.get("analysis_type", "general")
-        valid_types = list(self.ANALYSIS_PROMPTS.keys())
-
-        if analysis_type not in valid_types:
+        if analysis_type not in self._VALID_TYPES:
             self.logger.warning(
                 f"Unknown analysis type '{analysis_type}', will use 'general'"
             )
@@ -280,33 +658,6 @@ class ImageAnalysisTool(Tool):
         Get tool parameter schema
 
         Returns:
-            JSON schema for tool parameters
+            JSON schema for tool parameters (shared; do not modify)
         """
-        return {
-            "type": "object",
-            "properties": {
-                "image_path": {
-                    "type": ["string", "array"],
-                    "description": "Path to image file or list of image paths",
-                    "items": {"type": "string"},
-                },
-                "analysis_type": {
-                    "type": "string",
-                    "enum": list(self.ANALYSIS_PROMPTS.keys()),
-                    "default": "general",
-                    "description": "Type of analysis to perform",
-                },
-                "question": {
-                    "type": "string",
-                    "description": "Optional specific question about the image(s)",
-                },
-                "max_images": {
-                    "type": "integer",
-                    "default": 5,
-                    "minimum": 1,
-                    "maximum": 10,
-                    "description": "Maximum number of images to process",
-                },
-            },
-            "required": ["image_path"],
-        }
+        return self._SCHEMA
@@ -899,6 +899,17 @@ class ToolRegistry:
         """Get tool by name."""
         return self.tools.get(tool_name)
 
+    async def close(self):
+        """Release resources held by registered tools (browsers, sessions)."""
+        for tool in self.tools.values():
+            cleanup = getattr(tool, "cleanup", None)
+            if cleanup is None:
+                continue
+            try:
+                await cleanup()
+            except Exception as e:
+                logger.error(f"Error cleaning up tool {tool.name}: {e}")
+
     def list_tools(self) -> List[Dict[str, str]]:
         """List all registered tools."""
         return [
@@ -1000,6 +1011,8 @@ def create_default_registry(llm_service=None, config=None) -> ToolRegistry:
             browser_tool = BrowserTool(browser_config)
             if browser_tool.is_available():
                 registry.register(browser_tool)
+                # Launch any pool.prelaunch browsers while the rest of startup runs
+                browser_tool.start_warm_up()
                 logger.info("BrowserTool registered successfully")
             else:
                 logger.warning("BrowserTool not available (Playwright not installed)")
@@ -1027,7 +1040,11 @@ def create_default_registry(llm_service=None, config=None) -> ToolRegistry:
         if is_enabled and api_key:
             # Use model from config or default to claude-3-5-sonnet
             model = multimodal_config.get('vision_model', 'claude-3-5-sonnet-20241022')
-            image_tool = ImageAnalysisTool(api_key=api_key, model=model)
+            image_tool = ImageAnalysisTool(
+                api_key=api_key,
+                model=model,
+                cache_enabled=multimodal_config.get('analysis_cache', False)
+            )
             registry.register(image_tool)
             logger.info("ImageAnalysisTool registered successfully")
         elif is_enabled and not api_key:
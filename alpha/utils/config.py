@@ -5,21 +5,29 @@ Load and manage configuration from YAML files and environment variables.
 """
 
 import os
+import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Individual model configuration."""
     max_tokens: int = 4096
     temperature: float = 0.7
-    difficulty_range: List[str] = None
+    difficulty_range: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMProviderConfig:
     """LLM provider configuration."""
     api_key: str
@@ -29,17 +37,17 @@ class LLMProviderConfig:
     temperature: float = 0.7
     default_model: str = None
     auto_select_model: bool = False
-    models: Dict[str, ModelConfig] = None
+    models: Dict[str, ModelConfig] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMConfig:
     """LLM configuration."""
     default_provider: str
     providers: Dict[str, LLMProviderConfig]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VectorMemoryConfig:
     """Vector memory configuration."""
     enabled: bool = False
@@ -47,11 +55,11 @@ class VectorMemoryConfig:
     model: str = None
     persist_directory: str = "data/vector_memory"
     max_context_tokens: int = 4000
-    retrieval: Dict = None
-    cleanup: Dict = None
+    retrieval: Dict = field(default_factory=dict)
+    cleanup: Dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MemoryConfig:
     """Memory configuration."""
     database: str
@@ -59,14 +67,14 @@ class MemoryConfig:
     vector_memory: VectorMemoryConfig = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolsConfig:
     """Tools configuration."""
     enabled: List[str]
     sandbox: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterfaceConfig:
     """Interface configuration."""
     cli_enabled: bool = True
@@ -75,7 +83,7 @@ class InterfaceConfig:
     api_port: int = 8000
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Main configuration."""
     name: str
@@ -101,13 +109,15 @@ def load_config(config_path: str = "config.yaml") -> Config:
     """
     config_file = Path(config_path)
 
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_file, 'r') as f:
-        raw_config = yaml.safe_load(f)
+    raw_config = _parse_config_file(str(config_file.resolve()), stat.st_mtime_ns, stat.st_size)
 
-    # Replace environment variables
+    # Replace environment variables (builds new containers, so the cached
+    # parse is never modified)
     raw_config = _replace_env_vars(raw_config)
 
     # Parse configuration
@@ -122,23 +132,24 @@ def load_config(config_path: str = "config.yaml") -> Config:
     providers = {}
     for name, provider_data in llm_config.get('providers', {}).items():
         # Parse model configurations if present
-        models_config = None
-        if 'models' in provider_data:
-            models_config = {}
-            for model_name, model_data in provider_data['models'].items():
-                models_config[model_name] = ModelConfig(
-                    max_tokens=model_data.get('max_tokens', 4096),
-                    temperature=model_data.get('temperature', 0.7),
-                    difficulty_range=model_data.get('difficulty_range', [])
-                )
-
-            # Remove 'models' from provider_data before creating LLMProviderConfig
-            provider_data_copy = provider_data.copy()
-            provider_data_copy.pop('models')
-            provider_data_copy['models'] = models_config
-            providers[name] = LLMProviderConfig(**provider_data_copy)
-        else:
-            providers[name] = LLMProviderConfig(**provider_data)
+        models_config = {}
+        for model_name, model_data in (provider_data.get('models') or {}).items():
+            models_config[model_name] = ModelConfig(
+                max_tokens=model_data.get('max_tokens', 4096),
+                temperature=model_data.get('temperature', 0.7),
+                difficulty_range=tuple(model_data.get('difficulty_range', ()))
+            )
+
+        providers[name] = LLMProviderConfig(
+            api_key=provider_data['api_key'],
+            model=provider_data.get('model'),
+            base_url=provider_data.get('base_url'),
+            max_tokens=provider_data.get('max_tokens', 4096),
+            temperature=provider_data.get('temperature', 0.7),
+            default_model=provider_data.get('default_model'),
+            auto_select_model=provider_data.get('auto_select_model', False),
+            models=models_config
+        )
 
     # Parse vector memory configuration
     vector_memory_cfg = None
@@ -188,37 +199,54 @@ def load_config(config_path: str = "config.yaml") -> Config:
     )
 
 
+# A whole-string ${VAR} or ${VAR:-fallback} reference (the fallback may nest)
+_ENV_REF_RE = re.compile(r'\$\{(.*?)(?::-(.*))?\}', re.DOTALL)
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(abs_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML config file.
+
+    Memoized on the file's modification time and size, so an edited file is
+    parsed again. Environment variables are substituted by the caller, after
+    the cache, so they are always read fresh.
+    """
+    with open(abs_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def _replace_env_vars(config: dict) -> dict:
     """
     Replace ${VAR} with environment variables.
     Supports fallback syntax: ${VAR1:-${VAR2}} or ${VAR1:-default}
     """
-    if isinstance(config, dict):
+    if isinstance(config, str):
+        return _resolve_env_ref(config)
+    elif isinstance(config, dict):
         return {k: _replace_env_vars(v) for k, v in config.items()}
     elif isinstance(config, list):
         return [_replace_env_vars(item) for item in config]
-    elif isinstance(config, str) and config.startswith('${') and config.endswith('}'):
-        # Extract variable expression
-        expr = config[2:-1]
-
-        # Handle fallback syntax: VAR1:-VAR2 or VAR1:-default
-        if ':-' in expr:
-            primary_var, fallback = expr.split(':-', 1)
-            # Try primary variable first
-            value = os.environ.get(primary_var)
-            if value:
-                return value
-            # If fallback is also a variable reference
-            if fallback.startswith('${') and fallback.endswith('}'):
-                return _replace_env_vars(fallback)
-            else:
-                # Try fallback as environment variable
-                fallback_value = os.environ.get(fallback)
-                return fallback_value if fallback_value else fallback
-        else:
-            # Simple variable reference
-            value = os.environ.get(expr)
-            # Return value if found, otherwise return empty string for optional vars
-            return value if value else ""
     else:
         return config
+
+
+def _resolve_env_ref(value: str) -> str:
+    """Resolve a string that is entirely a ${...} reference; other strings are returned as-is."""
+    match = _ENV_REF_RE.fullmatch(value)
+    if match is None:
+        return value
+
+    # Handle fallback syntax: VAR1:-VAR2 or VAR1:-default
+    var_name, fallback = match.groups()
+    env_value = os.environ.get(var_name)
+    if env_value:
+        return env_value
+    if fallback is None:
+        # Return empty string for optional vars
+        return ""
+    if _ENV_REF_RE.fullmatch(fallback):
+        # Fallback is itself a variable reference
+        return _resolve_env_ref(fallback)
+    # Try fallback as environment variable, then as a literal default
+    return os.environ.get(fallback) or fallback
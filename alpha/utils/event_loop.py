@@ -0,0 +1,36 @@
+"""
+Event Loop Setup
+
+Selects the fastest available asyncio event loop implementation. Browser
+automation talks to Playwright over a WebSocket, so socket I/O on the loop
+is on the hot path of every browser action.
+"""
+
+import asyncio
+import logging
+
+# Optional libuv-based event loop (installed with uvicorn[standard])
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Use uvloop for event loops created after this call, if it is installed.
+
+    Must be called before asyncio.run(); a loop that is already running
+    is not affected.
+
+    Returns:
+        True if uvloop was installed, False if the default loop is kept
+    """
+    if uvloop is None:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
@@ -13,10 +13,6 @@ from .definition import (
     WorkflowStep,
     WorkflowParameter,
     WorkflowTrigger,
-    ParameterType,
-    TriggerType,
-    StepErrorStrategy,
-    RetryConfig,
 )
 
 
@@ -113,10 +109,11 @@ class WorkflowBuilder:
         Returns:
             WorkflowDefinition
         """
-        # Extract steps from task history
+        # Extract steps and parameters from task history, building the
+        # definition objects directly rather than going through build()
         steps = []
         parameters = []
-        param_values = {}
+        param_names = set()
 
         for i, task in enumerate(task_history):
             # Create step from task
@@ -131,17 +128,17 @@ class WorkflowBuilder:
                 if self._is_parameterizable(value):
                     # Create parameter
                     param_name = f"{key}_{i + 1}"
-                    param_values[param_name] = value
 
                     # Add to parameters if not already present
-                    if not any(p["name"] == param_name for p in parameters):
+                    if param_name not in param_names:
+                        param_names.add(param_name)
                         parameters.append(
-                            {
+                            WorkflowParameter.from_dict({
                                 "name": param_name,
                                 "type": self._infer_type(value),
                                 "default": value,
                                 "description": f"Parameter for {key} in {tool}",
-                            }
+                            })
                         )
 
                     step_params[key] = f"{{{{{param_name}}}}}"
@@ -149,22 +146,19 @@ class WorkflowBuilder:
                     step_params[key] = value
 
             steps.append(
-                {
-                    "id": step_id,
-                    "tool": tool,
-                    "action": action,
-                    "parameters": step_params,
-                    "on_error": "abort",
-                }
+                WorkflowStep(
+                    id=step_id, tool=tool, action=action, parameters=step_params
+                )
             )
 
-        return self.build(
+        return WorkflowDefinition(
             name=name,
-            description=description or f"Workflow created from {len(task_history)} tasks",
-            steps=steps,
-            parameters=parameters,
             version=version,
+            description=description or f"Workflow created from {len(task_history)} tasks",
+            author="user",
             tags=["auto-generated"],
+            parameters=parameters,
+            steps=steps,
         )
 
     def build_simple(
@@ -184,66 +178,32 @@ class WorkflowBuilder:
         Returns:
             WorkflowDefinition
         """
-        steps = []
-
-        for i, (tool, action, params) in enumerate(tool_actions):
-            steps.append(
-                {
-                    "id": f"step_{i + 1}",
-                    "tool": tool,
-                    "action": action,
-                    "parameters": params or {},
-                    "on_error": "abort",
-                }
+        steps = [
+            WorkflowStep(
+                id=f"step_{i + 1}", tool=tool, action=action, parameters=params or {}
             )
+            for i, (tool, action, params) in enumerate(tool_actions)
+        ]
 
-        return self.build(
+        return WorkflowDefinition(
             name=name,
+            version="1.0.0",
             description=description or f"Simple workflow with {len(steps)} steps",
+            author="user",
             steps=steps,
         )
 
     def _build_step(self, step_data: Dict[str, Any]) -> WorkflowStep:
         """Build WorkflowStep from dictionary"""
-        retry = None
-        if "retry" in step_data:
-            retry = RetryConfig(**step_data["retry"])
-
-        return WorkflowStep(
-            id=step_data["id"],
-            tool=step_data["tool"],
-            action=step_data["action"],
-            parameters=step_data.get("parameters", {}),
-            on_error=StepErrorStrategy(step_data.get("on_error", "abort")),
-            retry=retry,
-            depends_on=step_data.get("depends_on", []),
-            condition=step_data.get("condition"),
-            fallback_step=step_data.get("fallback_step"),
-        )
+        return WorkflowStep.from_dict(step_data)
 
     def _build_parameter(self, param_data: Dict[str, Any]) -> WorkflowParameter:
-        """Build WorkflowParameter from dictionary"""
-        param_type = param_data.get("type", "string")
-        if isinstance(param_type, str):
-            param_type = ParameterType(param_type)
-
-        return WorkflowParameter(
-            name=param_data["name"],
-            type=param_type,
-            default=param_data.get("default"),
-            description=param_data.get("description", ""),
-            required=param_data.get("required", False),
-        )
+        """Build WorkflowParameter from dictionary (type defaults to string)"""
+        return WorkflowParameter.from_dict({"type": "string", **param_data})
 
     def _build_trigger(self, trigger_data: Dict[str, Any]) -> WorkflowTrigger:
-        """Build WorkflowTrigger from dictionary"""
-        trigger_type = trigger_data.get("type", "manual")
-        if isinstance(trigger_type, str):
-            trigger_type = TriggerType(trigger_type)
-
-        return WorkflowTrigger(
-            type=trigger_type, config=trigger_data.get("config", {})
-        )
+        """Build WorkflowTrigger from dictionary (type defaults to manual)"""
+        return WorkflowTrigger.from_dict({"type": "manual", **trigger_data})
 
     def _is_parameterizable(self, value: Any) -> bool:
         """Check if value should be parameterized"""
@@ -4,11 +4,11 @@ CLI Workflow Commands
 Provides command-line interface for workflow management.
 """
 
+import re
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from alpha.workflow import (
     WorkflowLibrary,
@@ -18,6 +18,95 @@ from alpha.workflow import (
 )
 
 
+# An integer, or (in group 1) a decimal or scientific-notation float
+_NUMBER_RE = re.compile(r"-?\d+|(-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)")
+
+
+def _parse_parameter_value(value: str):
+    """Infer the type of a key=value parameter value from the command line."""
+    match = _NUMBER_RE.fullmatch(value)
+    if match:
+        return int(value) if match.group(1) is None else float(value)
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    return value
+
+
+_HELP_TEXT = """
+[bold cyan]Workflow Commands[/bold cyan]
+
+[bold]List workflows:[/bold]
+  workflow list [--tags TAG1,TAG2] [--search QUERY]
+
+[bold]Show workflow details:[/bold]
+  workflow show <name>
+
+[bold]Run workflow:[/bold]
+  workflow run <name> [param1=value1] [param2=value2] ...
+
+[bold]Create workflow:[/bold]
+  workflow create
+
+[bold]Delete workflow:[/bold]
+  workflow delete <name>
+
+[bold]Show execution history:[/bold]
+  workflow history <name>
+
+[bold]Export workflow:[/bold]
+  workflow export <name> [file_path]
+
+[bold]Import workflow:[/bold]
+  workflow import <file_path>
+
+[bold]Examples:[/bold]
+  workflow list --tags production
+  workflow show "Deploy Pipeline"
+  workflow run "Deploy Pipeline" environment=staging branch=main
+  workflow create
+  workflow export "Deploy Pipeline" deploy.json
+"""
+
+# (header, Table.add_column options) for the workflow list and history tables
+_WORKFLOW_COLUMNS = (
+    ("Name", {"style": "cyan", "no_wrap": True}),
+    ("Version", {"style": "green"}),
+    ("Description", {"style": "white"}),
+    ("Tags", {"style": "magenta"}),
+    ("Steps", {"justify": "right", "style": "blue"}),
+    ("Executions", {"justify": "right", "style": "yellow"}),
+)
+_HISTORY_COLUMNS = (
+    ("Execution ID", {"style": "cyan"}),
+    ("Status", {"style": "green"}),
+    ("Started", {"style": "white"}),
+    ("Duration", {"style": "yellow"}),
+)
+
+# Execution status colors in the history table (anything else is yellow)
+_STATUS_COLORS = {"completed": "green", "failed": "red"}
+
+
+@lru_cache(maxsize=1)
+def _help_panel():
+    """Build the help panel once; its markup is parsed a single time."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(Text.from_markup(_HELP_TEXT), title="Workflow Help", border_style="cyan")
+
+
+def _make_table(title: str, columns: tuple):
+    """Create a rich Table with the given column definitions."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
 class WorkflowCLI:
     """
     CLI handler for workflow commands
@@ -29,6 +118,18 @@ class WorkflowCLI:
     - Managing workflows
     """
 
+    # Subcommand -> async handler method taking the remaining arguments
+    _SUBCOMMANDS = {
+        "list": "list_workflows",
+        "show": "show_workflow",
+        "run": "run_workflow",
+        "create": "create_workflow",
+        "delete": "delete_workflow",
+        "history": "show_history",
+        "export": "export_workflow",
+        "import": "import_workflow",
+    }
+
     def __init__(
         self,
         library: Optional[WorkflowLibrary] = None,
@@ -60,30 +161,17 @@ class WorkflowCLI:
         Returns:
             True if command was handled, False otherwise
         """
-        parts = command.strip().split(maxsplit=1)
-        if not parts:
+        subcommand, _, args = command.strip().partition(" ")
+        if not subcommand:
             self.show_help()
             return True
 
-        subcommand = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
-
-        if subcommand == "list":
-            await self.list_workflows(args)
-        elif subcommand == "show":
-            await self.show_workflow(args)
-        elif subcommand == "run":
-            await self.run_workflow(args)
-        elif subcommand == "create":
-            await self.create_workflow(args)
-        elif subcommand == "delete":
-            await self.delete_workflow(args)
-        elif subcommand == "history":
-            await self.show_history(args)
-        elif subcommand == "export":
-            await self.export_workflow(args)
-        elif subcommand == "import":
-            await self.import_workflow(args)
+        subcommand = subcommand.lower()
+        args = args.lstrip()
+
+        handler = self._SUBCOMMANDS.get(subcommand)
+        if handler is not None:
+            await getattr(self, handler)(args)
         elif subcommand == "help":
             self.show_help()
         else:
@@ -107,33 +195,30 @@ class WorkflowCLI:
             elif args.startswith("--search"):
                 search = args.split("--search")[1].strip()
 
-        workflows = self.library.list(tags=tags, search=search)
+        # Rows are added as the library yields them, so only the table (not
+        # every parsed definition) is held at once
+        table = None
 
-        if not workflows:
-            self.console.print("[yellow]No workflows found[/yellow]")
-            return
-
-        table = Table(title="📋 Workflows")
-        table.add_column("Name", style="cyan", no_wrap=True)
-        table.add_column("Version", style="green")
-        table.add_column("Description", style="white")
-        table.add_column("Tags", style="magenta")
-        table.add_column("Steps", justify="right", style="blue")
-        table.add_column("Executions", justify="right", style="yellow")
-
-        for workflow in workflows:
+        for workflow in self.library.iter_list(tags=tags, search=search):
+            if table is None:
+                table = _make_table("📋 Workflows", _WORKFLOW_COLUMNS)
             tags_str = ", ".join(workflow.tags) if workflow.tags else "-"
+            description = workflow.description
+            if len(description) > 50:
+                description = description[:50] + "..."
             table.add_row(
                 workflow.name,
                 workflow.version,
-                workflow.description[:50] + "..."
-                if len(workflow.description) > 50
-                else workflow.description,
+                description,
                 tags_str,
                 str(len(workflow.steps)),
                 "-",  # TODO: Get execution count from library
             )
 
+        if table is None:
+            self.console.print("[yellow]No workflows found[/yellow]")
+            return
+
         self.console.print(table)
 
     async def show_workflow(self, name: str):
@@ -148,56 +233,64 @@ class WorkflowCLI:
             self.console.print(f"[red]Workflow not found:[/red] {name}")
             return
 
-        # Display workflow details
-        self.console.print()
-        self.console.print(
-            Panel(
-                f"[bold cyan]{workflow.name}[/bold cyan] v{workflow.version}",
-                title="Workflow",
-                expand=False,
-            )
-        )
+        from rich.console import Group
+        from rich.panel import Panel
+
+        # Collect every line and print them as one group, so the console is
+        # locked and flushed once rather than once per line
+        lines = []
+        add = lines.append
 
-        self.console.print(f"\n[bold]Description:[/bold] {workflow.description}")
-        self.console.print(f"[bold]Author:[/bold] {workflow.author}")
-        self.console.print(f"[bold]Tags:[/bold] {', '.join(workflow.tags)}")
-        self.console.print(f"[bold]Created:[/bold] {workflow.created_at}")
+        add(f"\n[bold]Description:[/bold] {workflow.description}")
+        add(f"[bold]Author:[/bold] {workflow.author}")
+        add(f"[bold]Tags:[/bold] {', '.join(workflow.tags)}")
+        add(f"[bold]Created:[/bold] {workflow.created_at}")
 
         # Parameters
         if workflow.parameters:
-            self.console.print("\n[bold]Parameters:[/bold]")
+            add("\n[bold]Parameters:[/bold]")
             for param in workflow.parameters:
                 default_str = (
                     f" (default: {param.default})" if param.default else ""
                 )
                 required_str = " [red]*required*[/red]" if param.required else ""
-                self.console.print(
-                    f"  • {param.name} ({param.type.value}){default_str}{required_str}"
-                )
+                add(f"  • {param.name} ({param.type.value}){default_str}{required_str}")
                 if param.description:
-                    self.console.print(f"    {param.description}")
+                    add(f"    {param.description}")
 
         # Steps
-        self.console.print("\n[bold]Steps:[/bold]")
+        add("\n[bold]Steps:[/bold]")
         for i, step in enumerate(workflow.steps, 1):
             deps_str = (
                 f" (depends on: {', '.join(step.depends_on)})"
                 if step.depends_on
                 else ""
             )
-            self.console.print(f"  {i}. [{step.id}] {step.tool}.{step.action}{deps_str}")
-            self.console.print(
-                f"     Error handling: {step.on_error.value}"
-            )
+            add(f"  {i}. [{step.id}] {step.tool}.{step.action}{deps_str}")
+            add(f"     Error handling: {step.on_error.value}")
 
         # Triggers
         if workflow.triggers:
-            self.console.print("\n[bold]Triggers:[/bold]")
+            add("\n[bold]Triggers:[/bold]")
             for trigger in workflow.triggers:
-                self.console.print(f"  • {trigger.type.value}")
+                add(f"  • {trigger.type.value}")
                 if trigger.config:
                     for key, value in trigger.config.items():
-                        self.console.print(f"    {key}: {value}")
+                        add(f"    {key}: {value}")
+
+        # Display workflow details
+        render_str = self.console.render_str
+        self.console.print(
+            Group(
+                "",
+                Panel(
+                    f"[bold cyan]{workflow.name}[/bold cyan] v{workflow.version}",
+                    title="Workflow",
+                    expand=False,
+                ),
+                *[render_str(line) for line in lines],
+            )
+        )
 
     async def run_workflow(self, args: str):
         """Run a workflow"""
@@ -212,17 +305,9 @@ class WorkflowCLI:
         # Parse parameters (key=value format)
         parameters = {}
         for part in parts[1:]:
-            if "=" in part:
-                key, value = part.split("=", 1)
-                # Try to infer type
-                if value.isdigit():
-                    parameters[key] = int(value)
-                elif value.replace(".", "", 1).isdigit():
-                    parameters[key] = float(value)
-                elif value.lower() in ["true", "false"]:
-                    parameters[key] = value.lower() == "true"
-                else:
-                    parameters[key] = value
+            key, sep, value = part.partition("=")
+            if sep:
+                parameters[key] = _parse_parameter_value(value)
 
         # Get workflow
         workflow = self.library.get(name)
@@ -239,6 +324,8 @@ class WorkflowCLI:
             for key, value in parameters.items():
                 self.console.print(f"  • {key} = {value}")
 
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -386,27 +473,17 @@ class WorkflowCLI:
             self.console.print(f"[yellow]No execution history for workflow:[/yellow] {name}")
             return
 
-        table = Table(title=f"📜 Execution History: {name}")
-        table.add_column("Execution ID", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Started", style="white")
-        table.add_column("Duration", style="yellow")
+        table = _make_table(f"📜 Execution History: {name}", _HISTORY_COLUMNS)
 
         for execution in history:
             # Calculate duration if both timestamps exist
             duration = "-"
             if execution.get("started_at") and execution.get("completed_at"):
-                from datetime import datetime
-
                 start = datetime.fromisoformat(execution["started_at"])
                 end = datetime.fromisoformat(execution["completed_at"])
                 duration = f"{(end - start).total_seconds():.2f}s"
 
-            status_color = (
-                "green"
-                if execution["status"] == "completed"
-                else "red" if execution["status"] == "failed" else "yellow"
-            )
+            status_color = _STATUS_COLORS.get(execution["status"], "yellow")
 
             table.add_row(
                 execution["id"][:8],
@@ -419,13 +496,12 @@ class WorkflowCLI:
 
     async def export_workflow(self, args: str):
         """Export workflow to file"""
-        parts = args.split()
-        if len(parts) < 1:
+        name, _, file_path = args.strip().partition(" ")
+        if not name:
             self.console.print("[red]Error:[/red] Workflow name required")
             return
 
-        name = parts[0]
-        file_path = parts[1] if len(parts) > 1 else f"{name}.json"
+        file_path = file_path.strip() or f"{name}.json"
 
         if self.library.export_workflow(name, file_path):
             self.console.print(f"[green]✓[/green] Workflow exported to: {file_path}")
@@ -449,39 +525,4 @@ class WorkflowCLI:
 
     def show_help(self):
         """Show workflow command help"""
-        help_text = """
-[bold cyan]Workflow Commands[/bold cyan]
-
-[bold]List workflows:[/bold]
-  workflow list [--tags TAG1,TAG2] [--search QUERY]
-
-[bold]Show workflow details:[/bold]
-  workflow show <name>
-
-[bold]Run workflow:[/bold]
-  workflow run <name> [param1=value1] [param2=value2] ...
-
-[bold]Create workflow:[/bold]
-  workflow create
-
-[bold]Delete workflow:[/bold]
-  workflow delete <name>
-
-[bold]Show execution history:[/bold]
-  workflow history <name>
-
-[bold]Export workflow:[/bold]
-  workflow export <name> [file_path]
-
-[bold]Import workflow:[/bold]
-  workflow import <file_path>
-
-[bold]Examples:[/bold]
-  workflow list --tags production
-  workflow show "Deploy Pipeline"
-  workflow run "Deploy Pipeline" environment=staging branch=main
-  workflow create
-  workflow export "Deploy Pipeline" deploy.json
-"""
-
-        self.console.print(Panel(help_text, title="Workflow Help", border_style="cyan"))
+        self.console.print(_help_panel())
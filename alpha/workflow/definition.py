@@ -4,12 +4,16 @@ Workflow Definition Module
 Defines the core data structures for workflow representation.
 """
 
+import re
 import uuid
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
 from datetime import datetime
 
+# A whole-string "{{step_id.field}}" output reference; captures the step id
+_STEP_REF_RE = re.compile(r"^\{\{\s*([^.\s}]+)\.[^}]*\}\}$")
+
 
 class StepErrorStrategy(Enum):
     """Error handling strategies for workflow steps"""
@@ -40,7 +44,21 @@ class TriggerType(Enum):
     PROACTIVE = "proactive"  # Detected by proactive intelligence
 
 
-@dataclass
+# Value -> member tables for enums parsed from workflow data
+_PARAMETER_TYPES = {member.value: member for member in ParameterType}
+_TRIGGER_TYPES = {member.value: member for member in TriggerType}
+_ERROR_STRATEGIES = {member.value: member for member in StepErrorStrategy}
+
+
+def _enum_member(enum_cls, members: Dict[Any, Any], value: Any):
+    """Look up an enum member by value; the enum itself handles members and errors."""
+    try:
+        return members[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
+
+
+@dataclass(slots=True)
 class RetryConfig:
     """Retry configuration for steps"""
 
@@ -50,7 +68,7 @@ class RetryConfig:
     max_delay: float = 60.0  # seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowParameter:
     """Workflow parameter definition"""
 
@@ -75,14 +93,14 @@ class WorkflowParameter:
         """Create from dictionary"""
         return cls(
             name=data["name"],
-            type=ParameterType(data["type"]),
+            type=_enum_member(ParameterType, _PARAMETER_TYPES, data["type"]),
             default=data.get("default"),
             description=data.get("description", ""),
             required=data.get("required", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowTrigger:
     """Workflow trigger definition"""
 
@@ -96,10 +114,13 @@ class WorkflowTrigger:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "WorkflowTrigger":
         """Create from dictionary"""
-        return cls(type=TriggerType(data["type"]), config=data.get("config", {}))
+        return cls(
+            type=_enum_member(TriggerType, _TRIGGER_TYPES, data["type"]),
+            config=data.get("config", {}),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     """Workflow step definition"""
 
@@ -124,7 +145,13 @@ class WorkflowStep:
         }
 
         if self.retry:
-            result["retry"] = asdict(self.retry)
+            retry = self.retry
+            result["retry"] = {
+                "max_attempts": retry.max_attempts,
+                "backoff": retry.backoff,
+                "initial_delay": retry.initial_delay,
+                "max_delay": retry.max_delay,
+            }
 
         if self.depends_on:
             result["depends_on"] = self.depends_on
@@ -148,7 +175,9 @@ class WorkflowStep:
             tool=data["tool"],
             action=data["action"],
             parameters=data.get("parameters", {}),
-            on_error=StepErrorStrategy(data.get("on_error", "abort")),
+            on_error=_enum_member(
+                StepErrorStrategy, _ERROR_STRATEGIES, data.get("on_error", "abort")
+            ),
             retry=retry,
             depends_on=data.get("depends_on", []),
             condition=data.get("condition"),
@@ -156,7 +185,7 @@ class WorkflowStep:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowDefinition:
     """
     Complete workflow definition
@@ -177,13 +206,26 @@ class WorkflowDefinition:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Last dependency analysis: (step graph it was computed for, layers, has_cycle)
+    _dependency_cache: Optional[Tuple[tuple, List[List[str]], bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Positions of the first parameter/step with each name/ID, built on lookup
+    _parameter_index: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _step_index: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize timestamps if not provided"""
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -239,17 +281,35 @@ class WorkflowDefinition:
 
     def get_parameter(self, name: str) -> Optional[WorkflowParameter]:
         """Get parameter by name"""
-        for param in self.parameters:
-            if param.name == name:
-                return param
-        return None
+        return self._find(self.parameters, "_parameter_index", "name", name)
 
     def get_step(self, step_id: str) -> Optional[WorkflowStep]:
         """Get step by ID"""
-        for step in self.steps:
-            if step.id == step_id:
-                return step
-        return None
+        return self._find(self.steps, "_step_index", "id", step_id)
+
+    def _find(self, items: List[Any], index_attr: str, key_attr: str, key: str) -> Any:
+        """
+        Look up the first item whose key attribute equals key
+
+        Uses a cached position index. A hit is checked against the list, and a
+        miss rebuilds the index, so lists changed in place are still searched
+        correctly.
+        """
+        index = getattr(self, index_attr)
+        if index is not None:
+            position = index.get(key)
+            if position is not None and position < len(items):
+                item = items[position]
+                if getattr(item, key_attr) == key:
+                    return item
+
+        index = {}
+        for position, item in enumerate(items):
+            index.setdefault(getattr(item, key_attr), position)
+        setattr(self, index_attr, index)
+
+        position = index.get(key)
+        return items[position] if position is not None else None
 
     def validate(self) -> tuple[bool, List[str]]:
         """
@@ -271,8 +331,8 @@ class WorkflowDefinition:
             errors.append("Workflow must have at least one step")
 
         # Validate step IDs are unique
-        step_ids = [step.id for step in self.steps]
-        if len(step_ids) != len(set(step_ids)):
+        step_ids = {step.id for step in self.steps}
+        if len(step_ids) != len(self.steps):
             errors.append("Step IDs must be unique")
 
         # Validate step dependencies exist
@@ -284,7 +344,7 @@ class WorkflowDefinition:
                     )
 
         # Validate no circular dependencies
-        if self._has_circular_dependencies():
+        if self._analyze_dependencies()[1]:
             errors.append("Workflow has circular dependencies")
 
         # Validate fallback steps exist
@@ -296,47 +356,16 @@ class WorkflowDefinition:
 
         # Validate outputs reference valid steps
         for output_name, step_ref in self.outputs.items():
-            # Parse step reference (e.g., "{{step_id.output}}")
-            if step_ref.startswith("{{") and step_ref.endswith("}}"):
-                ref = step_ref[2:-2]  # Remove {{ }}
-                step_id = ref.split(".")[0]
-                if step_id not in step_ids:
-                    errors.append(
-                        f"Output '{output_name}' references non-existent step '{step_id}'"
-                    )
+            # Parse step reference (e.g., "{{step_id.output}}"); like the
+            # executor, a reference without a field is a variable, not a step
+            match = _STEP_REF_RE.match(step_ref)
+            if match and match.group(1) not in step_ids:
+                errors.append(
+                    f"Output '{output_name}' references non-existent step '{match.group(1)}'"
+                )
 
         return len(errors) == 0, errors
 
-    def _has_circular_dependencies(self) -> bool:
-        """Check for circular dependencies in workflow steps"""
-        # Build adjacency list
-        graph = {step.id: step.depends_on for step in self.steps}
-
-        # Track visiting and visited nodes
-        visiting = set()
-        visited = set()
-
-        def has_cycle(node: str) -> bool:
-            if node in visiting:
-                return True
-            if node in visited:
-                return False
-
-            visiting.add(node)
-            for neighbor in graph.get(node, []):
-                if has_cycle(neighbor):
-                    return True
-            visiting.remove(node)
-            visited.add(node)
-            return False
-
-        for step_id in graph:
-            if step_id not in visited:
-                if has_cycle(step_id):
-                    return True
-
-        return False
-
     def get_independent_steps(self) -> List[List[str]]:
         """
         Get steps grouped by execution order (for parallel execution)
@@ -344,25 +373,65 @@ class WorkflowDefinition:
         Returns list of lists, where each inner list contains step IDs
         that can be executed in parallel.
         """
-        # Build dependency map
-        step_deps = {step.id: set(step.depends_on) for step in self.steps}
-        all_steps = set(step_deps.keys())
+        return [list(layer) for layer in self._analyze_dependencies()[0]]
 
-        execution_order = []
-        completed = set()
+    def _analyze_dependencies(self) -> Tuple[List[List[str]], bool]:
+        """
+        Layer steps by dependency depth and detect cycles in one pass
 
-        while len(completed) < len(all_steps):
-            # Find steps that can be executed now (all dependencies met)
-            ready = []
-            for step_id in all_steps - completed:
-                if step_deps[step_id].issubset(completed):
-                    ready.append(step_id)
+        The result is cached and reused until a step ID or dependency changes.
 
-            if not ready:
-                # Should not happen if workflow is valid
-                break
+        Returns:
+            (layers, has_cycle). Steps in a cycle, or depending on a
+            non-existent step, are left out of the layers, along with
+            everything that depends on them.
+        """
+        graph_key = tuple((step.id, tuple(step.depends_on)) for step in self.steps)
+        cache = self._dependency_cache
+        if cache is not None and cache[0] == graph_key:
+            return cache[1], cache[2]
 
-            execution_order.append(ready)
-            completed.update(ready)
+        step_deps = {step.id: set(step.depends_on) for step in self.steps}
 
-        return execution_order
+        # Kahn's algorithm over dependencies on existing steps; steps with a
+        # missing dependency are still released, but marked blocked so that
+        # neither they nor their dependents are ever scheduled
+        pending = {}
+        dependents: Dict[str, List[str]] = {step_id: [] for step_id in step_deps}
+        blocked = set()
+        for step_id, deps in step_deps.items():
+            known = 0
+            for dep in deps:
+                if dep in dependents:
+                    dependents[dep].append(step_id)
+                    known += 1
+                else:
+                    blocked.add(step_id)
+            pending[step_id] = known
+
+        # Each round releases every step whose dependencies all finished
+        # in earlier rounds
+        ready = [step_id for step_id, count in pending.items() if count == 0]
+        layers = []
+        released = 0
+        while ready:
+            released += len(ready)
+            layer = [step_id for step_id in ready if step_id not in blocked]
+            if layer:
+                layers.append(layer)
+
+            next_ready = []
+            for step_id in ready:
+                for dependent in dependents[step_id]:
+                    if step_id in blocked:
+                        blocked.add(dependent)
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = next_ready
+
+        # Steps never released are waiting on each other
+        has_cycle = released < len(step_deps)
+
+        self._dependency_cache = (graph_key, layers, has_cycle)
+        return layers, has_cycle
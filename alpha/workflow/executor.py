@@ -21,7 +21,7 @@ from .definition import (
 from ..utils.safe_eval import safe_eval_condition
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """
     Execution context for workflow
@@ -62,7 +62,7 @@ class ExecutionContext:
         return output
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of workflow execution"""
 
@@ -7,12 +7,29 @@ Provides storage, retrieval, and management of workflow definitions.
 import json
 import sqlite3
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime
 
 from .definition import WorkflowDefinition
 from .schema import validate_workflow
 
+# Optional fast JSON decoder for stored and imported definitions
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw):
+    """Decode JSON text or bytes, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # The stdlib encoder may have written NaN or Infinity
+            pass
+    return json.loads(raw)
+
 
 class WorkflowLibrary:
     """
@@ -166,7 +183,7 @@ class WorkflowLibrary:
             row = cursor.fetchone()
 
             if row:
-                definition_json = json.loads(row[0])
+                definition_json = _loads(row[0])
                 return WorkflowDefinition.from_dict(definition_json)
 
             return None
@@ -194,7 +211,7 @@ class WorkflowLibrary:
             row = cursor.fetchone()
 
             if row:
-                definition_json = json.loads(row[0])
+                definition_json = _loads(row[0])
                 return WorkflowDefinition.from_dict(definition_json)
 
             return None
@@ -219,6 +236,29 @@ class WorkflowLibrary:
         Returns:
             List of WorkflowDefinition objects
         """
+        return list(self.iter_list(tags=tags, search=search, limit=limit))
+
+    def iter_list(
+        self,
+        tags: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+    ) -> Iterator[WorkflowDefinition]:
+        """
+        Yield workflows with optional filtering, one row at a time
+
+        Takes the same filters as list(). Each definition is parsed only when
+        it is reached, and the connection stays open until the iterator is
+        exhausted or closed.
+
+        Args:
+            tags: Filter by tags (workflows matching any tag)
+            search: Search in name and description
+            limit: Maximum number of results
+
+        Yields:
+            WorkflowDefinition objects
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -244,14 +284,10 @@ class WorkflowLibrary:
             params.append(limit)
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
 
-            workflows = []
-            for row in rows:
-                definition_json = json.loads(row[0])
-                workflows.append(WorkflowDefinition.from_dict(definition_json))
-
-            return workflows
+            for row in cursor:
+                definition_json = _loads(row[0])
+                yield WorkflowDefinition.from_dict(definition_json)
 
         finally:
             conn.close()
@@ -378,8 +414,8 @@ class WorkflowLibrary:
                     workflow_dict = yaml.safe_load(f)
             else:
                 # Import from JSON
-                with open(file_path, "r") as f:
-                    workflow_dict = json.load(f)
+                with open(file_path, "rb") as f:
+                    workflow_dict = _loads(f.read())
 
             # Create workflow from dict
             workflow = WorkflowDefinition.from_dict(workflow_dict)
@@ -504,11 +540,11 @@ class WorkflowLibrary:
                 executions.append(
                     {
                         "id": row[0],
-                        "parameters": json.loads(row[1]) if row[1] else {},
+                        "parameters": _loads(row[1]) if row[1] else {},
                         "status": row[2],
                         "started_at": row[3],
                         "completed_at": row[4],
-                        "result": json.loads(row[5]) if row[5] else None,
+                        "result": _loads(row[5]) if row[5] else None,
                         "error": row[6],
                     }
                 )
@@ -14,7 +14,7 @@ from collections import defaultdict
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowOptimization:
     """Optimization recommendation for a workflow."""
     workflow_id: str
@@ -14,7 +14,7 @@ from collections import defaultdict, Counter
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowPattern:
     """Detected workflow pattern from task history."""
     pattern_id: str
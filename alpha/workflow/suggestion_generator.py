@@ -15,7 +15,7 @@ from .pattern_detector import WorkflowPattern
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowSuggestion:
     """Suggestion to create a workflow."""
     suggestion_id: str
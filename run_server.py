@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from alpha.api.server import create_app
+from alpha.utils.event_loop import install_fast_event_loop
 
 if __name__ == "__main__":
     # Get host and port from args
@@ -34,4 +35,5 @@ if __name__ == "__main__":
 
     # Start server
     server = uvicorn.Server(config)
+    install_fast_event_loop()
     asyncio.run(server.serve())
@@ -0,0 +1,334 @@
+"""
+Tests for Alpha Browser Automation - BrowserTool
+
+Covers the tool-level behavior layered over the browser automation components:
+- Browser pre-launch and cleanup
+- Navigation readiness with wait_for
+- Batched extract_text
+"""
+
+import asyncio
+import sys
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from alpha.browser_automation.executor import ActionResult
+from alpha.browser_automation.navigator import NavigationError, NavigationResult
+from alpha.browser_automation.session import SessionManager
+from alpha.tools import browser_tool as browser_tool_module
+from alpha.tools.browser_tool import BrowserTool
+from alpha.tools.registry import ToolRegistry
+
+
+PRELAUNCH_CONFIG = {"pool": {"prelaunch": ["chromium"], "headless": True}}
+
+
+@pytest.fixture
+def playwright_installed():
+    """Pretend Playwright is importable."""
+    with patch("alpha.tools.browser_tool._PLAYWRIGHT_OK", True):
+        yield
+
+
+@pytest.fixture
+def mock_session_manager(playwright_installed):
+    """Replace SessionManager with a mock whose methods can be awaited."""
+    manager = Mock()
+    manager.warm_up = AsyncMock()
+    manager.cleanup_all_sessions = AsyncMock()
+    with patch("alpha.browser_automation.SessionManager", return_value=manager):
+        yield manager
+
+
+# Pre-launch and cleanup
+
+@pytest.mark.asyncio
+async def test_initialization_prelaunches_browsers(mock_session_manager):
+    """Test component initialization launches the configured browsers in the background."""
+    tool = BrowserTool(PRELAUNCH_CONFIG)
+
+    tool._ensure_components_initialized()
+    await tool._warm_up_task
+
+    mock_session_manager.warm_up.assert_awaited_once_with(["chromium"], headless=True)
+
+    # Later initializations do not launch again
+    tool._ensure_components_initialized()
+    await asyncio.sleep(0)
+    assert mock_session_manager.warm_up.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_start_warm_up_at_registration(mock_session_manager):
+    """Test start_warm_up begins the pre-launch before any action runs."""
+    tool = BrowserTool(PRELAUNCH_CONFIG)
+
+    tool.start_warm_up()
+    await tool._warm_up_task
+
+    mock_session_manager.warm_up.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_no_prelaunch_without_config(mock_session_manager):
+    """Test nothing is launched ahead of time unless pool.prelaunch is set."""
+    tool = BrowserTool({})
+
+    tool.start_warm_up()
+
+    assert tool._warm_up_task is None
+    mock_session_manager.warm_up.assert_not_awaited()
+
+
+def test_registration_without_prelaunch_stays_lazy(playwright_installed, monkeypatch):
+    """Test registering without pool.prelaunch does not import the browser stack."""
+    for name in [m for m in sys.modules if m.startswith("alpha.browser_automation")]:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(browser_tool_module, "_browser_automation", None)
+
+    tool = BrowserTool({})
+    ToolRegistry().register(tool)
+    tool.start_warm_up()
+
+    assert "alpha.browser_automation" not in sys.modules
+    assert tool._session_manager is None
+
+
+def test_start_warm_up_without_event_loop(mock_session_manager):
+    """Test the pre-launch is deferred when no event loop is running."""
+    tool = BrowserTool(PRELAUNCH_CONFIG)
+
+    tool.start_warm_up()
+
+    assert tool._warm_up_task is None
+    assert tool._session_manager is mock_session_manager
+
+
+@pytest.mark.asyncio
+async def test_cleanup_closes_browsers(playwright_installed):
+    """Test cleanup closes sessions, browsers and Playwright."""
+    tool = BrowserTool({})
+    tool._ensure_components_initialized()
+    manager = tool._session_manager
+    assert isinstance(manager, SessionManager)
+
+    browser = Mock(close=AsyncMock())
+    context = Mock(close=AsyncMock())
+    playwright = Mock(stop=AsyncMock())
+    manager._browsers["chromium_True"] = browser
+    manager._playwright = playwright
+    manager.sessions["s1"] = Mock(context=context)
+
+    await tool.cleanup()
+
+    context.close.assert_awaited_once()
+    browser.close.assert_awaited_once()
+    playwright.stop.assert_awaited_once()
+    assert manager.sessions == {}
+    assert manager._browsers == {}
+
+
+@pytest.mark.asyncio
+async def test_cleanup_cancels_pending_warm_up(mock_session_manager):
+    """Test cleanup stops a pre-launch that is still running."""
+    started = asyncio.Event()
+
+    async def slow_warm_up(*args, **kwargs):
+        started.set()
+        await asyncio.sleep(10)
+
+    mock_session_manager.warm_up.side_effect = slow_warm_up
+    tool = BrowserTool(PRELAUNCH_CONFIG)
+    tool.start_warm_up()
+    await started.wait()
+
+    await tool.cleanup()
+
+    assert tool._warm_up_task.cancelled()
+    mock_session_manager.cleanup_all_sessions.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_registry_close_cleans_up_tools(mock_session_manager):
+    """Test ToolRegistry.close runs each tool's cleanup."""
+    registry = ToolRegistry()
+    tool = BrowserTool({})
+    tool._ensure_components_initialized()
+    registry.register(tool)
+
+    await registry.close()
+
+    mock_session_manager.cleanup_all_sessions.assert_awaited_once()
+
+
+# Navigation readiness
+
+@pytest.fixture
+def mock_page():
+    """Create a mock Playwright Page object."""
+    return Mock(wait_for_load_state=AsyncMock())
+
+
+@pytest.fixture
+def navigate_tool(playwright_installed, mock_page):
+    """Create a BrowserTool whose components are mocks and whose session uses mock_page."""
+    tool = BrowserTool({"security": {"require_approval": False}})
+    page = mock_page
+    tool._session_manager = Mock(
+        create_session=AsyncMock(return_value=Mock(session_id="s1", page=page))
+    )
+    tool._navigator = Mock(
+        navigate=AsyncMock(return_value=NavigationResult(success=True, url="https://example.com")),
+        wait_for_selector=AsyncMock(return_value=True),
+    )
+    tool._playwright_available = True
+    return tool
+
+
+@pytest.mark.asyncio
+async def test_navigate_without_wait_for_waits_for_load(navigate_tool):
+    """Test a plain navigate waits for the load event."""
+    result = await navigate_tool.execute(action="navigate", url="https://example.com")
+
+    assert result.success is True
+    assert navigate_tool._navigator.navigate.await_args.kwargs["wait_until"] == "load"
+    navigate_tool._navigator.wait_for_selector.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_navigate_timeout_passed_in_milliseconds(navigate_tool):
+    """Test the navigation timeout is converted from seconds to milliseconds."""
+    await navigate_tool.execute(action="navigate", url="https://example.com", timeout=5)
+
+    assert navigate_tool._navigator.navigate.await_args.kwargs["timeout"] == 5000
+
+
+@pytest.mark.asyncio
+async def test_navigate_wait_for_replaces_load_wait(navigate_tool, mock_page):
+    """Test a found wait_for selector is the only readiness wait."""
+    result = await navigate_tool.execute(
+        action="navigate", url="https://example.com", wait_for="#app", timeout=5
+    )
+
+    assert result.success is True
+    assert navigate_tool._navigator.navigate.await_args.kwargs["wait_until"] == "domcontentloaded"
+    assert navigate_tool._navigator.wait_for_selector.await_args.kwargs["timeout"] == 5000
+    mock_page.wait_for_load_state.assert_not_awaited()
+
+
+@pytest.mark.parametrize("selector_outcome", [
+    {"return_value": False},
+    {"side_effect": NavigationError("Error waiting for selector")},
+])
+@pytest.mark.asyncio
+async def test_navigate_falls_back_to_load_when_wait_for_fails(
+    navigate_tool, mock_page, selector_outcome
+):
+    """Test a missing wait_for selector falls back to waiting for the load event."""
+    navigate_tool._navigator.wait_for_selector = AsyncMock(**selector_outcome)
+
+    result = await navigate_tool.execute(
+        action="navigate", url="https://example.com", wait_for="#app", timeout=5
+    )
+
+    assert result.success is True
+    mock_page.wait_for_load_state.assert_awaited_once_with("load", timeout=5000)
+
+
+@pytest.mark.asyncio
+async def test_navigate_fails_when_page_never_loads(navigate_tool, mock_page):
+    """Test navigate fails if neither the wait_for selector nor the load event arrive."""
+    navigate_tool._navigator.wait_for_selector = AsyncMock(return_value=False)
+    mock_page.wait_for_load_state.side_effect = TimeoutError("Timeout 5000ms exceeded")
+
+    result = await navigate_tool.execute(
+        action="navigate", url="https://example.com", wait_for="#app", timeout=5
+    )
+
+    assert result.success is False
+    assert "did not finish loading" in result.error
+    assert navigate_tool.get_statistics()["failed_actions"] == 1
+
+
+# Batched extract_text
+
+@pytest.fixture
+def batch_tool(playwright_installed):
+    """Create a BrowserTool with extract_text batching and a mock executor."""
+    tool = BrowserTool({"batch_extracts": True})
+    tool._executor = Mock(extract_text=AsyncMock(return_value=ActionResult(
+        success=True, action="extract_text", data={"text": "via executor"}
+    )))
+    return tool
+
+
+@pytest.mark.asyncio
+async def test_concurrent_extracts_share_one_evaluate(batch_tool):
+    """Test concurrent extract_text calls on a page are read in one round-trip."""
+    page = Mock(evaluate=AsyncMock(return_value=["Title", "Price"]))
+
+    title, price = await asyncio.gather(
+        batch_tool._extract_text_batched(page, "h1"),
+        batch_tool._extract_text_batched(page, ".price"),
+    )
+
+    page.evaluate.assert_awaited_once()
+    assert page.evaluate.await_args.args[1] == ["h1", ".price"]
+    assert title.data["text"] == "Title"
+    assert price.data["text"] == "Price"
+    assert price.metadata["batch_size"] == 2
+    assert batch_tool._pending_extracts == {}
+
+
+@pytest.mark.asyncio
+async def test_batched_extract_failures_are_per_selector(batch_tool):
+    """Test a missing element or unsupported selector only affects its own call."""
+    page = Mock(evaluate=AsyncMock(return_value=[
+        "Title", {"error": "SyntaxError: 'text=Buy' is not a valid selector"}, None,
+    ]))
+
+    found, playwright_only, missing = await asyncio.gather(
+        batch_tool._extract_text_batched(page, "h1"),
+        batch_tool._extract_text_batched(page, "text=Buy"),
+        batch_tool._extract_text_batched(page, "#gone"),
+    )
+
+    assert found.success is True
+    # Playwright selector syntax falls back to the unbatched path
+    assert playwright_only.data["text"] == "via executor"
+    batch_tool._executor.extract_text.assert_awaited_once_with(page, "text=Buy")
+    assert missing.success is False
+    assert "Element not found" in missing.error
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_batch(batch_tool):
+    """Test cancelling the call that started a batch leaves the others running."""
+    page = Mock(evaluate=AsyncMock(return_value=["Title", "Price"]))
+
+    first = asyncio.create_task(batch_tool._extract_text_batched(page, "h1"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(batch_tool._extract_text_batched(page, ".price"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    result = await second
+
+    assert first.cancelled()
+    assert result.success is True
+    assert result.data["text"] == "Price"
+    page.evaluate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_failure_reported_to_each_caller(batch_tool):
+    """Test a failed round-trip fails every call in the batch with its own result."""
+    page = Mock(evaluate=AsyncMock(side_effect=RuntimeError("Target closed")))
+
+    results = await asyncio.gather(
+        batch_tool._extract_text_batched(page, "h1"),
+        batch_tool._extract_text_batched(page, ".price"),
+    )
+
+    assert [r.success for r in results] == [False, False]
+    assert all("Target closed" in r.error for r in results)
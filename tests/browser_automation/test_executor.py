@@ -27,7 +27,7 @@ def mock_page():
     page.url = "https://example.com"
     page.query_selector = AsyncMock()
     page.query_selector_all = AsyncMock(return_value=[])
-    page.wait_for_selector = AsyncMock()
+    page.wait_for_selector = AsyncMock(return_value=None)
     page.evaluate = AsyncMock()
     page.screenshot = AsyncMock()
     return page
@@ -110,7 +110,7 @@ def executor(mock_navigator, mock_validator, mock_screenshot_manager):
 async def test_click_element_success(executor, mock_page, mock_element):
     """Test successful element click."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.click_element("button.submit")
 
@@ -130,7 +130,7 @@ async def test_click_element_success(executor, mock_page, mock_element):
 async def test_click_element_different_buttons(executor, mock_page, mock_element):
     """Test clicking with different mouse buttons."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     # Right click
     result = await executor.click_element("div.context-menu", button="right")
@@ -147,7 +147,7 @@ async def test_click_element_different_buttons(executor, mock_page, mock_element
 async def test_click_element_double_triple(executor, mock_page, mock_element):
     """Test double-click and triple-click."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     # Double click
     result = await executor.click_element("div.item", click_count=2)
@@ -181,7 +181,7 @@ async def test_click_element_timeout(executor, mock_page):
 async def test_fill_input_success(executor, mock_page, mock_element):
     """Test successful input filling."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.fill_input("input[name='email']", "test@example.com")
 
@@ -201,7 +201,7 @@ async def test_fill_input_success(executor, mock_page, mock_element):
 async def test_fill_form_success(executor, mock_page, mock_element):
     """Test successful form filling."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     form_data = {
         "input[name='username']": "johndoe",
@@ -225,7 +225,7 @@ async def test_fill_form_success(executor, mock_page, mock_element):
 async def test_select_option_by_value(executor, mock_page, mock_element):
     """Test selecting option by value."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.select_option("select[name='country']", value="US")
 
@@ -242,7 +242,7 @@ async def test_select_option_by_value(executor, mock_page, mock_element):
 async def test_upload_file_single(executor, mock_page, mock_element, tmp_path):
     """Test uploading a single file."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     # Create a temporary file
     test_file = tmp_path / "test.txt"
@@ -262,7 +262,7 @@ async def test_upload_file_single(executor, mock_page, mock_element, tmp_path):
 async def test_fill_input_no_clear(executor, mock_page, mock_element):
     """Test filling input without clearing first."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.fill_input(
         "input[name='search']",
@@ -299,7 +299,7 @@ async def test_fill_form_validation_error(executor, mock_validator):
 async def test_extract_text_success(executor, mock_page, mock_element):
     """Test successful text extraction."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
     mock_element.inner_text.return_value = "Hello World"
 
     result = await executor.extract_text("h1.title")
@@ -315,7 +315,7 @@ async def test_extract_text_success(executor, mock_page, mock_element):
 async def test_extract_data_success(executor, mock_page, mock_element):
     """Test extracting data from multiple elements."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     # Mock different text for different selectors
     call_count = [0]
@@ -347,7 +347,7 @@ async def test_extract_data_success(executor, mock_page, mock_element):
 async def test_extract_data_all_fields(executor, mock_page, mock_element):
     """Test extracting all fields successfully."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
     mock_element.inner_text.return_value = "Field value"
 
     selectors = {
@@ -368,44 +368,15 @@ async def test_extract_data_all_fields(executor, mock_page, mock_element):
 @pytest.mark.asyncio
 async def test_extract_table_success(executor, mock_page, mock_element):
     """Test extracting table data."""
-    # Create mock table structure
+    # Mock table contents as read in the page
     mock_table = AsyncMock()
-
-    # Mock header cells
-    mock_header1 = AsyncMock()
-    mock_header1.inner_text = AsyncMock(return_value="Name")
-    mock_header2 = AsyncMock()
-    mock_header2.inner_text = AsyncMock(return_value="Age")
-
-    mock_table.query_selector_all = AsyncMock(
-        side_effect=[
-            [mock_header1, mock_header2],  # Headers
-            []  # First call for tbody tr
-        ]
-    )
-
-    # Mock data rows
-    mock_cell1 = AsyncMock()
-    mock_cell1.inner_text = AsyncMock(return_value="John")
-    mock_cell2 = AsyncMock()
-    mock_cell2.inner_text = AsyncMock(return_value="30")
-
-    mock_row = AsyncMock()
-    mock_row.query_selector = AsyncMock(return_value=None)  # No th in row
-    mock_row.query_selector_all = AsyncMock(return_value=[mock_cell1, mock_cell2])
-
-    # Second query_selector_all call for rows
-    async def mock_query_all(selector):
-        if "th" in selector:
-            return [mock_header1, mock_header2]
-        elif "tr" in selector:
-            return [mock_row]
-        return []
-
-    mock_table.query_selector_all = mock_query_all
+    mock_table.evaluate = AsyncMock(return_value={
+        "headers": ["Name", "Age"],
+        "rows": [["John", "30"], ["Jane", "25", "extra"]]
+    })
 
     mock_page.query_selector.return_value = mock_table
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.extract_table("table.data")
 
@@ -415,13 +386,18 @@ async def test_extract_table_success(executor, mock_page, mock_element):
     assert "rows" in result.data
     assert result.data["column_count"] >= 0
     assert result.data["row_count"] >= 0
+    assert result.data["rows"] == [
+        {"Name": "John", "Age": "30"},
+        {"Name": "Jane", "Age": "25", "column_2": "extra"}
+    ]
+    mock_table.evaluate.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_extract_data_no_matches(executor, mock_page):
     """Test extracting data with no matching elements."""
     mock_page.query_selector.return_value = None
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     selectors = {
         "missing1": "div.missing1",
@@ -435,6 +411,42 @@ async def test_extract_data_no_matches(executor, mock_page):
     assert result.metadata["missing_count"] == 2
 
 
+@pytest.mark.asyncio
+async def test_extract_data_concurrent(executor, mock_page):
+    """Test fields are queried concurrently and mapped back to their names."""
+    in_flight = [0]
+    max_in_flight = [0]
+
+    async def mock_query_selector(selector):
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        if selector == "div.missing":
+            return None
+        element = AsyncMock()
+        element.inner_text = AsyncMock(return_value=f"text of {selector}")
+        return element
+
+    mock_page.query_selector = mock_query_selector
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
+
+    result = await executor.extract_data({
+        "title": "h1",
+        "missing": "div.missing",
+        "price": "span.price"
+    })
+
+    assert result.success is True
+    assert result.data["extracted_data"] == {
+        "title": "text of h1",
+        "missing": None,
+        "price": "text of span.price"
+    }
+    assert result.data["missing_fields"] == ["missing"]
+    assert max_in_flight[0] == 3
+
+
 # Advanced Action Tests (4 tests)
 
 @pytest.mark.asyncio
@@ -475,7 +487,7 @@ async def test_execute_script_dangerous_patterns(executor, mock_page, mock_valid
 async def test_hover_success(executor, mock_page, mock_element):
     """Test successful hover action."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.hover("button.menu-trigger")
 
@@ -502,7 +514,7 @@ async def test_drag_and_drop_success(executor, mock_page, mock_element):
         return None
 
     mock_page.query_selector = mock_query_selector
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.drag_and_drop(
         "div.draggable-item",
@@ -610,7 +622,7 @@ async def test_select_option_no_method(executor):
 async def test_execution_time_tracking(executor, mock_page, mock_element):
     """Test that execution time is properly tracked."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     # Add slight delay to ensure measurable time
     async def delayed_click(**kwargs):
@@ -631,7 +643,7 @@ async def test_execution_time_tracking(executor, mock_page, mock_element):
 async def test_action_result_metadata(executor, mock_page, mock_element):
     """Test that ActionResult includes proper metadata."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.click_element("button.test", button="right", click_count=2)
 
@@ -647,10 +659,22 @@ async def test_action_result_metadata(executor, mock_page, mock_element):
 async def test_custom_timeout(executor, mock_page, mock_element):
     """Test using custom timeout for actions."""
     mock_page.query_selector.return_value = mock_element
-    mock_page.wait_for_selector = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(return_value=None)
 
     result = await executor.click_element("button", timeout=5000)
 
     assert result.success is True
     # Verify wait_for_selector was called with custom timeout
     mock_page.wait_for_selector.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_find_element_uses_waited_handle(executor, mock_page, mock_element):
+    """Test the handle resolved by wait_for_selector is used without a second query."""
+    mock_page.wait_for_selector = AsyncMock(return_value=mock_element)
+
+    result = await executor.click_element("button.submit")
+
+    assert result.success is True
+    mock_element.click.assert_called_once()
+    mock_page.query_selector.assert_not_called()
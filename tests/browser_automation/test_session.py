@@ -0,0 +1,93 @@
+"""
+Tests for Alpha Browser Automation - Session Manager
+
+Covers browser selection for new sessions:
+- Shared Chromium over a CDP endpoint
+- The security.allow_shared_browser gate
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from alpha.browser_automation.session import SessionConfig, SessionManager
+
+
+CDP_ENDPOINT = "http://localhost:9222"
+
+
+def make_browser():
+    """Create a mock Browser whose contexts hand out mock pages."""
+    def new_context(**kwargs):
+        return Mock(close=AsyncMock(), new_page=AsyncMock(return_value=Mock()))
+
+    return Mock(new_context=AsyncMock(side_effect=new_context), close=AsyncMock())
+
+
+@pytest.fixture
+def mock_playwright():
+    """Create a mock Playwright instance with chromium and firefox launchers."""
+    playwright = Mock(stop=AsyncMock())
+    for name in ("chromium", "firefox"):
+        launcher = Mock()
+        launcher.launch = AsyncMock(side_effect=lambda **kwargs: make_browser())
+        launcher.connect_over_cdp = AsyncMock(side_effect=lambda endpoint: make_browser())
+        setattr(playwright, name, launcher)
+    return playwright
+
+
+def make_manager(mock_playwright, allow_shared):
+    """Create a SessionManager pointed at a CDP endpoint, with Playwright mocked."""
+    manager = SessionManager({
+        "cdp_endpoint": CDP_ENDPOINT,
+        "security": {"allow_shared_browser": allow_shared},
+    })
+    manager._playwright = mock_playwright
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_shared_browser_connects_once_per_endpoint(mock_playwright):
+    """Test Chromium sessions share one CDP connection regardless of headless."""
+    manager = make_manager(mock_playwright, allow_shared=True)
+
+    first = await manager.create_session(SessionConfig(headless=True))
+    second = await manager.create_session(SessionConfig(headless=False))
+
+    mock_playwright.chromium.connect_over_cdp.assert_awaited_once_with(CDP_ENDPOINT)
+    mock_playwright.chromium.launch.assert_not_awaited()
+    assert first.browser is second.browser
+    assert first.context is not second.context
+
+
+@pytest.mark.asyncio
+async def test_shared_browser_requires_security_opt_in(mock_playwright):
+    """Test the endpoint is ignored unless allow_shared_browser is set."""
+    manager = make_manager(mock_playwright, allow_shared=False)
+
+    await manager.create_session(SessionConfig())
+
+    mock_playwright.chromium.connect_over_cdp.assert_not_awaited()
+    mock_playwright.chromium.launch.assert_awaited_once_with(headless=True)
+
+
+@pytest.mark.asyncio
+async def test_shared_browser_is_chromium_only(mock_playwright):
+    """Test other browser types are still launched locally."""
+    manager = make_manager(mock_playwright, allow_shared=True)
+
+    await manager.create_session(SessionConfig(browser_type="firefox"))
+
+    mock_playwright.firefox.connect_over_cdp.assert_not_awaited()
+    mock_playwright.firefox.launch.assert_awaited_once_with(headless=True)
+
+
+@pytest.mark.asyncio
+async def test_closing_shared_session_keeps_browser(mock_playwright):
+    """Test closing a session on the shared browser only closes its context."""
+    manager = make_manager(mock_playwright, allow_shared=True)
+    session = await manager.create_session(SessionConfig())
+
+    await manager.close_session(session.session_id)
+
+    session.context.close.assert_awaited_once()
+    session.browser.close.assert_not_awaited()
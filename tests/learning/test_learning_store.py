@@ -226,6 +226,29 @@ async def test_get_metrics(learning_store):
     assert metrics[0]["value"] == 0.85
 
 
+@pytest.mark.asyncio
+async def test_store_metrics_batch(learning_store):
+    """Test storing multiple metrics in one call."""
+    now = datetime.now()
+
+    count = await learning_store.store_metrics_batch([
+        {
+            "metric_type": "success_rate",
+            "metric_name": f"task_{i}",
+            "value": i / 10,
+            "period_start": now,
+            "period_end": now,
+            "metadata": {"index": i}
+        }
+        for i in range(3)
+    ])
+
+    assert count == 3
+    metrics = learning_store.get_metrics(metric_type="success_rate")
+    assert len(metrics) == 3
+    assert await learning_store.store_metrics_batch([]) == 0
+
+
 @pytest.mark.asyncio
 async def test_get_metrics_by_type(learning_store):
     """Test filtering metrics by type."""
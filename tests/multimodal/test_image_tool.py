@@ -0,0 +1,289 @@
+"""
+Tests for ImageAnalysisTool
+"""
+
+import base64
+import hashlib
+import io
+import os
+import threading
+import time
+import pytest
+from PIL import Image, ImageDraw
+from unittest.mock import AsyncMock, Mock
+
+from alpha.llm.vision_provider import VisionResponse
+from alpha.tools.image_tool import ImageAnalysisTool
+
+
+def save_image(path, color, size=(50, 50)):
+    """Save an image of the given color with a contrasting mark, so it is not solid"""
+    image = Image.new("RGB", size, color=color)
+    ImageDraw.Draw(image).rectangle((5, 5, 15, 15), fill="white")
+    image.save(path)
+
+
+@pytest.fixture
+def sample_image(tmp_path):
+    """Create a sample test image"""
+    img_path = tmp_path / "test.png"
+    save_image(img_path, "blue")
+    return img_path
+
+
+def make_tool(tmp_path, cache_enabled):
+    """Create a tool whose vision provider returns a canned response"""
+    tool = ImageAnalysisTool(
+        api_key="test-key", cache_enabled=cache_enabled, cache_dir=tmp_path / "cache"
+    )
+    response = Mock(content="A blue square", cost_usd=0.01, model="test-model", tokens_used=42)
+    tool.vision_provider.analyze_image = AsyncMock(return_value=response)
+    return tool
+
+
+class TestImageAnalysisCache:
+    """Test content-addressed analysis caching"""
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_calls_api_each_time(self, tmp_path, sample_image):
+        """Test every call reaches the API without caching"""
+        tool = make_tool(tmp_path, cache_enabled=False)
+
+        await tool.execute(image_path=str(sample_image))
+        await tool.execute(image_path=str(sample_image))
+
+        assert tool.vision_provider.analyze_image.await_count == 2
+        assert not (tmp_path / "cache").exists()
+
+    @pytest.mark.asyncio
+    async def test_repeated_analysis_served_from_cache(self, tmp_path, sample_image):
+        """Test identical content and request skips the API"""
+        tool = make_tool(tmp_path, cache_enabled=True)
+
+        first = await tool.execute(image_path=str(sample_image), analysis_type="ocr")
+        second = await tool.execute(image_path=str(sample_image), analysis_type="ocr")
+
+        assert tool.vision_provider.analyze_image.await_count == 1
+        assert second.success is True
+        assert second.output["description"] == first.output["description"]
+        assert second.metadata["cached"] is True
+        assert second.metadata["cost_usd"] == 0.0
+
+        # The hit reports no spend of its own; the original call's stays as it was
+        assert first.output["cost_usd"] == 0.01
+        assert first.output["tokens_used"] == 42
+        assert "cached" not in first.output
+        assert second.output["cost_usd"] == 0.0
+        assert second.output["tokens_used"] == 0
+        assert second.output["cached"] is True
+
+        # The on-disk entry is shared by new tool instances
+        other = make_tool(tmp_path, cache_enabled=True)
+        await other.execute(image_path=str(sample_image), analysis_type="ocr")
+        assert other.vision_provider.analyze_image.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_different_request_reuses_encoding(self, tmp_path, sample_image):
+        """Test a new question calls the API but does not decode again"""
+        tool = make_tool(tmp_path, cache_enabled=True)
+        tool.processor.load_image_bytes = Mock(wraps=tool.processor.load_image_bytes)
+
+        await tool.execute(image_path=str(sample_image))
+        await tool.execute(image_path=str(sample_image), question="What color is it?")
+
+        assert tool.vision_provider.analyze_image.await_count == 2
+        assert tool.processor.load_image_bytes.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_content_misses_cache(self, tmp_path, sample_image):
+        """Test the cache is keyed by content, not path"""
+        tool = make_tool(tmp_path, cache_enabled=True)
+
+        await tool.execute(image_path=str(sample_image))
+        save_image(sample_image, "red")
+        await tool.execute(image_path=str(sample_image))
+
+        assert tool.vision_provider.analyze_image.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refreshed(self, tmp_path, sample_image):
+        """Test an entry older than cache_max_age is ignored and rewritten"""
+        tool = make_tool(tmp_path, cache_enabled=True)
+        await tool.execute(image_path=str(sample_image))
+
+        (entry,) = (tmp_path / "cache").glob("*.json")
+        expired = time.time() - tool.cache_max_age - 60
+        os.utime(entry, (expired, expired))
+        await tool.execute(image_path=str(sample_image))
+
+        assert tool.vision_provider.analyze_image.await_count == 2
+        assert entry.stat().st_mtime > expired
+
+    @pytest.mark.asyncio
+    async def test_oldest_entries_evicted(self, tmp_path, sample_image):
+        """Test the on-disk cache keeps at most cache_max_entries analyses"""
+        tool = make_tool(tmp_path, cache_enabled=True)
+        tool.cache_max_entries = 2
+        cache_dir = tmp_path / "cache"
+        digest = hashlib.sha256(sample_image.read_bytes()).hexdigest()
+
+        for i, question in enumerate(["first?", "second?", "third?"]):
+            await tool.execute(image_path=str(sample_image), question=question)
+            # Give each new entry a distinct, increasing mtime
+            key = tool._response_cache_key([digest], "general", question)
+            stamp = time.time() - 100 + i
+            os.utime(cache_dir / f"{key}.json", (stamp, stamp))
+
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+        # The first question was evicted, the later ones are still cached
+        await tool.execute(image_path=str(sample_image), question="third?")
+        assert tool.vision_provider.analyze_image.await_count == 3
+        await tool.execute(image_path=str(sample_image), question="first?")
+        assert tool.vision_provider.analyze_image.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_io_runs_off_event_loop(self, tmp_path, sample_image, monkeypatch):
+        """Test cache reads and writes are done in worker threads"""
+        tool = make_tool(tmp_path, cache_enabled=True)
+        threads = []
+        read, write = tool._read_cached_response, tool._write_cached_response
+
+        def record(func):
+            def _wrapper(*args):
+                threads.append(threading.current_thread())
+                return func(*args)
+            return _wrapper
+
+        monkeypatch.setattr(tool, "_read_cached_response", record(read))
+        monkeypatch.setattr(tool, "_write_cached_response", record(write))
+
+        await tool.execute(image_path=str(sample_image))
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+
+class TestImagePreparation:
+    """Test per-image encoding"""
+
+    @pytest.mark.parametrize("filename,expected_format", [
+        ("photo.jpg", "JPEG"),
+        ("shot.png", "PNG"),
+        ("anim.gif", "GIF"),
+        ("pic.webp", "WEBP"),
+        ("scan.bmp", "PNG"),
+    ])
+    def test_media_type_matches_encoded_data(self, tmp_path, filename, expected_format):
+        """Test the declared media type is the format actually encoded"""
+        img_path = tmp_path / filename
+        save_image(img_path, "green", (40, 30))
+        tool = make_tool(tmp_path, cache_enabled=False)
+
+        base64_data, media_type, solid = tool._prepare_image(str(img_path), img_path.read_bytes())
+
+        decoded = Image.open(io.BytesIO(base64.b64decode(base64_data)))
+        assert decoded.format == expected_format
+        assert media_type == f"image/{expected_format.lower()}"
+        assert decoded.size == (40, 30)
+        assert solid is False
+
+
+class TestMultiImageAnalysis:
+    """Test how multiple images are sent to the vision provider"""
+
+    @pytest.fixture
+    def image_paths(self, tmp_path):
+        """Create two distinct test images"""
+        paths = []
+        for color in ("red", "green"):
+            path = tmp_path / f"{color}.png"
+            save_image(path, color, (30, 30))
+            paths.append(str(path))
+        return paths
+
+    @pytest.mark.asyncio
+    async def test_independent_analysis_fans_out(self, tmp_path, image_paths):
+        """Test each image gets its own request and results are combined"""
+        tool = make_tool(tmp_path, cache_enabled=False)
+        tool.vision_provider.analyze_image = AsyncMock(side_effect=[
+            VisionResponse(content="first", model="m", tokens_used=10,
+                           finish_reason="end_turn", cost_usd=0.01),
+            VisionResponse(content="second", model="m", tokens_used=20,
+                           finish_reason="end_turn", cost_usd=0.02),
+        ])
+        tool.vision_provider.analyze_images = AsyncMock()
+
+        result = await tool.execute(image_path=image_paths, analysis_type="ocr")
+
+        assert result.success is True
+        assert tool.vision_provider.analyze_image.await_count == 2
+        tool.vision_provider.analyze_images.assert_not_awaited()
+        assert result.output["extracted_text"] == "first\n\n---\n\nsecond"
+        assert result.output["tokens_used"] == 30
+        assert result.output["cost_usd"] == pytest.approx(0.03)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"analysis_type": "chart"},
+        {"analysis_type": "general", "question": "Which image is brighter?"},
+    ])
+    @pytest.mark.asyncio
+    async def test_comparative_analysis_uses_one_request(self, tmp_path, image_paths, kwargs):
+        """Test charts and questions still send all images together"""
+        tool = make_tool(tmp_path, cache_enabled=False)
+        tool.vision_provider.analyze_images = AsyncMock(
+            return_value=tool.vision_provider.analyze_image.return_value
+        )
+
+        result = await tool.execute(image_path=image_paths, **kwargs)
+
+        assert result.success is True
+        tool.vision_provider.analyze_images.assert_awaited_once()
+        tool.vision_provider.analyze_image.assert_not_awaited()
+
+
+class TestSolidColorFastPath:
+    """Test solid-color images are answered without the vision API"""
+
+    @pytest.mark.asyncio
+    async def test_solid_images_skip_api(self, tmp_path):
+        """Test blank images return a local result at no cost"""
+        paths = []
+        for i, color in enumerate(("white", "black")):
+            path = tmp_path / f"blank_{i}.png"
+            Image.new("RGB", (60, 40), color=color).save(path)
+            paths.append(str(path))
+        tool = make_tool(tmp_path, cache_enabled=False)
+
+        result = await tool.execute(image_path=paths, analysis_type="ocr")
+
+        tool.vision_provider.analyze_image.assert_not_awaited()
+        assert result.success is True
+        assert result.output["extracted_text"] == ""
+        assert result.output["cost_usd"] == 0.0
+        assert result.output["images_analyzed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_question_is_always_sent(self, tmp_path):
+        """Test a user question about a solid image still reaches the API"""
+        path = tmp_path / "blank.png"
+        Image.new("RGB", (60, 40), color="white").save(path)
+        tool = make_tool(tmp_path, cache_enabled=False)
+
+        await tool.execute(image_path=str(path), question="What color is this?")
+
+        tool.vision_provider.analyze_image.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_mixed_images_use_api(self, tmp_path, sample_image):
+        """Test the API is called unless every image is solid"""
+        blank = tmp_path / "blank.png"
+        Image.new("RGB", (60, 40), color="white").save(blank)
+        tool = make_tool(tmp_path, cache_enabled=False)
+        tool.vision_provider.analyze_images = AsyncMock(
+            return_value=tool.vision_provider.analyze_image.return_value
+        )
+
+        await tool.execute(image_path=[str(blank), str(sample_image)], analysis_type="chart")
+
+        tool.vision_provider.analyze_images.assert_awaited_once()
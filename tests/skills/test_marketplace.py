@@ -0,0 +1,282 @@
+"""
+Tests for Skill Marketplace
+
+Validates remote registry caching against a local HTTP server:
+- Concurrent searches share a single cache update
+- Cache TTL
+- Registry size and skill count limits
+- Streamed parsing of large registries
+"""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from alpha.skills import marketplace as marketplace_module
+from alpha.skills.marketplace import SkillMarketplace
+
+
+def make_registry(count, description="Remote skill"):
+    """Build a registry document with `count` skills."""
+    return {
+        "skills": [
+            {
+                "name": f"remote-skill-{i}",
+                "version": "1.0.0",
+                "description": description,
+                "author": "Test Author",
+                "category": "remote",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+class RegistryServer:
+    """Local HTTP server serving one registry body and counting requests."""
+
+    def __init__(self, body, delay=0.0, chunked=False):
+        self.body = body
+        self.delay = delay
+        self.chunked = chunked
+        self.hits = 0
+        self.url = None
+        self._runner = None
+
+    async def _handle(self, request):
+        self.hits += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        if not self.chunked:
+            return web.Response(body=self.body, content_type="application/json")
+
+        # No Content-Length: the size limit must be enforced while reading
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for start in range(0, len(self.body), 64 * 1024):
+            await response.write(self.body[start:start + 64 * 1024])
+        await response.write_eof()
+        return response
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/registry.json", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/registry.json"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+@pytest.fixture
+async def serve():
+    """Start registry servers for a test and stop them afterwards."""
+    servers = []
+
+    async def _serve(registry, **kwargs):
+        body = registry if isinstance(registry, bytes) else json.dumps(registry).encode()
+        server = RegistryServer(body, **kwargs)
+        await server.start()
+        servers.append(server)
+        return server
+
+    yield _serve
+
+    for server in servers:
+        await server.stop()
+
+
+def make_marketplace(tmp_path, server, **download):
+    """Create a marketplace whose only remote source is the test server."""
+    return SkillMarketplace(cache_dir=tmp_path, config={
+        "sources": [{"name": "Test", "url": server.url, "type": "api"}],
+        "download": download,
+    })
+
+
+# Shared cache updates
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_fetch_once(tmp_path, serve):
+    """Test concurrent searches on a cold cache share one registry fetch."""
+    server = await serve(make_registry(3), delay=0.05)
+    marketplace = make_marketplace(tmp_path, server)
+
+    results = await asyncio.gather(*(marketplace.search("remote") for _ in range(5)))
+
+    assert server.hits == 1
+    assert all(len(r) == 3 for r in results)
+    assert marketplace._update_task is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_search_does_not_abort_update(tmp_path, serve):
+    """Test cancelling the search that started an update leaves it running for others."""
+    server = await serve(make_registry(3), delay=0.05)
+    marketplace = make_marketplace(tmp_path, server)
+
+    first = asyncio.create_task(marketplace.search("remote"))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(marketplace.search("remote"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    results = await second
+
+    assert first.cancelled()
+    assert len(results) == 3
+    assert server.hits == 1
+
+
+# Cache TTL
+
+@pytest.mark.asyncio
+async def test_warm_cache_is_not_refetched(tmp_path, serve):
+    """Test searches within the TTL are served from the cache."""
+    server = await serve(make_registry(3))
+    marketplace = make_marketplace(tmp_path, server)
+
+    await marketplace.search("remote")
+    await marketplace.search("remote")
+    await marketplace.get_skill_info("missing-skill")
+
+    assert server.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_is_refetched(tmp_path, serve):
+    """Test the registry is fetched again once the TTL has passed."""
+    server = await serve(make_registry(3))
+    marketplace = make_marketplace(tmp_path, server)
+
+    await marketplace.search("remote")
+    marketplace._last_updated -= marketplace._cache_ttl + 1
+    await marketplace.search("remote")
+
+    assert server.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_cleared_cache_is_refetched(tmp_path, serve):
+    """Test clear_cache forces the next search to fetch."""
+    server = await serve(make_registry(3))
+    marketplace = make_marketplace(tmp_path, server)
+
+    await marketplace.search("remote")
+    marketplace.clear_cache()
+    results = await marketplace.search("remote")
+
+    assert server.hits == 2
+    assert len(results) == 3
+
+
+# Payload limits
+
+@pytest.mark.parametrize("chunked", [False, True])
+@pytest.mark.asyncio
+async def test_oversized_registry_rejected(tmp_path, serve, chunked):
+    """Test a registry body over max_registry_bytes is skipped, with or without Content-Length."""
+    server = await serve(make_registry(50), chunked=chunked)
+    marketplace = make_marketplace(tmp_path, server, max_registry_bytes=1024)
+
+    results = await marketplace.search("remote")
+
+    assert server.hits == 1
+    assert results == []
+    assert marketplace.metadata_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_registry_skill_count_capped(tmp_path, serve):
+    """Test only the first max_registry_skills entries are loaded."""
+    server = await serve(make_registry(10))
+    marketplace = make_marketplace(tmp_path, server, max_registry_skills=4)
+
+    await marketplace.search("remote")
+
+    assert sorted(marketplace.metadata_cache) == [f"remote-skill-{i}" for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_registry_field_lengths_capped(tmp_path, serve):
+    """Test overlong names are skipped and overlong descriptions truncated."""
+    registry = make_registry(1, description="x" * 10000)
+    registry["skills"].append({**registry["skills"][0], "name": "n" * 1000})
+    server = await serve(registry)
+    marketplace = make_marketplace(tmp_path, server)
+
+    await marketplace.search("remote")
+
+    assert list(marketplace.metadata_cache) == ["remote-skill-0"]
+    description = marketplace.metadata_cache["remote-skill-0"].description
+    assert len(description) == marketplace_module._MAX_DESCRIPTION_LENGTH
+
+
+# Streamed parsing
+
+@pytest.fixture
+def stream_spy(monkeypatch):
+    """Require ijson and record which registries took the streaming path."""
+    pytest.importorskip("ijson")
+    streamed = []
+    original = SkillMarketplace._stream_registry
+
+    async def _spy(self, response, source_name):
+        streamed.append(source_name)
+        await original(self, response, source_name)
+
+    monkeypatch.setattr(SkillMarketplace, "_stream_registry", _spy)
+    return streamed
+
+
+def large_registry(count):
+    """Build a registry whose body is above the stream-parse threshold."""
+    registry = make_registry(count, description="d" * 400)
+    body = json.dumps(registry).encode()
+    assert len(body) > marketplace_module._STREAM_PARSE_THRESHOLD
+    return body
+
+
+@pytest.mark.asyncio
+async def test_large_registry_is_streamed(tmp_path, serve, stream_spy):
+    """Test a registry above the threshold is parsed incrementally."""
+    server = await serve(large_registry(2000))
+    marketplace = make_marketplace(tmp_path, server)
+
+    results = await marketplace.search("remote-skill-1999")
+
+    assert stream_spy == ["Test"]
+    assert len(marketplace.metadata_cache) == 2000
+    assert [r.name for r in results] == ["remote-skill-1999"]
+
+
+@pytest.mark.asyncio
+async def test_small_registry_is_not_streamed(tmp_path, serve, stream_spy):
+    """Test a registry below the threshold is decoded in one piece."""
+    server = await serve(make_registry(3))
+    marketplace = make_marketplace(tmp_path, server)
+
+    await marketplace.search("remote")
+
+    assert stream_spy == []
+    assert len(marketplace.metadata_cache) == 3
+
+
+@pytest.mark.asyncio
+async def test_streamed_registry_skill_count_capped(tmp_path, serve, stream_spy):
+    """Test the skill count limit also applies while streaming."""
+    server = await serve(large_registry(2000))
+    marketplace = make_marketplace(tmp_path, server, max_registry_skills=100)
+
+    await marketplace.search("remote")
+
+    assert stream_spy == ["Test"]
+    assert len(marketplace.metadata_cache) == 100
@@ -60,6 +60,13 @@ async def test_record_execution_success(tracker):
     assert stats.success_rate == 1.0
 
 
+@pytest.mark.asyncio
+async def test_execution_ids_are_unique(tracker):
+    """Test that back-to-back executions get distinct IDs."""
+    exec_ids = {await tracker.record_execution("id_skill", True, 0.1) for _ in range(5)}
+    assert len(exec_ids) == 5
+
+
 @pytest.mark.asyncio
 async def test_record_execution_failure(tracker):
     """Test recording failed execution."""
@@ -185,6 +192,18 @@ async def test_trend_analysis_degrading(tracker):
     assert stats.recent_success_rate < stats.success_rate
 
 
+@pytest.mark.asyncio
+async def test_trend_window_is_per_skill(tracker):
+    """Test that other skills' executions don't push a skill out of its trend window."""
+    for i in range(10):
+        await tracker.record_execution("windowed", i < 3, 1.0)
+        for _ in range(10):
+            await tracker.record_execution("noisy", True, 1.0)
+
+    stats = tracker.stats_cache["windowed"]
+    assert stats.recent_success_rate == pytest.approx(0.3)
+
+
 @pytest.mark.asyncio
 async def test_recent_errors_count(tracker):
     """Test counting recent errors."""
@@ -233,6 +252,16 @@ async def test_skill_gap_deduplication(tracker):
     assert gap.failure_count == 2
 
 
+@pytest.mark.asyncio
+async def test_distinct_skill_gaps_get_distinct_ids(tracker):
+    """Test that different gaps recorded back to back don't share an ID."""
+    gap_id_1 = await tracker.record_skill_gap("Task 1", "capability_a")
+    gap_id_2 = await tracker.record_skill_gap("Task 2", "capability_b")
+
+    assert gap_id_1 != gap_id_2
+    assert len(tracker.skill_gaps) == 2
+
+
 @pytest.mark.asyncio
 async def test_get_top_performers(tracker):
     """Test getting top performing skills."""
@@ -294,6 +323,46 @@ async def test_performance_summary(tracker):
     assert "total_cost" in summary
 
 
+@pytest.mark.asyncio
+async def test_performance_summary_after_reload(learning_store, tmp_path):
+    """Test summary totals include stats loaded from disk."""
+    data_dir = tmp_path / "summary_reload"
+    tracker = PerformanceTracker(learning_store, data_dir=data_dir)
+    await tracker.record_execution("skill1", True, 1.0, cost_estimate=0.01)
+    await tracker.record_execution("skill1", False, 1.0, cost_estimate=0.03)
+    await tracker.cleanup()
+
+    tracker2 = PerformanceTracker(learning_store, data_dir=data_dir)
+    await tracker2.record_execution("skill2", True, 1.0)
+    summary = await tracker2.get_performance_summary()
+
+    assert summary["total_executions"] == 3
+    assert summary["overall_success_rate"] == pytest.approx(2 / 3)
+    assert summary["total_cost"] == pytest.approx(0.04)
+
+    await tracker2.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_metrics_batched_to_store(learning_store, tmp_path):
+    """Test execution metrics are buffered and stats writes coalesced per skill."""
+    tracker = PerformanceTracker(learning_store, data_dir=tmp_path / "batch_test")
+
+    for _ in range(5):
+        await tracker.record_execution("batch_skill", True, 1.0)
+
+    # Nothing written until the flusher runs
+    assert learning_store.get_metrics(metric_type="skill_execution") == []
+
+    await tracker.cleanup()
+
+    executions = learning_store.get_metrics(metric_type="skill_execution")
+    stats = learning_store.get_metrics(metric_type="skill_performance")
+    assert len(executions) == 5
+    assert len(stats) == 1
+    assert stats[0]["metadata"]["total_executions"] == 5
+
+
 @pytest.mark.asyncio
 async def test_stats_persistence(learning_store, tmp_path):
     """Test stats are persisted to database."""
@@ -314,5 +383,22 @@ async def test_stats_persistence(learning_store, tmp_path):
     await tracker2.cleanup()
 
 
+@pytest.mark.asyncio
+async def test_load_stats_with_infinite_min_time(learning_store, tmp_path):
+    """Test loading a stats file whose unset minimum time was written as Infinity."""
+    data_dir = tmp_path / "legacy_stats"
+    data_dir.mkdir()
+    (data_dir / "performance_stats.json").write_text(
+        '{"legacy_skill": {"skill_id": "legacy_skill", "total_executions": 0, '
+        '"min_execution_time": Infinity, "first_used": null, "last_used": null}}'
+    )
+
+    tracker = PerformanceTracker(learning_store, data_dir=data_dir)
+
+    stats = tracker.stats_cache["legacy_skill"]
+    assert stats.min_execution_time == float('inf')
+    assert stats.first_used is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -216,6 +216,16 @@ async def test_skill_marketplace():
     assert skill_info.name == "test-skill-1"
     print("✓ Marketplace skill info retrieval works")
 
+    # Test source management (string sources are normalized, duplicates ignored)
+    source_count = len(marketplace.sources)
+    marketplace.add_source("https://github.com/test/registry")
+    marketplace.add_source("https://github.com/test/registry")
+    assert len(marketplace.sources) == source_count + 1
+    assert marketplace.sources[-1]["type"] == "github"
+    marketplace.remove_source("https://github.com/test/registry")
+    assert len(marketplace.sources) == source_count
+    print("✓ Marketplace source management works")
+
     print()
 
 
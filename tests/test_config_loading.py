@@ -0,0 +1,168 @@
+"""
+Tests for configuration loading: memoized YAML parsing, ${VAR} resolution,
+and provider config construction.
+"""
+
+import dataclasses
+import os
+
+import pytest
+
+from alpha.utils.config import _parse_config_file, _resolve_env_ref, load_config
+
+
+CONFIG_TEMPLATE = """
+alpha:
+  name: Alpha
+llm:
+  default_provider: test
+  providers:
+    test:
+      api_key: "{api_key}"
+      model: test-model
+{extra}
+memory:
+  database: data/test.db
+tools:
+  enabled: [shell]
+"""
+
+
+def write_config(path, api_key="${TEST_ALPHA_KEY}", extra=""):
+    """Write a minimal config file and return its path as a string."""
+    path.write_text(CONFIG_TEMPLATE.format(api_key=api_key, extra=extra))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def fresh_parse_cache():
+    """Start each test with an empty parse cache."""
+    _parse_config_file.cache_clear()
+    yield
+    _parse_config_file.cache_clear()
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Path of a config whose api_key comes from TEST_ALPHA_KEY."""
+    return write_config(tmp_path / "config.yaml")
+
+
+class TestParseCache:
+    """Test the parsed YAML is reused until the file changes"""
+
+    def test_unchanged_file_is_parsed_once(self, config_path):
+        load_config(config_path)
+        load_config(config_path)
+
+        info = _parse_config_file.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_modified_file_is_parsed_again(self, tmp_path, config_path, monkeypatch):
+        monkeypatch.setenv("TEST_ALPHA_KEY", "key")
+        assert load_config(config_path).llm.providers["test"].model == "test-model"
+
+        path = tmp_path / "config.yaml"
+        path.write_text(path.read_text().replace("test-model", "other-model"))
+        # Make the new mtime distinct even on coarse-grained file systems
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_config(config_path).llm.providers["test"].model == "other-model"
+        assert _parse_config_file.cache_info().misses == 2
+
+    def test_environment_read_on_cache_hit(self, config_path, monkeypatch):
+        monkeypatch.setenv("TEST_ALPHA_KEY", "first")
+        assert load_config(config_path).llm.providers["test"].api_key == "first"
+
+        monkeypatch.setenv("TEST_ALPHA_KEY", "second")
+        assert load_config(config_path).llm.providers["test"].api_key == "second"
+        assert _parse_config_file.cache_info().hits == 1
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_config(str(tmp_path / "missing.yaml"))
+
+
+class TestEnvReferences:
+    """Test ${VAR} and ${VAR:-fallback} resolution"""
+
+    @pytest.fixture(autouse=True)
+    def environment(self, monkeypatch):
+        monkeypatch.setenv("TEST_ALPHA_SET", "set-value")
+        monkeypatch.setenv("TEST_ALPHA_OTHER", "other-value")
+        monkeypatch.setenv("TEST_ALPHA_EMPTY", "")
+        monkeypatch.delenv("TEST_ALPHA_UNSET", raising=False)
+
+    @pytest.mark.parametrize("value,expected", [
+        ("${TEST_ALPHA_SET}", "set-value"),
+        ("${TEST_ALPHA_UNSET}", ""),
+        ("${TEST_ALPHA_SET:-literal}", "set-value"),
+        ("${TEST_ALPHA_UNSET:-literal}", "literal"),
+        ("${TEST_ALPHA_EMPTY:-literal}", "literal"),
+        # A bare fallback is tried as a variable name first
+        ("${TEST_ALPHA_UNSET:-TEST_ALPHA_OTHER}", "other-value"),
+        ("${TEST_ALPHA_UNSET:-${TEST_ALPHA_OTHER}}", "other-value"),
+        ("${TEST_ALPHA_UNSET:-${TEST_ALPHA_UNSET:-literal}}", "literal"),
+        ("${TEST_ALPHA_UNSET:-${TEST_ALPHA_UNSET}}", ""),
+        # Only whole-string references are substituted
+        ("prefix-${TEST_ALPHA_SET}", "prefix-${TEST_ALPHA_SET}"),
+        ("plain", "plain"),
+    ])
+    def test_resolve(self, value, expected):
+        assert _resolve_env_ref(value) == expected
+
+    def test_nested_values_resolved(self, tmp_path):
+        path = write_config(
+            tmp_path / "config.yaml",
+            api_key="${TEST_ALPHA_UNSET:-${TEST_ALPHA_SET}}",
+            extra='      base_url: "${TEST_ALPHA_OTHER}"',
+        )
+
+        provider = load_config(path).llm.providers["test"]
+
+        assert provider.api_key == "set-value"
+        assert provider.base_url == "other-value"
+
+
+class TestProviderConfig:
+    """Test provider configs are built from known fields only"""
+
+    def test_unknown_provider_key_ignored(self, tmp_path):
+        path = write_config(
+            tmp_path / "config.yaml", api_key="key", extra="      organization: acme"
+        )
+
+        provider = load_config(path).llm.providers["test"]
+
+        assert provider.api_key == "key"
+        assert not hasattr(provider, "organization")
+
+    def test_missing_api_key_raises(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        write_config(path, api_key="unused")
+        path.write_text(path.read_text().replace('      api_key: "unused"\n', ""))
+
+        with pytest.raises(KeyError, match="api_key"):
+            load_config(str(path))
+
+    def test_models_parsed(self, tmp_path):
+        path = write_config(tmp_path / "config.yaml", api_key="key", extra=(
+            "      models:\n"
+            "        fast:\n"
+            "          max_tokens: 1024\n"
+            "          difficulty_range: [simple, medium]"
+        ))
+
+        model = load_config(path).llm.providers["test"].models["fast"]
+
+        assert model.max_tokens == 1024
+        assert model.temperature == 0.7
+        assert model.difficulty_range == ("simple", "medium")
+
+    def test_configs_are_frozen(self, tmp_path):
+        config = load_config(write_config(tmp_path / "config.yaml", api_key="key"))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.llm.providers["test"].api_key = "changed"
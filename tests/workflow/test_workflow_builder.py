@@ -273,3 +273,12 @@ def test_build_trigger(builder):
 
     assert trigger.type == TriggerType.SCHEDULE
     assert trigger.config["cron"] == "0 */2 * * *"
+
+
+def test_build_parameter_and_trigger_default_types(builder):
+    """Test parameters default to string and triggers to manual when untyped"""
+    param = builder._build_parameter({"name": "env"})
+    trigger = builder._build_trigger({"config": {}})
+
+    assert param.type == ParameterType.STRING
+    assert trigger.type == TriggerType.MANUAL
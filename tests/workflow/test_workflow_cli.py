@@ -0,0 +1,142 @@
+"""
+Unit tests for workflow CLI commands
+"""
+
+import io
+import pytest
+from unittest.mock import AsyncMock, Mock
+from rich.console import Console
+
+from alpha.workflow.cli import WorkflowCLI, _parse_parameter_value
+from alpha.workflow.definition import WorkflowDefinition, WorkflowStep
+
+
+@pytest.fixture
+def cli():
+    """Create WorkflowCLI with mock components and a captured console"""
+    console = Console(file=io.StringIO(), width=100)
+    return WorkflowCLI(
+        library=Mock(), executor=Mock(), builder=Mock(), console=console
+    )
+
+
+def output(cli):
+    """Return everything the CLI printed"""
+    return cli.console.file.getvalue()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("3", 3),
+        ("-3", -3),
+        ("1.5", 1.5),
+        ("-.5", -0.5),
+        ("1.", 1.0),
+        ("1e5", 1e5),
+        ("2.5E-2", 0.025),
+        ("true", True),
+        ("False", False),
+        ("staging", "staging"),
+        ("1.2.3", "1.2.3"),
+        ("nan", "nan"),
+        ("inf", "inf"),
+        ("1_000", "1_000"),
+        ("²", "²"),
+        ("-", "-"),
+        ("", ""),
+    ],
+)
+def test_parse_parameter_value(value, expected):
+    """Test command-line parameter values are typed"""
+    result = _parse_parameter_value(value)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "command,handler,args",
+    [
+        ("list", "list_workflows", ""),
+        ("list --tags a,b", "list_workflows", "--tags a,b"),
+        ("  SHOW   Deploy Pipeline ", "show_workflow", "Deploy Pipeline"),
+        ("run deploy env=staging", "run_workflow", "deploy env=staging"),
+        ("export deploy out.json", "export_workflow", "deploy out.json"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_handle_command_dispatch(cli, command, handler, args):
+    """Test subcommands reach their handler with the remaining arguments"""
+    mock_handler = AsyncMock()
+    setattr(cli, handler, mock_handler)
+
+    assert await cli.handle_command(command) is True
+
+    mock_handler.assert_awaited_once_with(args)
+
+
+@pytest.mark.parametrize("command", ["", "   ", "help"])
+@pytest.mark.asyncio
+async def test_handle_command_help(cli, command):
+    """Test an empty command or help shows the help panel"""
+    assert await cli.handle_command(command) is True
+
+    assert "Workflow Commands" in output(cli)
+
+
+@pytest.mark.asyncio
+async def test_handle_command_unknown(cli):
+    """Test an unknown subcommand is reported and help is shown"""
+    assert await cli.handle_command("frobnicate now") is True
+
+    text = output(cli)
+    assert "Unknown workflow command: frobnicate" in text
+    assert "Workflow Commands" in text
+
+
+@pytest.mark.parametrize(
+    "args,name,file_path",
+    [
+        ("deploy", "deploy", "deploy.json"),
+        ("deploy out.json", "deploy", "out.json"),
+        ("deploy  my exports/deploy.yaml ", "deploy", "my exports/deploy.yaml"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_export_workflow_arguments(cli, args, name, file_path):
+    """Test export takes the name, then everything after it as the path"""
+    cli.library.export_workflow.return_value = True
+
+    await cli.export_workflow(args)
+
+    cli.library.export_workflow.assert_called_once_with(name, file_path)
+
+
+@pytest.mark.asyncio
+async def test_export_workflow_requires_name(cli):
+    """Test export without a name is an error"""
+    await cli.export_workflow("")
+
+    cli.library.export_workflow.assert_not_called()
+    assert "Workflow name required" in output(cli)
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_typed_parameters(cli):
+    """Test run passes typed key=value parameters to the executor"""
+    workflow = WorkflowDefinition(
+        name="deploy",
+        version="1.0.0",
+        steps=[WorkflowStep(id="step1", tool="test", action="run")],
+    )
+    cli.library.get.return_value = workflow
+    cli.executor.execute = AsyncMock(
+        return_value=Mock(status="completed", duration=0.1, step_results={})
+    )
+
+    await cli.run_workflow("deploy retries=3 ratio=-0.5 dry_run=true note ignored")
+
+    cli.executor.execute.assert_awaited_once_with(
+        workflow, {"retries": 3, "ratio": -0.5, "dry_run": True}
+    )
@@ -2,6 +2,7 @@
 Unit tests for workflow definition module
 """
 
+import sys
 import pytest
 from datetime import datetime
 
@@ -162,6 +163,28 @@ def test_workflow_definition_with_steps():
     assert workflow.get_step("step1").tool == "shell"
 
 
+def test_workflow_lookups_follow_list_changes():
+    """Test parameter and step lookups see parameters and steps changed in place"""
+    workflow = WorkflowDefinition(
+        name="Lookup Workflow",
+        version="1.0.0",
+        parameters=[WorkflowParameter(name="env", type=ParameterType.STRING)],
+        steps=[WorkflowStep(id="step1", tool="shell", action="execute")],
+    )
+
+    assert workflow.get_parameter("env").name == "env"
+    assert workflow.get_parameter("branch") is None
+
+    workflow.parameters.insert(
+        0, WorkflowParameter(name="branch", type=ParameterType.STRING)
+    )
+    workflow.steps[0] = WorkflowStep(id="step1", tool="git", action="pull")
+
+    assert workflow.get_parameter("branch").name == "branch"
+    assert workflow.get_parameter("env").name == "env"
+    assert workflow.get_step("step1").tool == "git"
+
+
 def test_workflow_validation_valid():
     """Test workflow validation for valid workflow"""
     workflow = WorkflowDefinition(
@@ -258,6 +281,30 @@ def test_workflow_validation_circular_dependency():
     assert any("circular" in err.lower() for err in errors)
 
 
+def test_workflow_validation_output_references():
+    """Test outputs must reference existing steps"""
+    steps = [WorkflowStep(id="step1", tool="test", action="run", parameters={})]
+
+    workflow = WorkflowDefinition(
+        name="Outputs",
+        version="1.0.0",
+        steps=steps,
+        outputs={
+            "ok": "{{step1.result}}",
+            "spaced": "{{ step1.result }}",
+            "variable": "{{query}}",
+            "literal": "done",
+        },
+    )
+    assert workflow.validate() == (True, [])
+
+    workflow.outputs["missing"] = "{{ step2.result }}"
+    is_valid, errors = workflow.validate()
+
+    assert is_valid is False
+    assert errors == ["Output 'missing' references non-existent step 'step2'"]
+
+
 def test_workflow_to_dict():
     """Test workflow serialization to dictionary"""
     workflow = WorkflowDefinition(
@@ -277,6 +324,26 @@ def test_workflow_to_dict():
     assert "created_at" in workflow_dict
 
 
+def test_workflow_to_dict_repeated_wall_time():
+    """Test timestamps in a repeated DST hour keep their own UTC offsets"""
+    zoneinfo = pytest.importorskip("zoneinfo")
+    try:
+        tz = zoneinfo.ZoneInfo("America/New_York")
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip("time zone data not available")
+
+    first = datetime(2025, 11, 2, 1, 30, tzinfo=tz)
+    second = datetime(2025, 11, 2, 1, 30, fold=1, tzinfo=tz)
+    workflow = WorkflowDefinition(
+        name="DST", version="1.0.0", created_at=first, updated_at=second
+    )
+
+    workflow_dict = workflow.to_dict()
+
+    assert workflow_dict["created_at"] == "2025-11-02T01:30:00-04:00"
+    assert workflow_dict["updated_at"] == "2025-11-02T01:30:00-05:00"
+
+
 def test_workflow_from_dict():
     """Test workflow deserialization from dictionary"""
     workflow_dict = {
@@ -333,6 +400,47 @@ def test_workflow_get_independent_steps():
     assert execution_order[1] == ["step3"]
 
 
+def test_workflow_independent_steps_follow_dependency_changes():
+    """Test cached execution order is recomputed when dependencies change"""
+    steps = [
+        WorkflowStep(id="step1", tool="test", action="run", parameters={}),
+        WorkflowStep(id="step2", tool="test", action="run", parameters={}),
+    ]
+    workflow = WorkflowDefinition(name="Changing Steps", version="1.0.0", steps=steps)
+
+    assert workflow.get_independent_steps() == [["step1", "step2"]]
+
+    steps[1].depends_on.append("step1")
+    assert workflow.get_independent_steps() == [["step1"], ["step2"]]
+
+    steps[0].depends_on.append("step2")
+    assert workflow.get_independent_steps() == []
+    is_valid, errors = workflow.validate()
+    assert any("circular" in err.lower() for err in errors)
+
+
+def test_workflow_deep_dependency_chain():
+    """Test dependency chains deeper than the recursion limit are handled"""
+    depth = sys.getrecursionlimit() + 500
+    steps = [WorkflowStep(id="step0", tool="test", action="run", parameters={})]
+    for i in range(1, depth):
+        steps.append(
+            WorkflowStep(
+                id=f"step{i}",
+                tool="test",
+                action="run",
+                parameters={},
+                depends_on=[f"step{i - 1}"],
+            )
+        )
+    workflow = WorkflowDefinition(name="Deep Chain", version="1.0.0", steps=steps)
+
+    is_valid, errors = workflow.validate()
+
+    assert is_valid, errors
+    assert len(workflow.get_independent_steps()) == depth
+
+
 def test_retry_config():
     """Test RetryConfig"""
     retry = RetryConfig(
@@ -163,6 +163,24 @@ def test_list_workflows_with_search(library):
     assert results[0].name == "Email Workflow"
 
 
+def test_iter_list_workflows(library):
+    """Test iterating workflows lazily with the same filters as list"""
+    for i in range(3):
+        workflow = WorkflowDefinition(
+            name=f"Workflow {i}",
+            version="1.0.0",
+            tags=["even"] if i % 2 == 0 else [],
+            steps=[WorkflowStep(id="step1", tool="test", action="run", parameters={})],
+        )
+        library.save(workflow)
+
+    workflows = library.iter_list(tags=["even"])
+
+    assert not isinstance(workflows, list)
+    assert sorted(w.name for w in workflows) == ["Workflow 0", "Workflow 2"]
+    assert [w.name for w in library.iter_list(limit=1)] == [library.list()[0].name]
+
+
 def test_delete_workflow(library, sample_workflow):
     """Test deleting workflow"""
     library.save(sample_workflow)
@@ -258,6 +276,23 @@ def test_import_workflow_json(library, sample_workflow, temp_db):
     assert library.exists("Test Workflow")
 
 
+def test_non_finite_default_round_trip(library):
+    """Test definitions the stdlib encoder wrote with Infinity still load"""
+    workflow = WorkflowDefinition(
+        name="Limit Workflow",
+        version="1.0.0",
+        parameters=[
+            WorkflowParameter(name="limit", type=ParameterType.FLOAT, default=float("inf"))
+        ],
+        steps=[WorkflowStep(id="step1", tool="test", action="run", parameters={})],
+    )
+    library.save(workflow)
+
+    retrieved = library.get("Limit Workflow")
+
+    assert retrieved.parameters[0].default == float("inf")
+
+
 def test_log_execution(library, sample_workflow):
     """Test logging workflow execution"""
     from datetime import datetime